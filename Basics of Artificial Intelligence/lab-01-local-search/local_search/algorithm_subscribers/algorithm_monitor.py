@@ -1,6 +1,7 @@
+import threading
 import time
 from dataclasses import asdict, dataclass
-from typing import Union
+from typing import Callable, Dict, List, Tuple, Union
 
 from local_search.algorithm_subscribers.algorithm_subscriber import \
     AlgorithmSubscriber
@@ -42,15 +43,46 @@ class AlgorithmStatistics:
     def from_dict(data) -> 'AlgorithmStatistics':
         return AlgorithmStatistics(**data)
 
+    @staticmethod
+    def merge(statistics: List['AlgorithmStatistics']) -> 'AlgorithmStatistics':
+        """
+        Merges statistics of trajectories run in parallel. Counts are summed, time until optimum found
+        is taken from the first statistics, which should belong to the trajectory that found the best state.
+        """
+        return AlgorithmStatistics(
+            algorithm_name=statistics[0].algorithm_name,
+            local_optimum_escapes_count=sum(s.local_optimum_escapes_count for s in statistics),
+            best_states_update_count=sum(s.best_states_update_count for s in statistics),
+            explored_states_count=sum(s.explored_states_count for s in statistics),
+            time_untill_optimum_found=statistics[0].time_untill_optimum_found,
+        )
+
 
 @dataclass
 class Event:
     name: str
-    message: str
+    message: Callable[[], str]
+
+
+@dataclass
+class Snapshot:
+    """
+    Everything the display shows, taken on the search thread, so the refreshing thread never touches the states
+    """
+    stats: Dict[str, Union[int, float, str, None]]
+    objectives: Dict[str, Union[int, float]]
+    descriptions: Dict[str, str]
+    event: Union[Tuple[str, str], None]
 
 
 class AlgorithmMonitor(AlgorithmSubscriber):
-    delay_time = .001
+    """
+    Collects statistics of the algorithm. The hooks only update counters and remember states,
+    the display (if enabled) is rendered by a background thread `refresh_rate` times per second.
+    States are evaluated and described only on the search thread, at most `refresh_rate` times per second,
+    and handed over to the background thread as a Snapshot.
+    """
+    refresh_rate = 4
 
     def __init__(self, solver_config: SolverConfig, **kwargs):
         super().__init__(**kwargs)
@@ -65,7 +97,8 @@ class AlgorithmMonitor(AlgorithmSubscriber):
             LOCAL_OPTIMUM_ESCAPES_COUNT: 0,
             BEST_STATE_HUMAN: None,
             ITERS_FROM_LAST_STATE_CHANGE: 0,
-            EXPLORED_STATES_COUNT: 0
+            EXPLORED_STATES_COUNT: 0,
+            ACTIVE_TIME: 0.0
         }
 
         self._states = {
@@ -76,6 +109,10 @@ class AlgorithmMonitor(AlgorithmSubscriber):
         }
         self._start_time = time.monotonic()
         self._last_event = None
+        self._snapshot: Union[Snapshot, None] = None
+        self._last_snapshot_time = 0.0
+        self._stop_refreshing = threading.Event()
+        self._refresher = None
 
     @property
     def statistics(self):
@@ -88,55 +125,97 @@ class AlgorithmMonitor(AlgorithmSubscriber):
         )
 
     def on_next_state(self, model: Problem, state: State):
-        self._update_info(model, state)
-        self._update_live_display(self._create_layout(model))
-        time.sleep(self.delay_time)
-
-    def _update_info(self, model: Problem, state: State):
-        self._update_states(model, state)
-        self._update_stats({
-            ITERS_FROM_LAST_STATE_CHANGE: self.algorithm.steps_from_last_state_update,
-            ACTIVE_TIME: round(time.monotonic() - self._start_time, 2),
-            EXPLORED_STATES_COUNT: self._stats[EXPLORED_STATES_COUNT] + 1
-        })
-
-    def _update_states(self, model: Problem, state: State):
+        self._stats[EXPLORED_STATES_COUNT] += 1
         self._states[PREV_STATE] = self._states[CURR_STATE]
         self._states[CURR_STATE] = state
-        if self._states[BEST_STATE] != self.algorithm.best_state:
+        # algorithm replaces the best state only when it finds a better one
+        if self._states[BEST_STATE] is not self.algorithm.best_state:
             self._states[BEST_STATE] = self.algorithm.best_state
             self._stats[BEST_STATES_UPDATE_COUNT] += 1
-            self._stats[BEST_STATE_HUMAN] = model.goal.human_readable_objective_for(
-                self.algorithm.best_state)
             self._stats[TIME_UNTILL_OPTIMUM_FOUND] = round(
                 time.monotonic() - self._start_time, 2)
+        if self._solver_config.show_statistics:
+            if time.monotonic() - self._last_snapshot_time >= 1 / self.refresh_rate:
+                self._take_snapshot(model)
+            if self._refresher is None:
+                self._start_refreshing()
+
+    def _start_refreshing(self):
+        def refresh():
+            while not self._stop_refreshing.wait(1 / self.refresh_rate):
+                self._refresh()
+
+        self._refresher = threading.Thread(target=refresh, daemon=True)
+        self._refresher.start()
+
+    def _take_snapshot(self, model: Problem):
+        """
+        Samples statistics of the algorithm and evaluates the remembered states, has to be called on the search thread
+        """
+        best_state = self._states[BEST_STATE]
+        self._update_stats({
+            ITERS_FROM_LAST_STATE_CHANGE: self.algorithm.steps_from_last_state_update,
+            BEST_STATE_HUMAN: None if best_state is None else model.goal.human_readable_objective_for(best_state)
+        })
+        states = {name: state for name, state in self._states.items() if state is not None}
+        event = self._last_event
+        self._last_snapshot_time = time.monotonic()
+        self._snapshot = Snapshot(
+            stats=dict(self._stats),
+            objectives={name: model.objective_for(state) for name, state in states.items()},
+            descriptions={name: str(state) for name, state in states.items()},
+            event=None if event is None else (event.name, event.message())
+        )
+
+    def _refresh(self):
+        """
+        Redraws the display from the last snapshot
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return
+        self._update_live_display(self._create_layout(snapshot))
+
+    def stop(self, model: Problem = None):
+        """
+        Stops refreshing the display, draws it for the last time if model is passed
+        """
+        if self._refresher is not None:
+            self._stop_refreshing.set()
+            self._refresher.join()
+            self._refresher = None
+        if model is not None and self._solver_config.show_statistics:
+            self._take_snapshot(model)
+            self._refresh()
+        self._live.stop()
 
     def _update_stats(self, new_stats):
-        self._stats = {**self._stats, **new_stats}
+        self._stats.update(new_stats)
 
     def _update_live_display(self, layout: Layout):
         self._live.update(layout, refresh=True)
 
-    def _create_layout(self, model: Problem) -> Layout:
+    def _create_layout(self, snapshot: Snapshot) -> Layout:
         layout = Layout()
         layout.split_row(
             Layout(name="stats"),
-            Layout(name="state", renderable=self._create_state_column())
+            Layout(name="state", renderable=self._create_state_column(snapshot))
         )
         layout["stats"].split_column(
-            self._create_stats_table(model),
-            self._create_event_description()
+            self._create_stats_table(snapshot),
+            self._create_event_description(snapshot)
         )
         return layout
 
-    def _create_stats_table(self, model: Problem):
+    def _create_stats_table(self, snapshot: Snapshot):
         rows = {}
 
         def format_stat_name(stat_name):
             stat_name = stat_name.capitalize().replace('_', ' ')
             return f'[cyan]{stat_name}[/cyan]'
 
-        for stat_name, value in self._stats.items():
+        stats = {**snapshot.stats, ACTIVE_TIME: round(time.monotonic() - self._start_time, 2)}
+        for stat_name, value in stats.items():
             rows[format_stat_name(stat_name)] = value
 
         pad_time = len(str(self._solver_config.time_limit))
@@ -149,13 +228,10 @@ class AlgorithmMonitor(AlgorithmSubscriber):
             state_name = f'{state_name.capitalize().replace("_", " ")} objective: '
             return f'[blue_violet]{state_name}[/blue_violet]'
 
-        for state_name, state in self._states.items():
-            if state is None:
-                continue
-            value = model.objective_for(state)
+        for state_name, value in snapshot.objectives.items():
             rows[format_state_name(state_name)] = value
 
-        progress_bar = self._create_progress_bar()
+        progress_bar = self._create_progress_bar(snapshot)
 
         rows = list(map(lambda item: f'{item[0]}: {item[1]}', rows.items()))
         panel = Panel(
@@ -165,45 +241,42 @@ class AlgorithmMonitor(AlgorithmSubscriber):
             height=20)
         return panel
 
-    def _create_event_description(self):
-        if self._last_event is None:
+    def _create_event_description(self, snapshot: Snapshot):
+        if snapshot.event is None:
             return Panel(
                 '',
                 title='Last events',
                 box=box.ASCII,
             )
+        name, message = snapshot.event
         return Panel(
-            self._last_event.message,
-            title=self._last_event.name,
+            message,
+            title=name,
             box=box.ASCII,
         )
 
-    def _create_progress_bar(self):
-        completed = max(self._stats[ITERS_FROM_LAST_STATE_CHANGE] - 1, 0)
+    def _create_progress_bar(self, snapshot: Snapshot):
+        completed = max(snapshot.stats[ITERS_FROM_LAST_STATE_CHANGE] - 1, 0)
         left = self.algorithm.config.local_optimum_moves_threshold - completed
         completed_bar = f'[cyan]{"#" * completed}[/cyan]'
         arrow = '[cyan3]>[/cyan3]'
         left_bar = "-" * left
         return f'Optimum detected: [{completed_bar}{arrow}{left_bar}]'
 
-    def _create_state_column(self) -> Layout:
+    def _create_state_column(self, snapshot: Snapshot) -> Layout:
         layout = Layout()
         layout.split_column(
-            *[Panel(str(state), title=name.capitalize().replace("_", " "), box=box.ASCII, height=5)
-              for name, state in self._states.items()
-              if state is not None]
+            *[Panel(description, title=name.capitalize().replace("_", " "), box=box.ASCII, height=5)
+              for name, description in snapshot.descriptions.items()]
         )
         return layout
 
     def on_local_optimum_escape(self, model: Problem, from_state: State, to_state: Union[State, None]) -> None:
-        self._update_stats({
-            LOCAL_OPTIMUM_ESCAPES_COUNT: self._stats[LOCAL_OPTIMUM_ESCAPES_COUNT] + 1
-        })
+        self._stats[LOCAL_OPTIMUM_ESCAPES_COUNT] += 1
         self._update_last_event(Event(
             name='Algorithm escaped local optimum',
-            message=f'Escaped from state {from_state} to state {to_state}'
+            message=lambda: f'Escaped from state {from_state} to state {to_state}'
         ))
-        self._update_live_display(self._create_layout(model))
 
     def _update_last_event(self, event: Event):
         self._last_event = event
@@ -211,10 +284,9 @@ class AlgorithmMonitor(AlgorithmSubscriber):
     def on_solution(self, model: Problem, solution: State):
         self._update_last_event(Event(
             name='Solution found',
-            message=f'Found solution for problem: {solution}'
+            message=lambda: f'Found solution for problem: {solution}'
         ))
-        self._update_live_display(self._create_layout(model))
-        self._live.stop()
+        self.stop(model)
 
     def __del__(self):
         self._live.stop()
@@ -5,7 +5,11 @@ from local_search.problems import Problem, State
 class AlgorithmSubscriber:
     """
     Allows to subscribe to algorithm updates.
+
+    Neighbours are created only for scoring when they are needed, so subscribers,
+    which want to receive them in `on_next_neighbour`, have to set `tracks_neighbours`.
     """
+    tracks_neighbours: bool = False
 
     def __init__(self):
         self.__algorithm = None
@@ -75,7 +75,7 @@ class GraphColoringStateDrawer(StateDrawer):
         for i in range(len(self.coords)):
             x, y = self._scale(self.coords[i], screen, extremes)
             pygame.draw.circle(
-                screen, colors[state.coloring[i].color], (x, y), 10)
+                screen, colors[state.coloring[i]], (x, y), 10)
             pygame.draw.circle(screen, (0, 0, 0), (x, y), 10, 2)
 
     def _get_colors(self, model: GraphColoringProblem):
@@ -45,6 +45,7 @@ class VisualizationSubscriber(AlgorithmSubscriber):
     Provides visualization to algorithm solutions.
     """
     visualizations: Dict[Type[Problem], Type['VisualizationSubscriber']] = {}
+    tracks_neighbours = True
     _BG_COLOR = (255, 255, 255)
     _FONT_COLOR = (0, 0, 0)
     _BUTTON_SIZE = (150, 75)
@@ -15,14 +15,17 @@ class BestChoiceHillClimbing(HillClimbing):
 
     def _climb_the_hill(self, model: Problem, state: State) -> Union[State, None]:
         # TODO:
-        # - go trough all the neighbors (_get_neighbours is your friend)
-        # - find the best improving state (maximal model.improvement(....) > 0)
-        # return it (or the current state if there is no improving state)!
-        returnState = state
+        # - go trough all the moves (_get_moves is your friend)
+        # - find the best improving move (maximal model.move_improvement(....) > 0)
+        # return the state it leads to (or the current state if there is no improving move)!
+        best_move = None
+        best_improvement = 0
 
-        for neighbour in self._get_neighbours(model, state):
-            if model.improvement(neighbour, state) > 0:
-                if model.improvement(neighbour, returnState) > 0:
-                    returnState = neighbour
+        for move in self._get_moves(model, state):
+            improvement = model.move_improvement(move)
+            if improvement > best_improvement:
+                best_move, best_improvement = move, improvement
 
-        return returnState
\ No newline at end of file
+        if best_move is None:
+            return state
+        return best_move.apply()
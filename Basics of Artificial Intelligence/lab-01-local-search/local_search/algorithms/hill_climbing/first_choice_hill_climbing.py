@@ -18,7 +18,7 @@ class FirstChoiceHillClimbing(HillClimbing):
                 Returns the first improving neighbor.
                 Otherwise stays in the current state (indicating local optimum)
         """
-        for neighbour in self._get_neighbours(model, state):
-            if model.improvement(neighbour, state) > 0:
-                return neighbour
+        for move in self._get_moves(model, state, first_improvement=True):
+            if model.move_improvement(move) > 0:
+                return move.apply()
         return state
@@ -14,12 +14,12 @@ class RandomChoiceHillClimbing(HillClimbing):
 
     def _climb_the_hill(self, model: Problem, state: State) -> Union[State, None]:
         # TODO:
-        # - get single random neighbor (_get_random_neighbours is your friend)
-        # - if it's improving state, return it
+        # - get single random move (_get_random_moves is your friend)
+        # - if it's improving move, return the state it leads to
         #   otherwise return the current state
 
-        returnState = self._get_random_neighbours(model, state).__next__()
-        if model.improvement(returnState, state) > 0:
-            return returnState
+        move = next(self._get_random_moves(model, state), None)
+        if move is not None and model.move_improvement(move) > 0:
+            return move.apply()
         else:
-            return state
\ No newline at end of file
+            return state
@@ -14,22 +14,19 @@ class WorstChoiceHillClimbing(HillClimbing):
 
     def _climb_the_hill(self, model: Problem, state: State) -> Union[State, None]:
         # TODO:
-        # - go trough all the neighbors (_get_neighbours is your friend)
-        # - find the worst improving state (with minimal model.improvement(....) > 0)
-        # return it (or the current state if there is no improving state)!
-        returnState = state
-        neighbours = []
-
-        for neighbour in self._get_neighbours(model, state):
-            neighbours.append(neighbour)
-
-        def sortFunc(ns: State):
-            return model.improvement(ns, state)
-
-        neighbours.sort(key=sortFunc)
-        for neighbour in neighbours:
-            if model.improvement(neighbour, state) > 0:
-                return neighbour
-
-        return state
-
+        # - go trough all the moves (_get_moves is your friend)
+        # - find the worst improving move (with minimal model.move_improvement(....) > 0)
+        # return the state it leads to (or the current state if there is no improving move)!
+        worst_move = None
+        worst_improvement = None
+
+        for move in self._get_moves(model, state):
+            improvement = model.move_improvement(move)
+            if improvement <= 0:
+                continue
+            if worst_improvement is None or improvement < worst_improvement:
+                worst_move, worst_improvement = move, improvement
+
+        if worst_move is None:
+            return state
+        return worst_move.apply()
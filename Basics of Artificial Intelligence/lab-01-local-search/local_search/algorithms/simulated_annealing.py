@@ -51,31 +51,30 @@ class SimulatedAnnealing(SubscribableAlgorithm):
 
     def _find_next_state(self, model: Problem, state: State) -> Union[State, None]:
         # TODO:
-        # — find random neighbour (self._get_random_neighbours + `next` to read a single element)
-        # — if the neighbour is better then mark is as the next state
+        # — find random move (self._get_random_moves + `next` to read a single element)
+        # — if the move is improving then mark the state it leads to as the next state
         # — otherwise calculate the probability of transition using self._calculate_transition_probability
         #   * use random.random() to check whether the neighbor should be a new state
         # — update temperature
         # — return the new state
-        random_neighbour = self._get_random_neighbours(model, state).__next__()
-        if model.improvement(random_neighbour, state) > 0:
-            self._update_temperature()
-            return random_neighbour
+        random_move = next(self._get_random_moves(model, state), None)
+        if random_move is None:
+            return state
+        improvement = model.move_improvement(random_move)
+        if improvement > 0 or self._calculate_transition_probability(improvement) >= random.random():
+            next_state = random_move.apply()
         else:
-            if self._calculate_transition_probability(model, state, random_neighbour) >= random.random():
-                self._update_temperature()
-                return random_neighbour
-            else:
-                self._update_temperature()
-                return state
-
-    def _calculate_transition_probability(self, model: Problem, old_state: State, new_state: State) -> float:
+            next_state = state
+        self._update_temperature()
+        return next_state
+
+    def _calculate_transition_probability(self, improvement: float) -> float:
         # TODO:
         # - calculate probability of transition according to the metropolis function
         #   p = exp(delta / temperature)
-        #   where: delta is the improvement of the objective function (model has a corresponding method)
+        #   where: delta is the improvement of the objective function (model.move_improvement(...))
         # - use mpmath to calculate the exponential
-        return mpmath.exp(model.improvement(new_state, old_state) / self.temperature)
+        return mpmath.exp(improvement / self.temperature)
 
     def _update_temperature(self):
         # TODO:
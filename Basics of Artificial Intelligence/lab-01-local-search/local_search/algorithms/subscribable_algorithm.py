@@ -7,6 +7,7 @@ from local_search.algorithm_subscribers.algorithm_subscriber import AlgorithmSub
 from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.algorithms.algorithm import Algorithm
 from local_search.algorithms.algorithm_config import DEFAULT_CONFIG, AlgorithmConfig
+from local_search.problems.base.moves import Move
 from local_search.problems.base.problem import Problem
 from local_search.problems.base.state import State
 from dataclasses import dataclass
@@ -85,6 +86,21 @@ class SubscribableAlgorithm(Algorithm):
             self._on_next_neighbour(model, state, neighbour)
             yield neighbour
 
+    def _get_moves(self, model: Problem, state: State, first_improvement: bool = False) -> Generator[Move, None, None]:
+        """
+        Generates moves to score, pass first_improvement=True if the scan stops at the first improving move.
+        """
+        generator = model.move_generator
+        moves = generator.first_improvement_moves(state) if first_improvement else generator.available_moves(state)
+        for move in moves:
+            self._on_next_move(model, state, move)
+            yield move
+
+    def _get_random_moves(self, model: Problem, state: State) -> Generator[Move, None, None]:
+        for move in model.move_generator.random_moves(state):
+            self._on_next_move(model, state, move)
+            yield move
+
     def _is_stuck_in_local_optimum(self):
         return self.steps_from_last_state_update >= self.config.local_optimum_moves_threshold
 
@@ -134,6 +150,13 @@ class SubscribableAlgorithm(Algorithm):
             subscribtion.subscriber.on_next_neighbour(
                 model, from_state, next_neighbour)
 
+    def _on_next_move(self, model: Problem, from_state: State, move: Move):
+        """Called when algorithm scores next move, materializes the neighbour only if someone tracks it"""
+        for subscribtion in self._subscribtions:
+            if subscribtion.subscriber.tracks_neighbours:
+                subscribtion.subscriber.on_next_neighbour(
+                    model, from_state, move.apply())
+
     def _on_solution(self, model: Problem, solution: State):
         for subscribtion in self._subscribtions:
             subscribtion.subscriber.on_solution(model=model, solution=solution)
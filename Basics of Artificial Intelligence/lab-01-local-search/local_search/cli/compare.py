@@ -1,5 +1,7 @@
 import json
 import os
+import random
+import time
 from pathlib import Path
 from typing import List
 import click
@@ -9,6 +11,8 @@ from local_search.cli.utils.create_problem_model import create_problem_model
 from local_search.cli.utils.create_solver import create_solver
 from local_search.cli.utils.markdown_command import MarkdownCommand
 from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.problems.limited_avatar_problem.problem import LimitedAvatarProblem, LimitedAvatarProblemConfig
+from local_search.problems.limited_avatar_problem.renderers import Renderer
 from local_search.solvers.solution import Solution
 from rich.table import Table
 from rich import box
@@ -106,6 +110,54 @@ def compare_configurations(config_path):
     console.print(table)
 
 
+@compare.command('renderers', cls=MarkdownCommand)
+@click.option('--benchmark', default='monalisa.jpg', help='Reference image of limited avatar problem')
+@click.option('--n-states', default=20, help='Amount of random states rendered from scratch')
+@click.option('--n-moves', default=500, help='Amount of random moves evaluated')
+@click.option('--seed', default=0, help='Seed shared by all renderers')
+def compare_renderers(benchmark, n_states, n_moves, seed):
+    """
+    # Renderers
+
+    Benchmarks limited avatar renderers on the same random states and moves:
+
+        - full render: average time of rendering and scoring a random state from scratch
+        - move evaluation: average time of evaluating a random move (only dirty region is redrawn)
+        - objective: objective of the last evaluated state, renderers rasterize slightly differently
+
+    PIL is the default and the faster backend, NumPy renderer is a float32 reference that is a few times slower.
+    """
+    table = Table(title='Renderers comparison', box=box.ASCII,
+                  header_style="magenta", title_style="red")
+    for column, color in zip(['Renderer', 'Full render [ms]', 'Move evaluation [ms]', 'Objective'],
+                             ['yellow', 'chartreuse1', 'blue', 'orange1']):
+        table.add_column(column, justify="right", style=f"bold {color}")
+
+    for renderer in Renderer.renderers:
+        random.seed(seed)
+        problem = LimitedAvatarProblem.from_benchmark(benchmark, 'mutate_polygon',
+                                                      config=LimitedAvatarProblemConfig(renderer=renderer))
+        states = [problem.random_state() for _ in range(n_states)]
+        start = time.perf_counter()
+        for state in states:
+            problem.objective_for(state)
+        full_render_time = (time.perf_counter() - start) / n_states
+
+        state = states[0]
+        moves = problem.move_generator.random_moves(state)
+        start = time.perf_counter()
+        for _ in range(n_moves):
+            move = next(moves)
+            problem.move_improvement(move)
+        move_time = (time.perf_counter() - start) / n_moves
+
+        table.add_row(renderer,
+                      f'{1000 * full_render_time:.3f}',
+                      f'{1000 * move_time:.3f}',
+                      problem.human_readable_objective_for(move.apply()))
+    console.print(table)
+
+
 def create_comparison_for_solutions(solutions: List[Solution]):
     colors = ['yellow', 'chartreuse1', 'blue',
               'orange1', 'green', 'red', 'cyan', 'dark_orange']
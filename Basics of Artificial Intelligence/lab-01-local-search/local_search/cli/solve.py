@@ -54,6 +54,9 @@ def solve(config_file, **cli_options):
 
         - time_limit: maximum amount of time solver can run.
         - show_statistics: if solver should show current statistics of algorithm.
+        - n_trajectories: amount of independent trajectories, if more than one they run in parallel processes.
+        - n_workers: amount of worker processes (0 means amount of cpus).
+        - migration_interval: if set, trajectories share the best state every `migration_interval` seconds.
 
     ## visualization
     Describes how visualization should behave (if exists).
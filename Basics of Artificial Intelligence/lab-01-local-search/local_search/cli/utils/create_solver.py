@@ -1,7 +1,7 @@
-
 from local_search.cli.utils.console import print_section_name
 from local_search.cli.utils.create_dataclass import create_dataclass
 from local_search.solvers.local_search_solver import LocalSearchSolver
+from local_search.solvers.parallel_local_search_solver import ParallelLocalSearchSolver
 from local_search.solvers.solver_config import SolverConfig
 
 
@@ -9,4 +9,6 @@ def create_solver(options):
     config = options.setdefault('solver_config', {})
     print_section_name("Configuring solver")
     config = create_dataclass(config, SolverConfig)
+    if config.n_trajectories > 1:
+        return ParallelLocalSearchSolver(config)
     return LocalSearchSolver(config)
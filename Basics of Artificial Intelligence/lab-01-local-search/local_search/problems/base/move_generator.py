@@ -10,6 +10,8 @@ class MoveGenerator(ABC):
     def random_moves(self, state: State) -> Generator[Move[State], None, None]:
         """
         Generates all available moves from state, but moves are performed in a random order.
+        Generators may be infinite, but a state without any moves must yield nothing
+        (algorithms reading a single move treat it as a local optimum).
 
         CAUTION: below implementation is not an optimal one, because it needs to firstly materialize all available moves, which causes:
         1. memory issues in case of a big problem
@@ -24,3 +26,11 @@ class MoveGenerator(ABC):
         """
         Generates available moves from state
         """
+
+    def first_improvement_moves(self, state: State) -> Generator[Move[State], None, None]:
+        """
+        Generates moves for algorithms that stop at the first improving one.
+        Generators may skip here moves they already know not to improve the state,
+        by default all the available moves are generated.
+        """
+        return self.available_moves(state)
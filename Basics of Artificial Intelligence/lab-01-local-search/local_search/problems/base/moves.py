@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar, Union
 from copy import deepcopy
 
+if TYPE_CHECKING:
+    from local_search.problems.base.goal import Goal
+
 
 TState = TypeVar("TState")
 
@@ -9,6 +12,8 @@ TState = TypeVar("TState")
 class Move(ABC, Generic[TState]):
     def __init__(self, from_state: TState):
         self.state = from_state
+        self._new_state = None
+        self.improvement = None
 
     @abstractmethod
     def make(self) -> TState:
@@ -18,3 +23,20 @@ class Move(ABC, Generic[TState]):
         :param variable: decision variable on which we do want to make a move
         :returns: new state where passed :param variable: has modified value
         """
+
+    def apply(self) -> TState:
+        """
+        Returns the state after this move. The state is created only once, on the first call,
+        so moves can be scored and passed around without materializing their neighbours.
+        """
+        if self._new_state is None:
+            self._new_state = self.make()
+        return self._new_state
+
+    def delta(self, goal: 'Goal') -> Union[float, None]:
+        """
+        Calculates how much the objective of the goal changes after this move is made,
+        without creating the new state.
+        Moves that can't do it cheaper than a full evaluation for the passed goal return None.
+        """
+        return None
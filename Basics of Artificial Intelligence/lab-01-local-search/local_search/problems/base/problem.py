@@ -6,6 +6,7 @@ from enum import Enum
 from typing import Dict, Iterable, Type, TypeVar
 from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.problems.base.goal import Goal
+from local_search.problems.base.moves import Move
 from local_search.problems.base.state import State
 from local_search.problems.base.move_generator import MoveGenerator
 from dataclasses import dataclass
@@ -52,6 +53,19 @@ class Problem(ABC):
             new_state) - self.objective_for(old_state)
         return improvement * self.goal.type().value
 
+    def move_improvement(self, move: Move) -> float:
+        """
+        A helper method. Calculates how much the state after the move is better than the state before it.
+        Uses the move delta when available, so the neighbour doesn't have to be evaluated from scratch.
+        The result is also stored in move.improvement, so the move generator can see how its moves were scored.
+        """
+        delta = move.delta(self.goal)
+        if delta is None:
+            move.improvement = self.improvement(move.apply(), move.state)
+        else:
+            move.improvement = delta * self.goal.type().value
+        return move.improvement
+
     @staticmethod
     @abstractmethod
     def get_available_move_generation_strategies() -> Iterable[str]:
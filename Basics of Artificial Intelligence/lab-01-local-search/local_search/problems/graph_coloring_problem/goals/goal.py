@@ -1,8 +1,10 @@
-from abc import ABC
-from typing import List
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Dict, List, Set, Tuple
 
 from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.problems.base.problem import Goal
+from local_search.problems.graph_coloring_problem.models.color_classes import ColorClasses
 from local_search.problems.graph_coloring_problem.models.edge import Edge
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
 
@@ -13,28 +15,37 @@ class GraphColoringGoal(Goal, ABC):
     """
     goals = {}
 
-    def __init__(self, edges: List[Edge], n_vertices: int):
+    def __init__(self, edges: List[Edge], n_vertices: int, graph: Dict[int, Set[int]]):
         self.edges = edges
         self.n_vertices = n_vertices
+        self.graph = graph
 
     def __init_subclass__(cls):
         GraphColoringGoal.goals[camel_to_snake(cls.__name__)] = cls
 
     def _num_colors(self, state: GraphColoringState) -> int:
-        # TODO:
-        # return number of colors
-        pass
-
-    def _bad_edges(self, state: GraphColoringState) -> List[int]:
-        # TODO:
-        # return number of bad edges of every color class in the graph
-        # tip. self.edges is the list of 'Edge' in the graph
-        pass
-
-    def _color_classes(self, state: GraphColoringState) -> List[int]:
-        # TODO:
-        # return sizes of the color classes
-        pass
+        return state.color_classes(self.graph).num_colors
+
+    def _bad_edges(self, state: GraphColoringState) -> Counter:
+        return state.color_classes(self.graph).bad_edges
+
+    def _color_classes(self, state: GraphColoringState) -> Counter:
+        return state.color_classes(self.graph).sizes
+
+    def recoloring_delta(self, state: GraphColoringState, recoloring: Dict[int, int]) -> float:
+        """
+        Calculates how the objective changes after recoloring vertices (vertex idx -> new color),
+        touching only the recolored vertices and their neighbours.
+        """
+        color_classes = state.color_classes(self.graph)
+        changes = color_classes.changes(state.coloring, self.graph, recoloring)
+        return self._delta(color_classes, changes)
+
+    @abstractmethod
+    def _delta(self, color_classes: ColorClasses, changes: Dict[int, Tuple[int, int]]) -> float:
+        """
+        Calculates the objective change from changes (size change, bad edges change) of the affected color classes
+        """
 
     def human_readable_objective_for(self, state: GraphColoringState) -> str:
         return f"{self._num_colors(state)} colors"
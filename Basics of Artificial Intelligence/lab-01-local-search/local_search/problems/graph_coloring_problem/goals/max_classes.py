@@ -1,5 +1,8 @@
+from typing import Dict, Tuple
+
 from local_search.problems.base.goal import GoalType
 from local_search.problems.graph_coloring_problem.goals.goal import GraphColoringGoal
+from local_search.problems.graph_coloring_problem.models.color_classes import ColorClasses
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
 
 
@@ -7,7 +10,11 @@ class MaxClasses(GraphColoringGoal):
 
     def objective_for(self, state: GraphColoringState) -> int:
         color_classes = self._color_classes(state)
-        return sum([cc ** 2 for cc in color_classes])
+        return sum([cc ** 2 for cc in color_classes.values()])
+
+    def _delta(self, color_classes: ColorClasses, changes: Dict[int, Tuple[int, int]]) -> float:
+        return sum((color_classes.sizes[color] + size_change) ** 2 - color_classes.sizes[color] ** 2
+                   for color, (size_change, _) in changes.items())
 
     def type(self) -> GoalType:
-        return GoalType.MAX
\ No newline at end of file
+        return GoalType.MAX
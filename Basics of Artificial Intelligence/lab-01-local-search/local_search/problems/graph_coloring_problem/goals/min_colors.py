@@ -1,5 +1,8 @@
+from typing import Dict, Tuple
+
 from local_search.problems.base.goal import GoalType
 from local_search.problems.graph_coloring_problem.goals.goal import GraphColoringGoal
+from local_search.problems.graph_coloring_problem.models.color_classes import ColorClasses
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
 
 
@@ -8,5 +11,8 @@ class MinColors(GraphColoringGoal):
     def objective_for(self, state: GraphColoringState) -> int:
         return self._num_colors(state)
 
+    def _delta(self, color_classes: ColorClasses, changes: Dict[int, Tuple[int, int]]) -> float:
+        return color_classes.num_colors_change(changes)
+
     def type(self) -> GoalType:
-        return GoalType.MIN
\ No newline at end of file
+        return GoalType.MIN
@@ -1,7 +1,8 @@
-from typing import List
+from typing import Dict, Tuple
 
 from local_search.problems.base.goal import GoalType
 from local_search.problems.graph_coloring_problem.goals.goal import GraphColoringGoal
+from local_search.problems.graph_coloring_problem.models.color_classes import ColorClasses
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
 
 
@@ -10,7 +11,17 @@ class MinFeasible(GraphColoringGoal):
     def objective_for(self, state: GraphColoringState) -> int:
         bad_edges = self._bad_edges(state)
         color_classes = self._color_classes(state)
-        return sum([2*bad_edges[i]*color_classes[i]-color_classes[i]**2 for i in range(self.n_vertices)])
+        return sum([2*bad_edges[color]*size-size**2 for color, size in color_classes.items()])
+
+    def _delta(self, color_classes: ColorClasses, changes: Dict[int, Tuple[int, int]]) -> float:
+        def term(bad_edges: int, size: int) -> int:
+            return 2*bad_edges*size-size**2
+
+        delta = 0
+        for color, (size_change, bad_edges_change) in changes.items():
+            size, bad_edges = color_classes.sizes[color], color_classes.bad_edges[color]
+            delta += term(bad_edges + bad_edges_change, size + size_change) - term(bad_edges, size)
+        return delta
 
     def type(self) -> GoalType:
-        return GoalType.MIN
\ No newline at end of file
+        return GoalType.MIN
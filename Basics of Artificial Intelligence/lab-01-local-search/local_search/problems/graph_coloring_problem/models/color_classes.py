@@ -0,0 +1,120 @@
+from collections import Counter
+from typing import Dict, KeysView, Sequence, Set, Tuple
+
+
+class ColorClasses:
+    """
+    Summary of a coloring that is updated incrementally when vertices change their colors:
+    - sizes[c]: number of vertices with color c,
+    - bad_edges[c]: number of edges with both ends colored c,
+    - conflicts[v]: number of neighbours of vertex v with the same color.
+
+    Counters keep only non-zero entries, so copying the summary doesn't depend on the number of vertices.
+    """
+
+    def __init__(self, sizes: Counter, bad_edges: Counter, conflicts: Counter):
+        self.sizes = sizes
+        self.bad_edges = bad_edges
+        self.conflicts = conflicts
+
+    @classmethod
+    def of(cls, coloring: Sequence[int], graph: Dict[int, Set[int]]) -> 'ColorClasses':
+        """
+        Calculates the summary from scratch in O(V + E)
+        """
+        sizes = Counter()
+        bad_edges = Counter()
+        conflicts = Counter()
+        for idx, color in enumerate(coloring):
+            sizes[color] += 1
+            for neighbour in graph.get(idx, ()):
+                if coloring[neighbour] == color:
+                    conflicts[idx] += 1
+                    if neighbour < idx:
+                        bad_edges[color] += 1
+        return cls(sizes, bad_edges, conflicts)
+
+    def copy(self) -> 'ColorClasses':
+        return ColorClasses(self.sizes.copy(), self.bad_edges.copy(), self.conflicts.copy())
+
+    @property
+    def used_colors(self) -> KeysView[int]:
+        return self.sizes.keys()
+
+    @property
+    def num_colors(self) -> int:
+        return len(self.sizes)
+
+    def changes(self, coloring: Sequence[int], graph: Dict[int, Set[int]], recoloring: Dict[int, int]) -> Dict[int, Tuple[int, int]]:
+        """
+        Calculates how sizes and bad edges of the color classes change after recoloring,
+        in O(sum of degrees of the recolored vertices).
+        Returns the affected colors mapped to (size change, bad edges change).
+        """
+        changes: Dict[int, list] = {}
+
+        def change(color: int, size: int, bad_edges: int):
+            color_change = changes.setdefault(color, [0, 0])
+            color_change[0] += size
+            color_change[1] += bad_edges
+
+        for idx, new_color in recoloring.items():
+            old_color = coloring[idx]
+            change(old_color, -1, 0)
+            change(new_color, 1, 0)
+            for neighbour in graph.get(idx, ()):
+                if neighbour in recoloring and neighbour < idx:
+                    continue
+                neighbour_old_color = coloring[neighbour]
+                neighbour_new_color = recoloring.get(neighbour, neighbour_old_color)
+                if neighbour_old_color == old_color:
+                    change(old_color, 0, -1)
+                if neighbour_new_color == new_color:
+                    change(new_color, 0, 1)
+        return {color: (size, bad_edges) for color, (size, bad_edges) in changes.items()}
+
+    def num_colors_change(self, changes: Dict[int, Tuple[int, int]]) -> int:
+        """
+        Calculates how the number of used colors changes after applying passed changes
+        """
+        result = 0
+        for color, (size_change, _) in changes.items():
+            if self.sizes[color] == 0 and size_change > 0:
+                result += 1
+            elif self.sizes[color] > 0 and self.sizes[color] + size_change == 0:
+                result -= 1
+        return result
+
+    def apply(self, coloring: Sequence[int], graph: Dict[int, Set[int]], recoloring: Dict[int, int]) -> 'ColorClasses':
+        """
+        Updates the summary in place after recoloring of the passed (not yet modified) coloring
+        """
+        for color, (size_change, bad_edges_change) in self.changes(coloring, graph, recoloring).items():
+            self._add(self.sizes, color, size_change)
+            self._add(self.bad_edges, color, bad_edges_change)
+
+        def new_color(idx: int) -> int:
+            return recoloring.get(idx, coloring[idx])
+
+        for idx, color in recoloring.items():
+            old_color = coloring[idx]
+            conflicts = 0
+            for neighbour in graph.get(idx, ()):
+                if new_color(neighbour) == color:
+                    conflicts += 1
+                if neighbour in recoloring:
+                    continue
+                if coloring[neighbour] == old_color:
+                    self._add(self.conflicts, neighbour, -1)
+                if coloring[neighbour] == color:
+                    self._add(self.conflicts, neighbour, 1)
+            self._add(self.conflicts, idx, conflicts - self.conflicts[idx])
+        return self
+
+    @staticmethod
+    def _add(counter: Counter, key: int, value: int):
+        if value == 0:
+            return
+        counter[key] += value
+        if counter[key] == 0:
+            del counter[key]
@@ -0,0 +1,52 @@
+from array import array
+from math import isqrt
+from typing import Dict, Iterable, Iterator, Sequence, Union
+
+MIN_CHANGES_BEFORE_COMPACTION = 16
+
+
+class Coloring(Sequence[int]):
+    """
+    Persistent vector of vertex colors (indexed by vertex idx).
+
+    Recoloring doesn't copy the colors: the new vector shares the array with the old one
+    and only records the changed vertices. Once there are more than ~sqrt(n) changes,
+    they are merged into a fresh array, so lookups stay O(1) and a move costs O(changes) amortized.
+    """
+
+    def __init__(self, colors: Union[array, Iterable[int]], changes: Dict[int, int] = None):
+        self._colors = colors if isinstance(colors, array) else array('i', colors)
+        self._changes = changes or {}
+
+    def __getitem__(self, idx: int) -> int:
+        return self._changes.get(idx, self._colors[idx])
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def __iter__(self) -> Iterator[int]:
+        if not self._changes:
+            return iter(self._colors)
+        return (self[idx] for idx in range(len(self._colors)))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Coloring):
+            return NotImplemented
+        if self._colors is other._colors:
+            return all(self[idx] == other[idx] for idx in self._changes.keys() | other._changes.keys())
+        return len(self) == len(other) and all(sc == oc for sc, oc in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f'Coloring({list(self)})'
+
+    def recolored(self, recoloring: Dict[int, int]) -> 'Coloring':
+        """
+        Creates a new vector with vertices recolored according to passed mapping (vertex idx -> new color)
+        """
+        changes = {**self._changes, **recoloring}
+        if len(changes) <= max(MIN_CHANGES_BEFORE_COMPACTION, isqrt(len(self._colors))):
+            return Coloring(self._colors, changes)
+        colors = array('i', self._colors)
+        for idx, color in changes.items():
+            colors[idx] = color
+        return Coloring(colors)
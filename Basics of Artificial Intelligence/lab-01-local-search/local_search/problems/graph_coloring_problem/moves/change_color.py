@@ -1,21 +1,29 @@
 import random
-from typing import Generator
+from typing import Dict, Generator, Set, Union
 
+from local_search.problems.base.goal import Goal
 from local_search.problems.base.moves import Move
+from local_search.problems.graph_coloring_problem.goals.goal import GraphColoringGoal
 from local_search.problems.graph_coloring_problem.moves.move_generator import GraphColoringMoveGenerator
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
-import copy
 
 
 class ChangeColorMove(Move[GraphColoringState]):
-    def __init__(self, from_state: GraphColoringState, idx: int, color: int):
+    def __init__(self, graph: Dict[int, Set[int]], from_state: GraphColoringState, idx: int, color: int):
         super().__init__(from_state)
         (self.idx, self.color) = idx, color
+        self.graph = graph
 
     def make(self) -> GraphColoringState:
-        new_coloring = copy.deepcopy(self.state.coloring)
-        new_coloring[self.idx].color = self.color
-        return GraphColoringState(coloring=new_coloring)
+        return self.state.recolored(self.graph, {self.idx: self.color})
+
+    def delta(self, goal: Goal) -> Union[float, None]:
+        """
+        Only the classes of the old and the new color change, so it's O(degree).
+        """
+        if not isinstance(goal, GraphColoringGoal):
+            return None
+        return goal.recoloring_delta(self.state, {self.idx: self.color})
 
 
 class ChangeColor(GraphColoringMoveGenerator):
@@ -26,11 +34,12 @@ class ChangeColor(GraphColoringMoveGenerator):
             available_colors = self.get_available_colors(idx, state)
             if not available_colors:
                 break
-            yield ChangeColorMove(state,
+            yield ChangeColorMove(self.graph,
+                                  state,
                                   idx=idx,
                                   color=random.choice(available_colors))
 
     def available_moves(self, state: GraphColoringState) -> Generator[ChangeColorMove, None, None]:
         for idx in range(self.n_vertices):
             for color in self.get_available_colors(idx, state):
-                yield ChangeColorMove(state, idx, color)
+                yield ChangeColorMove(self.graph, state, idx, color)
@@ -1,11 +1,12 @@
 import random
-from typing import Generator, Set, Dict, List
+from collections import deque
+from typing import Generator, Set, Dict, List, Union
 
+from local_search.problems.base.goal import Goal
 from local_search.problems.base.moves import Move
-from local_search.problems.graph_coloring_problem.models.vertex import Vertex
+from local_search.problems.graph_coloring_problem.goals.goal import GraphColoringGoal
 from local_search.problems.graph_coloring_problem.moves.move_generator import GraphColoringMoveGenerator
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
-import copy
 
 
 class KempeChainMove(Move[GraphColoringState]):
@@ -14,19 +15,40 @@ class KempeChainMove(Move[GraphColoringState]):
         self.idx = idx
         self.color = color
         self.graph = graph
-        self.old_color = self.state.coloring[idx].color
+        self.old_color = self.state.coloring[idx]
+        self._recoloring = None
 
-    def _kempe_chain(self, coloring: List[Vertex]):
-        # TODO: to the kempe chain thing
-        # tip 1. it's just a BFS search over the graph
-        # tip 2. self.graph[c] are the neighbors of node c
-        pass
+    def _kempe_chain(self) -> Dict[int, int]:
+        """
+        BFS over vertices colored with the old or the new color, starting from self.idx.
+        Returns the chain as a mapping: vertex idx -> swapped color.
+        """
+        if self._recoloring is None:
+            coloring = self.state.coloring
+            swapped = {self.old_color: self.color, self.color: self.old_color}
+            recoloring = {self.idx: self.color}
+            queue = deque([self.idx])
+            while queue:
+                current = queue.popleft()
+                for neighbour in self.graph[current]:
+                    neighbour_color = coloring[neighbour]
+                    if neighbour in recoloring or neighbour_color not in swapped:
+                        continue
+                    recoloring[neighbour] = swapped[neighbour_color]
+                    queue.append(neighbour)
+            self._recoloring = recoloring
+        return self._recoloring
 
     def make(self) -> GraphColoringState:
-        new_coloring = copy.deepcopy(self.state.coloring)
-        new_coloring[self.idx].color = self.color
-        self._kempe_chain(new_coloring)
-        return GraphColoringState(coloring=new_coloring)
+        return self.state.recolored(self.graph, self._kempe_chain())
+
+    def delta(self, goal: Goal) -> Union[float, None]:
+        """
+        Only the two swapped color classes change, so it's O(chain size * degree).
+        """
+        if not isinstance(goal, GraphColoringGoal):
+            return None
+        return goal.recoloring_delta(self.state, self._kempe_chain())
 
 
 class KempeChain(GraphColoringMoveGenerator):
@@ -35,14 +57,16 @@ class KempeChain(GraphColoringMoveGenerator):
         while True:
             idx = random.randrange(self.n_vertices)
             available_colors = self.get_available_colors(idx, state)
+            if not available_colors:
+                break
             yield KempeChainMove(self.graph,
                                  state,
-                                 idx=random.randrange(self.n_vertices),
+                                 idx=idx,
                                  color=random.choice(available_colors))
 
     def available_moves(self, state: GraphColoringState) -> Generator[KempeChainMove, None, None]:
         for idx in range(self.n_vertices):
             for color in self.get_available_colors(idx, state):
-                if state.coloring[idx].color == color:
+                if state.coloring[idx] == color:
                     continue
                 yield KempeChainMove(self.graph, state, idx, color)
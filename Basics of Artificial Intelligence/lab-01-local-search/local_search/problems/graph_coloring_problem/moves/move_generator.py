@@ -17,6 +17,5 @@ class GraphColoringMoveGenerator(MoveGenerator):
         self.graph = graph
 
     def get_available_colors(self, idx: int, state: GraphColoringState):
-        used_colors = set([v.color for v in state.coloring])
-        return tuple(
-            used_colors.difference({state.coloring[idx].color}))
+        used_colors = state.color_classes(self.graph).used_colors
+        return tuple(used_colors - {state.coloring[idx]})
@@ -8,7 +8,7 @@ from local_search.problems.graph_coloring_problem.goals.goal import GraphColorin
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
 
 from local_search.problems.graph_coloring_problem.models.edge import Edge
-from local_search.problems.graph_coloring_problem.models.vertex import Vertex
+from local_search.problems.graph_coloring_problem.models.coloring import Coloring
 from local_search.problems.graph_coloring_problem.moves.move_generator import GraphColoringMoveGenerator
 
 
@@ -23,7 +23,8 @@ class GraphColoringProblem(Problem):
         move_generator = GraphColoringMoveGenerator.move_generators[move_generator_name](
             self.graph, self.n_vertices)
         goal_name = goal_name or list(GraphColoringGoal.goals.keys())[0]
-        goal = GraphColoringGoal.goals[goal_name](self.edges, self.n_vertices)
+        goal = GraphColoringGoal.goals[goal_name](
+            self.edges, self.n_vertices, self.graph)
         initial_solution = self._find_random_solution()
         super().__init__(initial_solution, move_generator, goal)
 
@@ -45,15 +46,15 @@ class GraphColoringProblem(Problem):
         return graph
 
     def _find_random_solution(self) -> GraphColoringState:
-        coloring = [Vertex(idx=i, color=-1) for i in range(self.n_vertices)]
-        coloring[0].color = 0
+        coloring = [-1 for _ in range(self.n_vertices)]
+        coloring[0] = 0
         for vertex in self.graph:
             available_colors = [i for i in range(self.n_vertices)]
             for neighbour in self.graph[vertex]:
-                if coloring[neighbour].color in available_colors:
-                    available_colors.remove(coloring[neighbour].color)
-            coloring[vertex].color = random.choice(available_colors)
-        return GraphColoringState(coloring=coloring)
+                if coloring[neighbour] in available_colors:
+                    available_colors.remove(coloring[neighbour])
+            coloring[vertex] = random.choice(available_colors)
+        return GraphColoringState(coloring=Coloring(coloring))
 
     def random_state(self) -> GraphColoringState:
         return self._find_random_solution()
@@ -1,34 +1,59 @@
 
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, Set
 import random
 from local_search.problems.base.state import State
-from local_search.problems.graph_coloring_problem.models.vertex import Vertex
-from copy import deepcopy
+from local_search.problems.graph_coloring_problem.models.color_classes import ColorClasses
+from local_search.problems.graph_coloring_problem.models.coloring import Coloring
 
 
 @dataclass
 class GraphColoringState(State):
-    coloring: List[Vertex]
+    coloring: Coloring
+
+    def __post_init__(self):
+        if not isinstance(self.coloring, Coloring):
+            self.coloring = Coloring(self.coloring)
+        self._color_classes = None
 
     def __str__(self):
-        return " ".join([f"({v.idx}: {v.color})" for v in self.coloring])
+        return " ".join([f"({idx}: {color})" for idx, color in enumerate(self.coloring)])
 
     def __eq__(self, other: 'GraphColoringState'):
         if other is None:
             return False
-        return all(ov.color == sv.color for sv, ov in zip(self.coloring, other.coloring))
+        return self.coloring == other.coloring
+
+    def color_classes(self, graph: Dict[int, Set[int]]) -> ColorClasses:
+        """
+        Summary of the color classes, calculated once per state
+        (or derived incrementally from the state this one was created from)
+        """
+        if self._color_classes is None:
+            self._color_classes = ColorClasses.of(self.coloring, graph)
+        return self._color_classes
+
+    def recolored(self, graph: Dict[int, Set[int]], recoloring: Dict[int, int]) -> 'GraphColoringState':
+        """
+        Creates a new state with vertices recolored according to passed mapping (vertex idx -> new color)
+        """
+        new_state = GraphColoringState(coloring=self.coloring.recolored(recoloring))
+        if self._color_classes is not None:
+            new_state._color_classes = self._color_classes.copy().apply(
+                self.coloring, graph, recoloring)
+        return new_state
 
     def asdict(self):
         base = super().asdict()
         return {
-            'coloring': [(vertex.idx, vertex.color) for vertex in self.coloring],
+            'coloring': [(idx, color) for idx, color in enumerate(self.coloring)],
             **base
         }
 
     @classmethod
     def from_dict(cls, data):
         cls.validate_data(data)
-        coloring = [Vertex(idx=vertex_tuple[0], color=vertex_tuple[1])
-                    for vertex_tuple in data['coloring']]
-        return cls(coloring)
+        colors = [0] * len(data['coloring'])
+        for idx, color in data['coloring']:
+            colors[idx] = color
+        return cls(Coloring(colors))
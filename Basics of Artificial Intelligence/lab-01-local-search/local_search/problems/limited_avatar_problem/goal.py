@@ -14,7 +14,7 @@ class ApproximateLimitedAvatar(Goal):
         """
         Calculates objective for passed state
         """
-        return ((self._ref - np.asarray(state.image)) ** 2).sum()
+        return state.squared_error(self._ref)
 
     def human_readable_objective_for(self, state: LimitedAvatarState) -> str:
         """
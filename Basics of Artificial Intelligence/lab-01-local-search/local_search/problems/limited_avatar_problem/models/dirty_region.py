@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+
+@dataclass
+class DirtyRegion:
+    """
+    Part of the image that differs from the image of the state this one was created from (the parent).
+    """
+    parent: 'LimitedAvatarState'
+    box: Tuple[int, int, int, int]
+    region: np.ndarray
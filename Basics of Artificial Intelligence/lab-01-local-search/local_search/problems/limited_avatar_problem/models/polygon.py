@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from typing import List, Tuple, Union
 from local_search.problems.limited_avatar_problem.models.vertex import Vertex
 from local_search.problems.limited_avatar_problem.models.color import Color
 
@@ -8,6 +8,15 @@ from local_search.problems.limited_avatar_problem.models.color import Color
 class Polygon:
     vertices: List[Vertex]
     color: Color
+    _bounding_box: Union[Tuple[int, int, int, int], None] = field(default=None, init=False, repr=False, compare=False)
+
+    def copy(self) -> 'Polygon':
+        """
+        Returns a copy sharing no vertices nor color with this polygon (much cheaper than copy.deepcopy)
+        """
+        color = self.color
+        return Polygon(vertices=[Vertex(vertex.x, vertex.y) for vertex in self.vertices],
+                       color=Color(color.R, color.G, color.B, color.A))
 
     def change_color(self, color_diff: Color):
         self.color.R = (self.color.R + color_diff.R) % 256
@@ -18,3 +27,15 @@ class Polygon:
     def change_coords(self, vertex_idx: int, coords_diff: Tuple[int, int]):
         self.vertices[vertex_idx].x += coords_diff[0]
         self.vertices[vertex_idx].y += coords_diff[1]
+        self._bounding_box = None
+
+    def bounding_box(self) -> Tuple[int, int, int, int]:
+        """
+        Returns (left, upper, right, lower) box containing the polygon, right and lower bounds are exclusive.
+        The box is cached, vertices have to be moved with change_coords.
+        """
+        if self._bounding_box is None:
+            xs = [vertex.x for vertex in self.vertices]
+            ys = [vertex.y for vertex in self.vertices]
+            self._bounding_box = min(xs), min(ys), max(xs) + 1, max(ys) + 1
+        return self._bounding_box
@@ -1,10 +1,13 @@
+from abc import ABC, abstractmethod
 from local_search.problems.limited_avatar_problem.moves.move_generator import LimitedAvatarMoveGenerator
+from local_search.problems.base.goal import Goal
 from local_search.problems.base.moves import Move
+from local_search.problems.limited_avatar_problem.goal import ApproximateLimitedAvatar
+from local_search.problems.limited_avatar_problem.models.polygon import Polygon
 from local_search.problems.limited_avatar_problem.state import LimitedAvatarState
 from local_search.problems.limited_avatar_problem.models.color import Color
 from typing import Generator, Tuple, Union
 import random
-import copy
 
 
 class MutatePolygon(LimitedAvatarMoveGenerator):
@@ -36,23 +39,49 @@ class MutatePolygon(LimitedAvatarMoveGenerator):
         return self._generate_move(state)
 
 
-class ChangeCoordinatesMove(Move[LimitedAvatarState]):
-    def __init__(self, from_state: LimitedAvatarState, polygon_idx: int, vertex_idx: int, coords_diff: Tuple[int, int]):
+class PolygonMove(Move[LimitedAvatarState], ABC):
+    """
+    Base class for moves that modify a single polygon
+    """
+
+    def __init__(self, from_state: LimitedAvatarState, polygon_idx: int):
         super().__init__(from_state)
-        (self.polygon_idx, self.vertex_idx, self.coords_diff) = polygon_idx, vertex_idx, coords_diff
+        self.polygon_idx = polygon_idx
+
+    @abstractmethod
+    def _change(self, polygon: Polygon):
+        """
+        Modifies (a copy of) the polygon in place
+        """
 
     def make(self) -> LimitedAvatarState:
-        changed_polygons = copy.deepcopy(self.state.polygons)
-        changed_polygons[self.polygon_idx].change_coords(self.vertex_idx, self.coords_diff)
-        return LimitedAvatarState(polygons=changed_polygons, image_size=self.state.image_size)
+        changed_polygon = self.state.polygons[self.polygon_idx].copy()
+        self._change(changed_polygon)
+        return self.state.replace_polygon(self.polygon_idx, changed_polygon)
+
+    def delta(self, goal: Goal) -> Union[float, None]:
+        """
+        The new state redraws and rescores only the bounding box of the modified polygon.
+        """
+        if not isinstance(goal, ApproximateLimitedAvatar):
+            return None
+        old_objective = goal.objective_for(self.state)
+        return goal.objective_for(self.apply()) - old_objective
+
+
+class ChangeCoordinatesMove(PolygonMove):
+    def __init__(self, from_state: LimitedAvatarState, polygon_idx: int, vertex_idx: int, coords_diff: Tuple[int, int]):
+        super().__init__(from_state, polygon_idx)
+        (self.vertex_idx, self.coords_diff) = vertex_idx, coords_diff
+
+    def _change(self, polygon: Polygon):
+        polygon.change_coords(self.vertex_idx, self.coords_diff)
 
 
-class ChangeColorMove(Move[LimitedAvatarState]):
+class ChangeColorMove(PolygonMove):
     def __init__(self, from_state: LimitedAvatarState, polygon_idx: int, color_diff: Color):
-        super().__init__(from_state)
-        (self.polygon_idx, self.color_diff) = polygon_idx, color_diff
+        super().__init__(from_state, polygon_idx)
+        self.color_diff = color_diff
 
-    def make(self) -> LimitedAvatarState:
-        changed_polygons = copy.deepcopy(self.state.polygons)
-        changed_polygons[self.polygon_idx].change_color(self.color_diff)
-        return LimitedAvatarState(polygons=changed_polygons, image_size=self.state.image_size)
\ No newline at end of file
+    def _change(self, polygon: Polygon):
+        polygon.change_color(self.color_diff)
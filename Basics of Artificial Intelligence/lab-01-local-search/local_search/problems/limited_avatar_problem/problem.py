@@ -9,6 +9,7 @@ import local_search
 from local_search.problems.limited_avatar_problem.models.color import Color
 from local_search.problems.limited_avatar_problem.models.vertex import Vertex
 from local_search.problems.limited_avatar_problem.models.polygon import Polygon
+from local_search.problems.limited_avatar_problem.renderers import Renderer
 from typing import Union
 from pathlib import Path
 from PIL import Image
@@ -22,6 +23,7 @@ from dataclasses import dataclass, asdict
 class LimitedAvatarProblemConfig:
     n_polygons: int = 50
     n_polygon_vertices: int = 3
+    renderer: str = 'pil_renderer'
 
 
 DEFAULT_CONFIG = LimitedAvatarProblemConfig()
@@ -37,6 +39,7 @@ class LimitedAvatarProblem(Problem):
         self.config = config or DEFAULT_CONFIG
         self.reference_image = reference_image
         self._image_size = reference_image.size
+        self.renderer = Renderer.renderers[self.config.renderer]()
         move_generator_name = move_generator_name or list(
             self.get_available_move_generation_strategies())[0]
         move_generator = LimitedAvatarMoveGenerator.generators[move_generator_name](
@@ -63,7 +66,9 @@ class LimitedAvatarProblem(Problem):
 
         polygons = [Polygon(vertices=[_generate_vertex() for _ in range(self.config.n_polygon_vertices)],
                             color=_generate_color()) for _ in range(self.config.n_polygons)]
-        return LimitedAvatarState(polygons=polygons, image_size=self._image_size)
+        state = LimitedAvatarState(polygons=polygons, image_size=self._image_size)
+        state.renderer = self.renderer
+        return state
 
     def _find_initial_solution(self) -> LimitedAvatarState:
         return self.random_state()
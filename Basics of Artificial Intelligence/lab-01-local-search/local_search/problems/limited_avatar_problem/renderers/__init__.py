@@ -0,0 +1,3 @@
+from local_search.problems.limited_avatar_problem.renderers.renderer import Renderer
+from local_search.problems.limited_avatar_problem.renderers.pil_renderer import PilRenderer
+from local_search.problems.limited_avatar_problem.renderers.numpy_renderer import NumpyRenderer
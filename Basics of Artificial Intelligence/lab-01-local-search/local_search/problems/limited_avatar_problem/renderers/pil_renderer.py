@@ -0,0 +1,27 @@
+from typing import List, Tuple
+
+from local_search.problems.limited_avatar_problem.models.polygon import Polygon
+from local_search.problems.limited_avatar_problem.renderers.renderer import Renderer
+from PIL import Image, ImageDraw
+import numpy as np
+
+
+class PilRenderer(Renderer):
+    """
+    Draws polygons with PIL ImageDraw, the pixels are returned as uint8 array
+    """
+
+    def render(self, polygons: List[Polygon], image_size: Tuple[int, int], box: Tuple[int, int, int, int]) -> np.ndarray:
+        # only the rows of the box are drawn: scanline crossings are computed from differences of the y
+        # coordinates, so shifting the polygons vertically doesn't change a pixel, while shifting them
+        # horizontally moves some span ends by a pixel (PIL rounds the crossings), hence the full width
+        left, upper, right, lower = box
+        image = Image.new("RGB", (image_size[0], lower - upper), "white")
+        image_draw = ImageDraw.Draw(image, "RGBA")
+        for polygon in self.overlapping(polygons, box):
+            image_draw.polygon([(vertex.x, vertex.y - upper) for vertex in polygon.vertices],
+                               fill=(polygon.color.R, polygon.color.G, polygon.color.B, polygon.color.A))
+        pixels = np.asarray(image)
+        if left != 0 or right != image_size[0]:
+            pixels = pixels[:, left:right]
+        return pixels
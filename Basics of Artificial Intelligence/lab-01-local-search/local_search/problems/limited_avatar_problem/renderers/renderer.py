@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.problems.limited_avatar_problem.models.polygon import Polygon
+import numpy as np
+
+
+class Renderer(ABC):
+    """
+    Base class for backends drawing polygons of the limited avatar state
+    """
+    renderers = {}
+
+    def __init_subclass__(cls):
+        if ABC not in cls.__bases__:
+            Renderer.renderers[camel_to_snake(cls.__name__)] = cls
+
+    @abstractmethod
+    def render(self, polygons: List[Polygon], image_size: Tuple[int, int], box: Tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Draws the part of the image inside the (left, upper, right, lower) box on a white background
+        and returns it as a (height, width, 3) array. Rendering a box has to give exactly the same pixels
+        as cropping the full render, so that states can redraw only the dirty region.
+        """
+
+    @staticmethod
+    def overlapping(polygons: List[Polygon], box: Tuple[int, int, int, int]) -> List[Polygon]:
+        """
+        Returns polygons whose bounding box overlaps the box, in the drawing order
+        """
+        left, upper, right, lower = box
+        overlapping = []
+        for polygon in polygons:
+            p_left, p_upper, p_right, p_lower = polygon.bounding_box()
+            if p_left < right and p_right > left and p_upper < lower and p_lower > upper:
+                overlapping.append(polygon)
+        return overlapping
@@ -1,17 +1,33 @@
+from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.problems.base.state import State
+from local_search.problems.limited_avatar_problem.models.dirty_region import DirtyRegion
 from local_search.problems.limited_avatar_problem.models.polygon import Polygon
 from local_search.problems.limited_avatar_problem.models.vertex import Vertex
 from local_search.problems.limited_avatar_problem.models.color import Color
-from dataclasses import dataclass
-from PIL import Image, ImageDraw, ImageChops
-from typing import List, Tuple
+from local_search.problems.limited_avatar_problem.renderers import Renderer, PilRenderer
+from dataclasses import dataclass, field
+from PIL import Image
+from typing import List, Tuple, Union
 import numpy as np
 
 
+# longest chain of states whose pixels are kept only as dirty regions over the parent's ones
+MAX_DIRTY_DEPTH = 16
+
+
 @dataclass
 class LimitedAvatarState(State):
     polygons: List[Polygon]
     image_size: Tuple[int, int]
+    renderer: Renderer = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.renderer = PilRenderer()
+        self._pixels = None
+        self._image = None
+        self._squared_error = None
+        self._dirty_region = None
+        self._dirty_depth = 0
 
     def __str__(self):
         return 'There is no string representation of limited avatar state.'
@@ -19,25 +35,123 @@ class LimitedAvatarState(State):
     def __eq__(self, other: 'LimitedAvatarState'):
         if other is None:
             return False
-        return np.array_equal(self.image, other.image)
+        return np.array_equal(self.pixels, other.pixels)
 
-    def _to_coordinates(self, vertices: List[Vertex]) -> List[Tuple[int, int]]:
-        return [(vertex.x, vertex.y) for vertex in vertices]
+    def _render(self, box: Tuple[int, int, int, int]) -> np.ndarray:
+        return self.renderer.render(self.polygons, self.image_size, box)
 
-    def _to_color_coordinates(self, color: Color) -> Tuple[int, int, int, int]:
-        return color.R, color.G, color.B, color.A
+    def _clip(self, box: Tuple[int, int, int, int]) -> Union[Tuple[int, int, int, int], None]:
+        left, upper, right, lower = box
+        left, upper = max(left - 1, 0), max(upper - 1, 0)
+        right, lower = min(right + 1, self.image_size[0]), min(lower + 1, self.image_size[1])
+        if left >= right or upper >= lower:
+            return None
+        return left, upper, right, lower
 
-    def _draw_polygon(self, polygon: Polygon, image_draw: ImageDraw):
-        image_draw.polygon(self._to_coordinates(polygon.vertices),
-                           fill=self._to_color_coordinates(polygon.color))
+    def _forget_parent(self):
+        if self._pixels is not None and self._squared_error is not None:
+            self._dirty_region = None
+
+    def _region(self, box: Tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Pixels inside the box. For states derived by replace_polygon they are composed from the dirty regions
+        of the states up to the nearest one with cached pixels, so the whole image is never copied.
+        The returned array may be a view of cached pixels and must not be modified.
+        """
+        left, upper, right, lower = box
+        dirty_regions = []
+        state = self
+        while state._pixels is None:
+            # read once, _forget_parent may drop it meanwhile
+            dirty = state._dirty_region
+            if dirty is None:
+                break
+            dirty_regions.append(dirty)
+            state = dirty.parent
+        pixels = state.pixels[upper:lower, left:right]
+        copied = False
+        for dirty in reversed(dirty_regions):
+            d_left, d_upper, d_right, d_lower = dirty.box
+            i_left, i_upper, i_right, i_lower = max(left, d_left), max(upper, d_upper), min(right, d_right), min(lower, d_lower)
+            if i_left >= i_right or i_upper >= i_lower:
+                continue
+            if not copied:
+                pixels, copied = pixels.copy(), True
+            pixels[i_upper - upper:i_lower - upper, i_left - left:i_right - left] = \
+                dirty.region[i_upper - d_upper:i_lower - d_upper, i_left - d_left:i_right - d_left]
+        return pixels
+
+    @property
+    def pixels(self) -> np.ndarray:
+        """
+        Rendered (height, width, 3) array, cached. States derived by replace_polygon compose it
+        from the pixels of the states they were created from and the redrawn dirty regions.
+        """
+        if self._pixels is None:
+            if self._dirty_region is not None:
+                self._pixels = self._region((0, 0, *self.image_size))
+            else:
+                self._pixels = self._render((0, 0, *self.image_size))
+            self._forget_parent()
+        return self._pixels
 
     @property
     def image(self) -> Image.Image:
-        image = Image.new("RGB", self.image_size, "white")
-        image_draw = ImageDraw.Draw(image, "RGBA")
-        for polygon in self.polygons:
-            self._draw_polygon(polygon, image_draw)
-        return image
+        if self._image is None:
+            pixels = self.pixels
+            if pixels.dtype != np.uint8:
+                pixels = np.rint(pixels).astype(np.uint8)
+            self._image = Image.fromarray(pixels, "RGB")
+        return self._image
+
+    def squared_error(self, reference: np.ndarray) -> Union[int, float]:
+        """
+        Sum of squared pixel differences from the reference image, cached.
+        For states derived by replace_polygon it's updated from the dirty region only.
+        """
+        if self._squared_error is None:
+            dirty = self._dirty_region
+            parent_squared_error = dirty.parent._squared_error if dirty is not None else None
+            if parent_squared_error is not None:
+                left, upper, right, lower = dirty.box
+                reference_region = reference[upper:lower, left:right]
+                old_region = dirty.parent._region(dirty.box)
+                self._squared_error = parent_squared_error \
+                    + self._sum_of_squares(reference_region - dirty.region) \
+                    - self._sum_of_squares(reference_region - old_region)
+            else:
+                self._squared_error = self._sum_of_squares(reference - self.pixels)
+            self._forget_parent()
+        return self._squared_error
+
+    @staticmethod
+    def _sum_of_squares(difference: np.ndarray) -> Union[int, float]:
+        return (difference ** 2).sum().item()
+
+    def replace_polygon(self, polygon_idx: int, polygon: Polygon) -> 'LimitedAvatarState':
+        """
+        Creates a new state with one polygon replaced, redrawing only the area covered by the old or the new polygon.
+        Polygons are shared between states, so the passed polygon has to be a new object.
+        """
+        polygons = list(self.polygons)
+        polygons[polygon_idx] = polygon
+        new_state = LimitedAvatarState(polygons=polygons, image_size=self.image_size)
+        new_state.renderer = self.renderer
+        old_box = self.polygons[polygon_idx].bounding_box()
+        new_box = polygon.bounding_box()
+        box = self._clip((min(old_box[0], new_box[0]), min(old_box[1], new_box[1]),
+                          max(old_box[2], new_box[2]), max(old_box[3], new_box[3])))
+        if self._pixels is None and self._dirty_depth >= MAX_DIRTY_DEPTH:
+            # caching the composed pixels cuts the chain, so that reading a region stays cheap
+            self._pixels = self._region((0, 0, *self.image_size))
+        new_state._dirty_depth = 1 if self._pixels is not None else self._dirty_depth + 1
+        if box is None:
+            # the polygons lie outside of the image
+            box, region = (0, 0, 0, 0), np.empty((0, 0, 3), dtype=np.uint8)
+        else:
+            region = new_state._render(box)
+        new_state._dirty_region = DirtyRegion(parent=self, box=box, region=region)
+        return new_state
 
     def asdict(self):
         base = super().asdict()
@@ -46,6 +160,7 @@ class LimitedAvatarState(State):
                           (polygon.color.R, polygon.color.G, polygon.color.B, polygon.color.A)]
                          for polygon in self.polygons],
             'image_size': self.image_size,
+            'renderer': camel_to_snake(type(self.renderer).__name__),
             **base
         }
 
@@ -55,4 +170,7 @@ class LimitedAvatarState(State):
         data['polygons'] = [Polygon(vertices=[Vertex(x=vertex[0], y=vertex[1]) for vertex in polygon[0]],
                                     color=Color(polygon[1][0], polygon[1][1], polygon[1][2], polygon[1][3]))
                             for polygon in data['polygons']]
-        return cls(**data)
+        renderer_name = data.pop('renderer', camel_to_snake(PilRenderer.__name__))
+        state = cls(**data)
+        state.renderer = Renderer.renderers[renderer_name]()
+        return state
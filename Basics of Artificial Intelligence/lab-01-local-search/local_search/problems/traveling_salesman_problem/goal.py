@@ -1,12 +1,12 @@
 from abc import ABC
-from typing import List
+from typing import List, Union
 
 from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.problems.base.goal import GoalType
 from local_search.problems.base.problem import Goal
 from local_search.problems.traveling_salesman_problem.models import Point
-from local_search.problems.traveling_salesman_problem.models.salesman import \
-    Salesman
+from local_search.problems.traveling_salesman_problem.models.distance_matrix import \
+    DistanceMatrix
 from local_search.problems.traveling_salesman_problem.state import \
     TravelingSalesmanState
 
@@ -17,8 +17,9 @@ class TravelingSalesmanGoal(Goal, ABC):
     """
     goals = {}
 
-    def __init__(self, points: List[Point]):
+    def __init__(self, points: List[Point], distances: Union[DistanceMatrix, None] = None):
         self._points = points
+        self._distances = distances or DistanceMatrix(points)
 
     def __init_subclass__(cls):
         TravelingSalesmanGoal.goals[camel_to_snake(cls.__name__)] = cls
@@ -27,11 +28,13 @@ class TravelingSalesmanGoal(Goal, ABC):
 class Distance(TravelingSalesmanGoal):
 
     def objective_for(self, state: TravelingSalesmanState) -> int:
-        route = [self._points[i]
-                 for i in state.route]
-        return int(Salesman.from_point(route[0])
-                           .walk_route(route)
-                           .travelled_distance)
+        return int(self._distances.route_length(state.route))
+
+    def distance(self, idx1: int, idx2: int) -> float:
+        """
+        Returns the distance between points with passed indices
+        """
+        return self._distances[idx1, idx2]
 
     def human_readable_objective_for(self, state: TravelingSalesmanState) -> str:
         return f"{self.objective_for(state)} km"
@@ -3,3 +3,5 @@ from local_search.problems.traveling_salesman_problem.models.salesman import (
     Salesman,
 )
 from local_search.problems.traveling_salesman_problem.models.edge import Edge
+from local_search.problems.traveling_salesman_problem.models.distance_matrix import DistanceMatrix
+from local_search.problems.traveling_salesman_problem.models.neighbour_list import NeighbourList
@@ -0,0 +1,59 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.models.point import Point
+
+MAX_DENSE_POINTS = 4096
+TILE_SIZE = 256
+
+
+class DistanceMatrix:
+    """
+    Euclidean distances between the problem points.
+
+    For up to MAX_DENSE_POINTS points the whole matrix is precomputed at once,
+    for bigger instances it is split into TILE_SIZE x TILE_SIZE tiles that are computed
+    lazily on the first access, so only the parts of the matrix that the search touches live in memory.
+    """
+
+    def __init__(self, points: List[Point], max_dense_points: int = MAX_DENSE_POINTS, tile_size: int = TILE_SIZE):
+        self._xs = np.array([point.x for point in points], dtype=np.float64)
+        self._ys = np.array([point.y for point in points], dtype=np.float64)
+        self._tile_size = tile_size
+        self._tiles: Dict[Tuple[int, int], np.ndarray] = {}
+        self._dense = None
+        if len(points) <= max_dense_points:
+            self._dense = self._block(slice(None), slice(None))
+
+    def __len__(self):
+        return len(self._xs)
+
+    def __getitem__(self, idxs: Tuple[int, int]) -> float:
+        i, j = idxs
+        if self._dense is not None:
+            return float(self._dense[i, j])
+        tile = self._tile(i // self._tile_size, j // self._tile_size)
+        return float(tile[i % self._tile_size, j % self._tile_size])
+
+    def route_length(self, route: np.ndarray) -> float:
+        """
+        Length of the path visiting points in the route order (vectorized).
+        """
+        starts, ends = route[:-1], route[1:]
+        if self._dense is not None:
+            return float(self._dense[starts, ends].sum())
+        return float(np.hypot(self._xs[starts] - self._xs[ends],
+                              self._ys[starts] - self._ys[ends]).sum())
+
+    def _tile(self, row: int, col: int) -> np.ndarray:
+        tile = self._tiles.get((row, col))
+        if tile is None:
+            rows = slice(row * self._tile_size, (row + 1) * self._tile_size)
+            cols = slice(col * self._tile_size, (col + 1) * self._tile_size)
+            tile = self._tiles[(row, col)] = self._block(rows, cols)
+        return tile
+
+    def _block(self, rows: slice, cols: slice) -> np.ndarray:
+        return np.hypot(self._xs[rows, np.newaxis] - self._xs[np.newaxis, cols],
+                        self._ys[rows, np.newaxis] - self._ys[np.newaxis, cols])
@@ -0,0 +1,40 @@
+from typing import List
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.models.point import Point
+
+NEIGHBOURS_COUNT = 8
+CHUNK_SIZE = 1024
+
+
+class NeighbourList:
+    """
+    Candidate list: for every point keeps indices of its k nearest points, from the nearest one.
+
+    Built once with an exact k-nearest search over the point coordinates,
+    processed in chunks of CHUNK_SIZE rows, so it never holds the whole distance matrix in memory.
+    """
+
+    def __init__(self, points: List[Point], k: int = NEIGHBOURS_COUNT, chunk_size: int = CHUNK_SIZE):
+        xs = np.array([point.x for point in points], dtype=np.float64)
+        ys = np.array([point.y for point in points], dtype=np.float64)
+        n_points = len(points)
+        self.k = max(min(k, n_points - 1), 0)
+        self._neighbours = np.empty((n_points, self.k), dtype=np.int32)
+        if self.k == 0:
+            return
+        for start in range(0, n_points, chunk_size):
+            rows = np.arange(start, min(start + chunk_size, n_points))
+            distances = np.hypot(xs[rows, np.newaxis] - xs[np.newaxis, :],
+                                 ys[rows, np.newaxis] - ys[np.newaxis, :])
+            distances[rows - start, rows] = np.inf
+            nearest = np.argpartition(distances, self.k - 1, axis=1)[:, :self.k]
+            order = np.argsort(np.take_along_axis(distances, nearest, axis=1), axis=1)
+            self._neighbours[rows] = np.take_along_axis(nearest, order, axis=1)
+
+    def __len__(self):
+        return len(self._neighbours)
+
+    def __getitem__(self, idx: int) -> np.ndarray:
+        return self._neighbours[idx]
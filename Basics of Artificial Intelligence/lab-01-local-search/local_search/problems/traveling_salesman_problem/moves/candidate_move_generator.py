@@ -0,0 +1,87 @@
+from abc import ABC, abstractmethod
+from typing import Generator
+
+import numpy as np
+
+from local_search.problems.base import Move
+from local_search.problems.traveling_salesman_problem.models.neighbour_list import NEIGHBOURS_COUNT, NeighbourList
+from local_search.problems.traveling_salesman_problem.moves.move_generator import TravelingSalesmanMoveGenerator
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
+
+
+class CandidateMoveGenerator(TravelingSalesmanMoveGenerator, ABC):
+    """
+    Base class for move generators which enumerate only moves that connect a city
+    with one of its nearest neighbours (see NeighbourList).
+
+    First improvement scans use don't-look bits: a city is skipped once all its moves were scored
+    and none of them was improving, until one of its edges in the route changes
+    (so the endpoints of every edge touched by the accepted move are looked at again).
+    A scan that reaches its end with skipped cities clears the bits and looks at all the cities again.
+    Exhaustive scans (available_moves) ignore the bits.
+    """
+
+    def __init__(self, neighbours_count: int = NEIGHBOURS_COUNT):
+        self.neighbours_count = neighbours_count
+        self._neighbours = None
+        self._dont_look = None
+        self._tour_neighbours = None
+
+    def available_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
+        self._update_dont_look_bits(state)
+        positions = self._positions(state)
+        for city in state.route[1:-1].tolist():
+            yield from self._city_moves(state, city, positions)
+
+    def first_improvement_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
+        self._update_dont_look_bits(state)
+        positions = self._positions(state)
+        skipped = True
+        while skipped:
+            skipped = False
+            for city in state.route[1:-1].tolist():
+                if self._dont_look[city]:
+                    skipped = True
+                    continue
+                checked = True
+                for move in self._city_moves(state, city, positions):
+                    yield move
+                    checked = checked and move.improvement is not None and move.improvement <= 0
+                self._dont_look[city] = checked
+            # moves of a city depend on the positions of its neighbours too, so before
+            # reporting a local optimum the skipped cities are looked at once more
+            if skipped:
+                self._dont_look[:] = False
+
+    @abstractmethod
+    def _city_moves(self, state: TravelingSalesmanState, city: int, positions: np.ndarray) -> Generator[Move[TravelingSalesmanState], None, None]:
+        """
+        Generates moves that add an edge between the city and one of its nearest neighbours
+        """
+
+    def _update_dont_look_bits(self, state: TravelingSalesmanState):
+        if self._neighbours is None or len(self._neighbours) != len(state.points):
+            self._neighbours = NeighbourList(state.points, self.neighbours_count)
+            self._dont_look = np.zeros(len(state.points), dtype=bool)
+            self._tour_neighbours = None
+
+        route = state.route
+        successors = np.empty(len(state.points), dtype=np.int32)
+        predecessors = np.empty(len(state.points), dtype=np.int32)
+        successors[route[:-1]] = route[1:]
+        predecessors[route[1:]] = route[:-1]
+        if self._tour_neighbours is not None:
+            old_successors, old_predecessors = self._tour_neighbours
+            same_edges = ((successors == old_successors) & (predecessors == old_predecessors)) | \
+                ((successors == old_predecessors) & (predecessors == old_successors))
+            self._dont_look[~same_edges] = False
+        self._tour_neighbours = successors, predecessors
+
+    @staticmethod
+    def _positions(state: TravelingSalesmanState) -> np.ndarray:
+        """
+        Position of every city in the route (the depot is at position 0)
+        """
+        positions = np.empty(len(state.points), dtype=np.int64)
+        positions[state.route[:-1]] = np.arange(len(state.route) - 1)
+        return positions
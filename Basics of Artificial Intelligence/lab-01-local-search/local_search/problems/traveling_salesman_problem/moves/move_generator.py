@@ -12,4 +12,5 @@ class TravelingSalesmanMoveGenerator(MoveGenerator, ABC):
     move_generators = {}
 
     def __init_subclass__(cls):
-        TravelingSalesmanMoveGenerator.move_generators[camel_to_snake(cls.__name__)] = cls
\ No newline at end of file
+        if ABC not in cls.__bases__:
+            TravelingSalesmanMoveGenerator.move_generators[camel_to_snake(cls.__name__)] = cls
@@ -0,0 +1,86 @@
+from typing import Generator, Union
+
+import numpy as np
+
+from local_search.problems.base import Move
+from local_search.problems.base.goal import Goal
+from local_search.problems.traveling_salesman_problem.goal import Distance
+from local_search.problems.traveling_salesman_problem.moves.candidate_move_generator import CandidateMoveGenerator
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
+import random
+
+MAX_SEGMENT_LENGTH = 3
+
+
+class OrOptMove(Move[TravelingSalesmanState]):
+    """
+    Moves segment route[i:i + length] between positions j - 1 and j.
+    """
+
+    def __init__(self, from_state: TravelingSalesmanState, i: int, length: int, j: int):
+        super().__init__(from_state)
+        (self.i, self.length, self.j) = i, length, j
+
+    def make(self) -> TravelingSalesmanState:
+        route = self.state.route
+        end = self.i + self.length
+        segment = route[self.i:end]
+        if self.j < self.i:
+            new_route = np.concatenate(
+                (route[:self.j], segment, route[self.j:self.i], route[end:]))
+        else:
+            new_route = np.concatenate(
+                (route[:self.i], route[end:self.j], segment, route[self.j:]))
+        return TravelingSalesmanState(new_route, self.state.points)
+
+    def delta(self, goal: Goal) -> Union[float, None]:
+        """
+        Moving a segment replaces three edges, so it's O(1).
+        """
+        if not isinstance(goal, Distance):
+            return None
+        route = self.state.route
+        end = self.i + self.length
+        a, first, last, b = route[self.i - 1], route[self.i], route[end - 1], route[end]
+        c, d = route[self.j - 1], route[self.j]
+        removed = goal.distance(a, first) + goal.distance(last, b) + goal.distance(c, d)
+        added = goal.distance(a, b) + goal.distance(c, first) + goal.distance(last, d)
+        return added - removed
+
+
+class OrOpt(CandidateMoveGenerator):
+    """
+    Moves segments of up to MAX_SEGMENT_LENGTH cities next to one of the nearest neighbours
+    of the segment ends.
+    """
+
+    @staticmethod
+    def _is_valid(route_length: int, i: int, length: int, j: int) -> bool:
+        return 1 <= j <= route_length - 1 and (j < i or j > i + length)
+
+    def _city_moves(self, state: TravelingSalesmanState, city: int, positions: np.ndarray) -> Generator[OrOptMove, None, None]:
+        route_length = len(state.route)
+        i = int(positions[city])
+        for length in range(1, MAX_SEGMENT_LENGTH + 1):
+            # the segment may end at the last city, right before the depot closing the route
+            if i + length > route_length - 1:
+                break
+            last = state.route[i + length - 1]
+            candidates = [int(positions[c]) + 1 for c in self._neighbours[city]] + \
+                [int(positions[c]) for c in self._neighbours[last]]
+            for j in candidates:
+                if self._is_valid(route_length, i, length, j):
+                    yield OrOptMove(state, i, length, j)
+
+    def random_moves(self, state: TravelingSalesmanState) -> Generator[OrOptMove, None, None]:
+        route_length = len(state.route)
+        cities = route_length - 2
+        # a segment covering all the cities has nowhere to go
+        if cities < 2:
+            return
+        while True:
+            length = random.randint(1, min(MAX_SEGMENT_LENGTH, cities - 1))
+            i = random.randint(1, route_length - 1 - length)
+            j = random.randint(1, route_length - 1)
+            if self._is_valid(route_length, i, length, j):
+                yield OrOptMove(state, i, length, j)
@@ -1,7 +1,8 @@
-from copy import copy
-from typing import Generator, List
+from typing import Generator, List, Union
 
 from local_search.problems.base import Move
+from local_search.problems.base.goal import Goal
+from local_search.problems.traveling_salesman_problem.goal import Distance
 from local_search.problems.traveling_salesman_problem.moves.move_generator import TravelingSalesmanMoveGenerator
 from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
 import random
@@ -14,11 +15,27 @@ class SwapTwoPointsMove(Move[TravelingSalesmanState]):
         (self.i1, self.i2) = i1, i2
 
     def make(self) -> TravelingSalesmanState:
-        new_route = copy(self.state.route)
-        new_route[self.i1] = self.state.route[self.i2]
-        new_route[self.i2] = self.state.route[self.i1]
+        new_route = self.state.route.copy()
+        new_route[[self.i1, self.i2]] = self.state.route[[self.i2, self.i1]]
         return TravelingSalesmanState(new_route, self.state.points)
 
+    def delta(self, goal: Goal) -> Union[float, None]:
+        """
+        Swapping two points changes only the edges adjacent to them, so it's O(1).
+        """
+        if not isinstance(goal, Distance):
+            return None
+        route = self.state.route
+        p1, x, n1 = route[self.i1 - 1], route[self.i1], route[self.i1 + 1]
+        p2, y, n2 = route[self.i2 - 1], route[self.i2], route[self.i2 + 1]
+        if self.i2 == self.i1 + 1:
+            return goal.distance(p1, y) + goal.distance(x, n2) - goal.distance(p1, x) - goal.distance(y, n2)
+        removed = goal.distance(p1, x) + goal.distance(x, n1) + \
+            goal.distance(p2, y) + goal.distance(y, n2)
+        added = goal.distance(p1, y) + goal.distance(y, n1) + \
+            goal.distance(p2, x) + goal.distance(x, n2)
+        return added - removed
+
 
 class SwapTwoPoints(TravelingSalesmanMoveGenerator):
 
@@ -28,6 +45,8 @@ class SwapTwoPoints(TravelingSalesmanMoveGenerator):
                 yield SwapTwoPointsMove(state, i1, i2)
 
     def random_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
+        if len(state.route) < 4:
+            return
         while True:
             i1 = random.randrange(1, len(state.route) - 2)
             i2 = random.randrange(i1 + 1, len(state.route) - 1)
@@ -0,0 +1,98 @@
+from enum import IntEnum, auto
+from typing import Generator, Union
+
+import numpy as np
+
+from local_search.problems.base import Move
+from local_search.problems.base.goal import Goal
+from local_search.problems.traveling_salesman_problem.goal import Distance
+from local_search.problems.traveling_salesman_problem.moves.candidate_move_generator import CandidateMoveGenerator
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
+import random
+
+
+class ThreeOptReconnection(IntEnum):
+    """
+    Pure 3-opt reconnections of route A B C D (' marks a reversed segment)
+    """
+    SWAP = 0  # A C B D
+    SWAP_REVERSE_FIRST = auto()  # A C B' D
+    SWAP_REVERSE_SECOND = auto()  # A C' B D
+    REVERSE_BOTH = auto()  # A B' C' D
+
+
+class ThreeOptMove(Move[TravelingSalesmanState]):
+    """
+    Removes edges before positions i, j and k, then reconnects segments
+    B = route[i:j] and C = route[j:k] in one of the ThreeOptReconnection ways.
+    """
+
+    def __init__(self, from_state: TravelingSalesmanState, i: int, j: int, k: int, reconnection: ThreeOptReconnection):
+        super().__init__(from_state)
+        (self.i, self.j, self.k, self.reconnection) = i, j, k, reconnection
+
+    def make(self) -> TravelingSalesmanState:
+        route = self.state.route
+        a, b, c, d = route[:self.i], route[self.i:self.j], route[self.j:self.k], route[self.k:]
+        if self.reconnection == ThreeOptReconnection.SWAP:
+            segments = (a, c, b, d)
+        elif self.reconnection == ThreeOptReconnection.SWAP_REVERSE_FIRST:
+            segments = (a, c, b[::-1], d)
+        elif self.reconnection == ThreeOptReconnection.SWAP_REVERSE_SECOND:
+            segments = (a, c[::-1], b, d)
+        else:
+            segments = (a, b[::-1], c[::-1], d)
+        return TravelingSalesmanState(np.concatenate(segments), self.state.points)
+
+    def delta(self, goal: Goal) -> Union[float, None]:
+        """
+        Reconnecting the segments replaces three edges, so it's O(1).
+        """
+        if not isinstance(goal, Distance):
+            return None
+        route = self.state.route
+        a = route[self.i - 1]
+        b_first, b_last = route[self.i], route[self.j - 1]
+        c_first, c_last = route[self.j], route[self.k - 1]
+        d = route[self.k]
+        removed = goal.distance(a, b_first) + goal.distance(b_last, c_first) + goal.distance(c_last, d)
+        if self.reconnection == ThreeOptReconnection.SWAP:
+            added = goal.distance(a, c_first) + goal.distance(c_last, b_first) + goal.distance(b_last, d)
+        elif self.reconnection == ThreeOptReconnection.SWAP_REVERSE_FIRST:
+            added = goal.distance(a, c_first) + goal.distance(c_last, b_last) + goal.distance(b_first, d)
+        elif self.reconnection == ThreeOptReconnection.SWAP_REVERSE_SECOND:
+            added = goal.distance(a, c_last) + goal.distance(c_first, b_first) + goal.distance(b_last, d)
+        else:
+            added = goal.distance(a, b_last) + goal.distance(b_first, c_last) + goal.distance(c_first, d)
+        return added - removed
+
+
+class ThreeOpt(CandidateMoveGenerator):
+    """
+    Sequential 3-opt: the first new edge goes from a city to one of its nearest neighbours,
+    the second one from the end of the moved segment to one of its nearest neighbours.
+    """
+
+    def _city_moves(self, state: TravelingSalesmanState, city: int, positions: np.ndarray) -> Generator[ThreeOptMove, None, None]:
+        route = state.route
+        i = int(positions[city]) + 1
+        if i > len(route) - 3:
+            return
+        for c_first in self._neighbours[city]:
+            j = int(positions[c_first])
+            if j <= i:
+                continue
+            for d in self._neighbours[route[j - 1]]:
+                k = int(positions[d])
+                if k <= j:
+                    continue
+                for reconnection in ThreeOptReconnection:
+                    yield ThreeOptMove(state, i, j, k, reconnection)
+
+    def random_moves(self, state: TravelingSalesmanState) -> Generator[ThreeOptMove, None, None]:
+        # three distinct cut positions need at least two cities
+        if len(state.route) < 4:
+            return
+        while True:
+            i, j, k = sorted(random.sample(range(1, len(state.route)), 3))
+            yield ThreeOptMove(state, i, j, k, random.choice(list(ThreeOptReconnection)))
@@ -1,7 +1,8 @@
-from copy import copy
-from typing import Generator
+from typing import Generator, Union
 
 from local_search.problems.base import Move
+from local_search.problems.base.goal import Goal
+from local_search.problems.traveling_salesman_problem.goal import Distance
 from local_search.problems.traveling_salesman_problem.moves.move_generator import TravelingSalesmanMoveGenerator
 from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
 import random
@@ -13,9 +14,21 @@ class TwoOptMove(Move[TravelingSalesmanState]):
         (self.i1, self.i2) = i1, i2
 
     def make(self) -> TravelingSalesmanState:
-        new_route = self.state.route[0:self.i1] + list(reversed(self.state.route[self.i1:self.i2])) + self.state.route[self.i2:]
+        new_route = self.state.route.copy()
+        new_route[self.i1:self.i2] = self.state.route[self.i1:self.i2][::-1]
         return TravelingSalesmanState(new_route, self.state.points)
 
+    def delta(self, goal: Goal) -> Union[float, None]:
+        """
+        Reversing a segment replaces only the two edges at its ends, so it's O(1).
+        """
+        if not isinstance(goal, Distance):
+            return None
+        route = self.state.route
+        a, b = route[self.i1 - 1], route[self.i1]
+        c, d = route[self.i2 - 1], route[self.i2]
+        return goal.distance(a, c) + goal.distance(b, d) - goal.distance(a, b) - goal.distance(c, d)
+
 class TwoOpt(TravelingSalesmanMoveGenerator):
 
     def available_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
@@ -24,6 +37,8 @@ class TwoOpt(TravelingSalesmanMoveGenerator):
                 yield TwoOptMove(state, i1, i2)
 
     def random_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
+        if len(state.route) < 4:
+            return
         while True:
             i1 = random.randrange(1, len(state.route) - 2)
             i2 = random.randrange(i1 + 1, len(state.route) - 1)
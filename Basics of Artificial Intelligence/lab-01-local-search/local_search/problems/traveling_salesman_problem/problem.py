@@ -6,8 +6,8 @@ from local_search.problems.base.problem import Problem, Goal
 from local_search.problems.traveling_salesman_problem.goal import TravelingSalesmanGoal, Distance
 from local_search.problems.traveling_salesman_problem.models.point import \
     Point
-from local_search.problems.traveling_salesman_problem.models.salesman import \
-    Salesman
+from local_search.problems.traveling_salesman_problem.models.distance_matrix import \
+    DistanceMatrix
 from local_search.problems.traveling_salesman_problem.moves.move_generator import \
     TravelingSalesmanMoveGenerator
 from local_search.problems.traveling_salesman_problem.state import \
@@ -22,13 +22,14 @@ class TravelingSalesmanProblem(Problem):
                  goal_name: Union[str, None] = "distance"):
         self._points: List[Point] = points
         self.depot_idx = depot_idx
+        self.distances = DistanceMatrix(points)
         initial_solution = self.random_state()
         move_generator_name = move_generator_name or list(
             self.get_available_move_generation_strategies())[0]
         move_generator = TravelingSalesmanMoveGenerator.move_generators[move_generator_name](
         )
         goal_name = goal_name or list(self.get_available_goals())[0]
-        goal = TravelingSalesmanGoal.goals[goal_name](self._points)
+        goal = TravelingSalesmanGoal.goals[goal_name](self._points, self.distances)
         super().__init__(initial_solution, move_generator, goal)
 
     @property
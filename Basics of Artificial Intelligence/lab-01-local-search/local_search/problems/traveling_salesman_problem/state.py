@@ -2,6 +2,7 @@
 from dataclasses import dataclass
 from typing import Iterable, List, Tuple
 
+import numpy as np
 from local_search.problems.base.state import State
 from local_search.problems.traveling_salesman_problem.models.edge import \
     Edge
@@ -12,31 +13,33 @@ from local_search.problems.traveling_salesman_problem.models.point import Point
 
 @dataclass
 class TravelingSalesmanState(State):
-    route: List[int]
+    route: np.ndarray
     points: List[Point]
 
+    def __post_init__(self):
+        self.route = np.asarray(self.route, dtype=np.int32)
+
     def __str__(self):
         return str.join(" -> ", map(lambda idx: f'({self.points[idx].x}, {self.points[idx].y})', self.route))
 
     @property
     def edges(self) -> Iterable[Edge]:
+        route = self.route.tolist()
         not_connected_edges = zip(
-            self.route,
-            self.route[1:] + [self.route[0]]
+            route,
+            route[1:] + [route[0]]
         )
         return map(lambda edge: Edge(edge[0], edge[1]), not_connected_edges)
 
     def __eq__(self, other):
         if other is None:
             return False
-        is_any_idx_differs = any(
-            self.route[i] != other.route[i] for i in range(len(self.route)))
-        return not is_any_idx_differs
+        return np.array_equal(self.route, other.route)
 
     def asdict(self):
         base = super().asdict()
         return {
-            'route': self.route,
+            'route': self.route.tolist(),
             'points': [(point.x, point.y) for point in self.points],
             **base
         }
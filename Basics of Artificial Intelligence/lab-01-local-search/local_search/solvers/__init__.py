@@ -1 +1,2 @@
 from local_search.solvers.local_search_solver import LocalSearchSolver
+from local_search.solvers.parallel_local_search_solver import ParallelLocalSearchSolver
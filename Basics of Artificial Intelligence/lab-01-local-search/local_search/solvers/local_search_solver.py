@@ -1,6 +1,6 @@
 from typing import Any, Callable, Dict, Generic, List, Type, TypeVar
 from local_search.algorithms.subscribable_algorithm import MIN_NICENCESS, SubscribableAlgorithm
-from local_search.problems.base import Problem
+from local_search.problems.base import Problem, State
 from local_search.solvers.solution import Solution
 from local_search.solvers.solver import Solver
 
@@ -10,11 +10,11 @@ class LocalSearchSolver(Solver):
     Wrapper that contains all logic except algorithm
     """
 
-    def solve(self, model: Problem, algorithm: SubscribableAlgorithm) -> Solution:
+    def solve(self, model: Problem, algorithm: SubscribableAlgorithm, initial_state: State = None) -> Solution:
         statistics_subscription = algorithm.subscribe(
             self.algorithm_monitor, niceness=MIN_NICENCESS)
         self.start_timer()
-        solution_state = model.initial_state
+        solution_state = initial_state or model.initial_state
         while not self.is_timeout():
             try:
                 next_state = algorithm.next_state(model, solution_state)
@@ -28,6 +28,7 @@ class LocalSearchSolver(Solver):
                 break
 
         self.stop_timer()
+        statistics_subscription.subscriber.stop()
         statistics = statistics_subscription.subscriber.statistics
         statistics_subscription.close()
         return Solution(
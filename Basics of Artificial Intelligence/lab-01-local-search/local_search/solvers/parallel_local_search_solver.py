@@ -0,0 +1,115 @@
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+from local_search.algorithm_subscribers.algorithm_monitor import AlgorithmStatistics
+from local_search.algorithms.algorithm_config import AlgorithmConfig
+from local_search.algorithms.subscribable_algorithm import SubscribableAlgorithm
+from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.problems.base import Problem, State
+from local_search.solvers.local_search_solver import LocalSearchSolver
+from local_search.solvers.solution import Solution
+from local_search.solvers.solver import Solver
+from local_search.solvers.solver_config import SolverConfig
+
+# problem rebuilt once per worker process, see _init_worker
+_worker_problem: Union[Problem, None] = None
+
+TrajectoryResult = Tuple[Dict[str, Any], float, AlgorithmStatistics]
+
+
+def _init_worker(problem_data: Dict[str, Any]):
+    global _worker_problem
+    _worker_problem = Problem.from_dict(problem_data)
+
+
+def _run_trajectory(algorithm_name: str,
+                    algorithm_config: AlgorithmConfig,
+                    time_limit: float,
+                    seed: int,
+                    state_data: Union[Dict[str, Any], None]) -> TrajectoryResult:
+    """
+    Runs a single trajectory in the worker process, starting from the passed state or from a random one.
+    Returns the final state as dict, its objective and statistics of the run.
+    """
+    random.seed(seed)
+    np.random.seed(seed % 2 ** 32)
+    problem = _worker_problem
+    initial_state = State.from_dict(state_data) if state_data is not None else problem.random_state()
+    algorithm = SubscribableAlgorithm.algorithms[algorithm_name](algorithm_config)
+    solver = LocalSearchSolver(SolverConfig(time_limit=time_limit))
+    solution = solver.solve(problem, algorithm, initial_state)
+    return solution.state.asdict(), problem.objective_for(solution.state), solution.statistics
+
+
+class ParallelLocalSearchSolver(Solver):
+    """
+    Runs `n_trajectories` independent trajectories of the algorithm in a process pool, each with its own seed,
+    and returns the best solution with statistics merged over all trajectories.
+    The problem is sent once to every worker (as its dict representation), states travel as dicts too.
+
+    If `migration_interval` is set, trajectories run in rounds of that length (island model).
+    After each round every trajectory continues from its last state, except the worst one,
+    which continues from the best state found so far.
+    Subscribers of the passed algorithm are not notified, the algorithm runs in other processes.
+    """
+
+    def solve(self, model: Problem, algorithm: SubscribableAlgorithm) -> Solution:
+        n_trajectories = self._config.n_trajectories
+        n_workers = min(self._config.n_workers or os.cpu_count(), n_trajectories)
+        migration_interval = self._config.migration_interval or self._time_limit
+        n_rounds = max(math.ceil(self._time_limit / migration_interval), 1)
+        algorithm_name = camel_to_snake(type(algorithm).__name__)
+
+        # the first trajectory starts from the initial state of the model, the rest from random states
+        states: List[Union[Dict[str, Any], None]] = [None] * n_trajectories
+        states[0] = model.initial_state.asdict()
+        history: List[AlgorithmStatistics] = []
+        best: Union[TrajectoryResult, None] = None
+        best_round_start = 0.0
+
+        self.start_timer()
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 initializer=_init_worker,
+                                 initargs=(model.asdict(),)) as executor:
+            for _ in range(n_rounds):
+                round_start = self.wall_time()
+                time_left = self._time_limit - round_start
+                if time_left <= 0:
+                    break
+                futures = [executor.submit(_run_trajectory,
+                                           algorithm_name,
+                                           algorithm.config,
+                                           min(migration_interval, time_left),
+                                           random.randrange(2 ** 32),
+                                           state)
+                           for state in states]
+                results = [future.result() for future in futures]
+                history.extend(statistics for _, _, statistics in results)
+
+                ranking = sorted(range(n_trajectories),
+                                 key=lambda idx: results[idx][1] * model.goal.type().value)
+                worst, round_best = ranking[0], ranking[-1]
+                if best is None or self._is_better(model, results[round_best], best):
+                    best, best_round_start = results[round_best], round_start
+                states = [state for state, _, _ in results]
+                states[worst] = best[0]
+        self.stop_timer()
+
+        best_state_data, _, best_statistics = best
+        statistics = AlgorithmStatistics.merge(
+            [best_statistics, *[s for s in history if s is not best_statistics]])
+        statistics.time_untill_optimum_found = round(
+            best_round_start + best_statistics.time_untill_optimum_found, 2)
+        return Solution(
+            state=State.from_dict(best_state_data),
+            problem=model,
+            statistics=statistics,
+            algorithm_config=algorithm.config)
+
+    @staticmethod
+    def _is_better(model: Problem, result: TrajectoryResult, other: TrajectoryResult) -> bool:
+        return (result[1] - other[1]) * model.goal.type().value > 0
@@ -5,3 +5,6 @@ from dataclasses import dataclass
 class SolverConfig:
     time_limit: int = 60
     show_statistics: bool = False
+    n_trajectories: int = 1
+    n_workers: int = 0
+    migration_interval: float = 0
@@ -0,0 +1,39 @@
+import random
+
+from local_search.algorithms.hill_climbing.best_choice_hill_climbing import BestChoiceHillClimbing
+from local_search.algorithms.hill_climbing.first_choice_hill_climbing import FirstChoiceHillClimbing
+from local_search.problems.traveling_salesman_problem.models.point import Point
+from local_search.problems.traveling_salesman_problem.problem import TravelingSalesmanProblem
+
+
+def random_problem(cities: int, move_generator_name: str, seed: int = 0) -> TravelingSalesmanProblem:
+    random.seed(seed)
+    points = [Point(random.randint(0, 1000), random.randint(0, 1000)) for _ in range(cities)]
+    return TravelingSalesmanProblem(points, 0, move_generator_name=move_generator_name)
+
+
+def climb(algorithm, problem: TravelingSalesmanProblem):
+    state = problem.initial_state
+    while True:
+        next_state = algorithm._climb_the_hill(problem, state)
+        if next_state is state:
+            return state
+        state = next_state
+
+
+def improving_moves(problem: TravelingSalesmanProblem, state):
+    return [move for move in problem.move_generator.available_moves(state) if problem.move_improvement(move) > 0]
+
+
+def test_best_choice_climbs_to_candidate_local_optimum():
+    for move_generator_name in ["or_opt", "three_opt"]:
+        problem = random_problem(120, move_generator_name)
+        state = climb(BestChoiceHillClimbing(), problem)
+        assert improving_moves(problem, state) == []
+
+
+def test_first_choice_does_not_skip_improving_cities():
+    for move_generator_name in ["or_opt", "three_opt"]:
+        problem = random_problem(120, move_generator_name)
+        state = climb(FirstChoiceHillClimbing(), problem)
+        assert improving_moves(problem, state) == []
@@ -0,0 +1,52 @@
+import random
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from local_search.problems.base import State
+from local_search.problems.limited_avatar_problem.problem import LimitedAvatarProblem, LimitedAvatarProblemConfig
+from local_search.problems.limited_avatar_problem.renderers import NumpyRenderer, Renderer
+from local_search.problems.limited_avatar_problem.state import MAX_DIRTY_DEPTH
+
+
+def test_state_from_dict_keeps_configured_renderer():
+    config = LimitedAvatarProblemConfig(n_polygons=5, renderer='numpy_renderer')
+    problem = LimitedAvatarProblem(Image.new("RGB", (16, 12)), config=config)
+    state = problem.random_state()
+
+    restored = State.from_dict(state.asdict())
+
+    assert isinstance(restored.renderer, NumpyRenderer)
+    assert restored == state
+
+
+@pytest.mark.parametrize("renderer_name", Renderer.renderers)
+def test_rendered_box_matches_cropped_full_render(renderer_name: str):
+    random.seed(0)
+    config = LimitedAvatarProblemConfig(n_polygons=20, renderer=renderer_name)
+    problem = LimitedAvatarProblem(Image.new("RGB", (57, 43)), config=config)
+    renderer = Renderer.renderers[renderer_name]()
+    for _ in range(20):
+        state = problem.random_state()
+        full = renderer.render(state.polygons, state.image_size, (0, 0, *state.image_size))
+        for _ in range(50):
+            left, upper = random.randrange(57), random.randrange(43)
+            box = (left, upper, random.randint(left + 1, 57), random.randint(upper + 1, 43))
+            assert np.array_equal(renderer.render(state.polygons, state.image_size, box),
+                                  full[box[1]:box[3], box[0]:box[2]])
+
+
+def test_dirty_regions_match_full_render_along_a_walk():
+    random.seed(0)
+    reference = Image.fromarray(np.random.default_rng(0).integers(0, 256, (43, 57, 3), dtype=np.uint8))
+    problem = LimitedAvatarProblem(reference, config=LimitedAvatarProblemConfig(n_polygons=10))
+    state = problem.random_state()
+    for _ in range(3 * MAX_DIRTY_DEPTH):
+        move = next(problem.move_generator.random_moves(state))
+        problem.move_improvement(move)
+        state = move.apply()
+        # a state rebuilt from its description is rendered from scratch
+        redrawn = State.from_dict(state.asdict())
+        assert problem.objective_for(state) == problem.objective_for(redrawn)
+    assert np.array_equal(state.pixels, redrawn.pixels)
@@ -0,0 +1,62 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from local_search.problems.base import State
+from local_search.problems.graph_coloring_problem.models.edge import Edge
+from local_search.problems.graph_coloring_problem.problem import GraphColoringProblem
+from local_search.problems.limited_avatar_problem.problem import LimitedAvatarProblem, LimitedAvatarProblemConfig
+from local_search.problems.traveling_salesman_problem.models.point import Point
+from local_search.problems.traveling_salesman_problem.problem import TravelingSalesmanProblem
+
+
+def check_deltas(problem, state, moves, objective_for=None, n_moves: int = 200):
+    objective_for = objective_for or problem.objective_for
+    objective = objective_for(state)
+    for move in itertools.islice(moves, n_moves):
+        delta = move.delta(problem.goal)
+        assert delta is not None
+        assert delta == pytest.approx(objective_for(move.make()) - objective)
+
+
+def random_graph(vertices: int, edges: int, seed: int = 0):
+    random.seed(seed)
+    pairs = random.sample(list(itertools.combinations(range(vertices), 2)), edges)
+    return [Edge(start, end) for start, end in pairs]
+
+
+@pytest.mark.parametrize("move_generator_name", TravelingSalesmanProblem.get_available_move_generation_strategies())
+def test_traveling_salesman_deltas(move_generator_name):
+    random.seed(0)
+    points = [Point(random.randint(0, 1000), random.randint(0, 1000)) for _ in range(40)]
+    problem = TravelingSalesmanProblem(points, 0, move_generator_name=move_generator_name)
+    state = problem.random_state()
+    # the objective is truncated to whole kilometers, deltas are exact
+    route_length = lambda state: problem.distances.route_length(state.route)
+    check_deltas(problem, state, problem.move_generator.available_moves(state), route_length)
+    check_deltas(problem, state, problem.move_generator.random_moves(state), route_length)
+
+
+@pytest.mark.parametrize("move_generator_name", GraphColoringProblem.get_available_move_generation_strategies())
+@pytest.mark.parametrize("goal_name", GraphColoringProblem.get_available_goals())
+def test_graph_coloring_deltas(move_generator_name, goal_name):
+    problem = GraphColoringProblem(random_graph(30, 90), move_generator_name=move_generator_name, goal_name=goal_name)
+    for _ in range(5):
+        state = problem.random_state()
+        check_deltas(problem, state, problem.move_generator.available_moves(state))
+        check_deltas(problem, state, problem.move_generator.random_moves(state))
+
+
+def test_limited_avatar_deltas():
+    random.seed(0)
+    pixels = np.random.default_rng(0).integers(0, 256, (12, 16, 3), dtype=np.uint8)
+    problem = LimitedAvatarProblem(Image.fromarray(pixels), config=LimitedAvatarProblemConfig(n_polygons=5))
+    state = problem.random_state()
+    objective = problem.objective_for(state)
+    for move in itertools.islice(problem.move_generator.random_moves(state), 100):
+        # a state rebuilt from its description is rendered from scratch
+        redrawn = State.from_dict(move.make().asdict())
+        assert move.delta(problem.goal) == pytest.approx(problem.objective_for(redrawn) - objective)
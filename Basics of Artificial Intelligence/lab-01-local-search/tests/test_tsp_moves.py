@@ -0,0 +1,53 @@
+import itertools
+import random
+
+import pytest
+
+from local_search.problems.traveling_salesman_problem.models.point import Point
+from local_search.problems.traveling_salesman_problem.moves.or_opt import MAX_SEGMENT_LENGTH
+from local_search.problems.traveling_salesman_problem.problem import TravelingSalesmanProblem
+
+
+def small_problem(points: int, move_generator_name: str) -> TravelingSalesmanProblem:
+    random.seed(0)
+    return TravelingSalesmanProblem([Point(random.randint(0, 100), random.randint(0, 100)) for _ in range(points)],
+                                    0, move_generator_name=move_generator_name)
+
+
+def all_or_opt_moves(route_length: int):
+    """Every move of a segment of cities to another place between the depots"""
+    return {(i, length, j)
+            for length in range(1, MAX_SEGMENT_LENGTH + 1)
+            for i in range(1, route_length - length)
+            for j in range(1, route_length)
+            if j < i or j > i + length}
+
+
+@pytest.mark.parametrize("points", [6, 7])
+def test_or_opt_enumerates_all_moves_on_short_routes(points: int):
+    # with that few points every city is a candidate neighbour of every other one
+    problem = small_problem(points, "or_opt")
+    state = problem.initial_state
+    route_length = len(state.route)
+    expected = all_or_opt_moves(route_length)
+    assert any(i + length == route_length - 1 for i, length, _ in expected)
+
+    available = {(move.i, move.length, move.j) for move in problem.move_generator.available_moves(state)}
+    assert available == expected
+
+    random_moves = itertools.islice(problem.move_generator.random_moves(state), 5000)
+    assert {(move.i, move.length, move.j) for move in random_moves} == expected
+
+
+@pytest.mark.parametrize("move_generator_name", TravelingSalesmanProblem.get_available_move_generation_strategies())
+def test_random_moves_on_tiny_routes(move_generator_name: str):
+    # a single city has no neighbours, the generator must end instead of failing or looping forever
+    problem = small_problem(2, move_generator_name)
+    assert list(problem.move_generator.random_moves(problem.initial_state)) == []
+
+    problem = small_problem(3, move_generator_name)
+    state = problem.initial_state
+    for move in itertools.islice(problem.move_generator.random_moves(state), 100):
+        new_route = move.make().route
+        assert sorted(new_route[1:-1].tolist()) == sorted(state.route[1:-1].tolist())
+        assert new_route[0] == new_route[-1] == 0
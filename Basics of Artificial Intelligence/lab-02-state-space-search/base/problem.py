@@ -1,7 +1,8 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from base.state import State
-from typing import List, Tuple, TypeVar, Generic
+from pathlib import Path
+from typing import List, Tuple, TypeVar, Generic, Union
 from PIL.Image import Image
 
 S = TypeVar('S', bound=State)
@@ -36,5 +37,19 @@ class Problem(ABC, Generic[S,A]):
     def deserialize(text: str) -> Problem[S,A]:
         pass
 
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Problem[S,A]:
+        """Reads an instance from the file, problems with huge instances may override it to avoid reading whole text"""
+        with open(path) as instance_file:
+            return cls.deserialize(instance_file.read())
+
     def to_image(self, state: S, size: Tuple[int, int]) -> Image:
-        pass
\ No newline at end of file
+        pass
+
+    def reversed(self) -> Problem[S,A]:
+        """
+        Returns the problem of getting from the goal state back to the initial one (used by bidirectional solvers).
+        Only problems with a single goal state, whose every action can be undone by an action of the same cost,
+        can support it.
+        """
+        raise NotImplementedError
\ No newline at end of file
@@ -19,6 +19,10 @@ class Solver(ABC, Generic[P]):
     @abstractmethod
     def search_tree(self) -> Tree:
         raise NotImplementedError
+
+    def frontier_size(self) -> Optional[int]:
+        """Number of nodes kept for the later expansion, None if the solver doesn't keep them explicitly"""
+        return None
         
 
 class HeuristicSolver(Solver[P], ABC, Generic[P,H]):
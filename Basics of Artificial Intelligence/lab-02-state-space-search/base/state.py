@@ -3,5 +3,4 @@ from typing import Hashable
 
 
 class State(ABC, Hashable):
-    pass
-
+    __slots__ = ()
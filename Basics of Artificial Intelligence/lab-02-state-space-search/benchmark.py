@@ -1,164 +1,320 @@
-import stopit
 import argparse
-from cli_config import VERSION, avl_algos, avl_problems, problem_heuristics
-from typing import Optional, Union
+import csv
+import json
+import os
+import resource
+import time
+import traceback
+from collections import deque
+from dataclasses import asdict, dataclass, fields
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+
+from cli_config import VERSION, avl_algos, avl_heuristics, avl_problems, camel_to_snake, problem_heuristics
 from base.solver import HeuristicSolver, Solver
 from tree.node import Node
+from tree.tree import NodeEvent, NodeEventSubscriber
 
-from pathlib import Path
-from tree.tree import NodeEvent, NodeEventSubscriber, Tree
-import time
 
+@dataclass
+class BenchmarkRun:
+    instance: str
+    problem: str
+    algorithm: str
+    heuristic: Optional[str]
+
+    @property
+    def key(self) -> Tuple[str, str, str, str]:
+        return self.instance, self.problem, self.algorithm, self.heuristic or ''
+
+    @property
+    def solver_name(self) -> str:
+        return f"{self.algorithm}({self.heuristic})" if self.heuristic is not None else self.algorithm
 
-class BenchmarkMonitor(NodeEventSubscriber, Solver):
-    def __init__(self, solver: Solver, longest_name: int, timeout: float) -> None:
-        super().__init__(solver.problem)
+
+@dataclass
+class BenchmarkResult:
+    instance: str
+    problem: str
+    algorithm: str
+    heuristic: Optional[str]
+    # solved / failed / timeout / memory limit / recursion limit / not implemented / error
+    status: str
+    cost: Optional[float] = None
+    expansions: int = 0
+    generated: int = 0
+    # None for solvers without an explicit frontier (recursive DFS)
+    peak_frontier: Optional[int] = None
+    setup_time: float = 0
+    wall_time: float = 0
+    nodes_per_second: float = 0
+    peak_rss_mb: float = 0
+    error: str = ''
+
+    @staticmethod
+    def of(run: BenchmarkRun, status: str, **kwargs) -> 'BenchmarkResult':
+        return BenchmarkResult(run.instance, run.problem, run.algorithm, run.heuristic, status, **kwargs)
+
+    @property
+    def run(self) -> BenchmarkRun:
+        return BenchmarkRun(self.instance, self.problem, self.algorithm, self.heuristic)
+
+
+class BenchmarkMonitor(NodeEventSubscriber):
+    """
+    Only counts the events and reads the frontier size reported by the solver at every expansion,
+    anything more expensive would slow the benchmarked search down. The frontier can't be derived
+    from the events: searches drop children without closing them (duplicates, nodes over the bound).
+    """
+    def __init__(self, solver: Solver) -> None:
         self.solver = solver
-        self.solver.search_tree().subscribe(self)
-        self._reset_stats()
-        self.longest_name = longest_name
-        self.timeout = timeout
-
-
-    @stopit.threading_timeoutable(default = 'timeout')
-    def solve_with_timeout(self) -> Union[str, Optional[Node]]:
-        return self.solver.solve()
-
-    def solve(self) -> Optional[Node]:
-        self._reset_stats()
-        try:
-            result = self.solve_with_timeout(timeout=self.timeout)
-        except RecursionError:
-            result = "recursion stack overflow"
-            
-        self.print_result(result)
-        return result
-
-    def search_tree(self) -> Tree:
-        return self.solver.search_tree()
-    
-    def _reset_stats(self):
-        self.start_time = time.time()
         self.closed_nodes = 0
         self.opened_nodes = 1
-        self.wall_time = 0
-        
+        self.peak_frontier = solver.frontier_size()
 
     def got_event(self, node: Node, event: NodeEvent) -> None:
         if event == NodeEvent.Closed:
             self.closed_nodes += 1
-            self.opened_nodes -= 1
+            if self.peak_frontier is not None:
+                self.peak_frontier = max(self.peak_frontier, self.solver.frontier_size())
         elif event == NodeEvent.Opened:
             self.opened_nodes += 1
-        self.wall_time = time.time() - self.start_time
-        self.print_stats()
-    
-    def _solver_name(self) -> str:
-        return self.solver.__class__.__name__
-
-    def _heuristic_name(self) -> Optional[str]:
-        if isinstance(self.solver, HeuristicSolver):
-            return self.solver.heuristic.__class__.__name__
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def execute(run: BenchmarkRun, memory_limit: Optional[float]) -> BenchmarkResult:
+    """Runs a single benchmark, supposed to be called in a separate process"""
+    if memory_limit is not None:
+        limit = int(memory_limit * 2 ** 20)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    try:
+        start_time = time.perf_counter()
+        problem = avl_problems[run.problem].load(run.instance)
+        algorithm_class = avl_algos[run.algorithm]
+        solver: Solver
+        if run.heuristic is not None:
+            heuristic = avl_heuristics[run.heuristic](problem)
+            heuristic(problem.initial)
+            solver = algorithm_class(problem, heuristic)
         else:
+            solver = algorithm_class(problem)
+        monitor = BenchmarkMonitor(solver)
+        solver.search_tree().subscribe(monitor)
+        setup_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        node = solver.solve()
+        wall_time = time.perf_counter() - start_time
+    except NotImplementedError as e:
+        return BenchmarkResult.of(run, "not implemented", error=str(e))
+    except MemoryError:
+        return BenchmarkResult.of(run, "memory limit", peak_rss_mb=peak_rss_mb())
+    except RecursionError:
+        return BenchmarkResult.of(run, "recursion limit", peak_rss_mb=peak_rss_mb())
+    except Exception as e:
+        return BenchmarkResult.of(run, "error", error=''.join(traceback.format_exception_only(type(e), e)).strip())
+
+    return BenchmarkResult.of(
+        run,
+        "solved" if node is not None else "failed",
+        cost=node.cost if node is not None else None,
+        expansions=monitor.closed_nodes,
+        generated=monitor.opened_nodes,
+        peak_frontier=monitor.peak_frontier,
+        setup_time=setup_time,
+        wall_time=wall_time,
+        nodes_per_second=monitor.closed_nodes / wall_time if wall_time > 0 else 0,
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+
+def _worker(connection: Connection, run: BenchmarkRun, memory_limit: Optional[float]) -> None:
+    connection.send(execute(run, memory_limit))
+    connection.close()
+
+
+def run_all(runs: List[BenchmarkRun], jobs: int, timeout: float, memory_limit: Optional[float],
+            longest_name: int) -> List[BenchmarkResult]:
+    """
+    Runs every benchmark in its own process, at most `jobs` at once.
+    A run exceeding the timeout is killed, so even a search stuck in a C call can't block the benchmark.
+    """
+    pending: Deque[BenchmarkRun] = deque(runs)
+    # process -> (run, connection, start time)
+    running: Dict[Process, Tuple[BenchmarkRun, Connection, float]] = {}
+    results: List[BenchmarkResult] = []
+
+    def finish(process: Process, result: BenchmarkResult):
+        del running[process]
+        process.join()
+        results.append(result)
+        print_result(result, longest_name)
+
+    while pending or running:
+        while pending and len(running) < jobs:
+            run = pending.popleft()
+            receiver, sender = Pipe(duplex=False)
+            process = Process(target=_worker, args=(sender, run, memory_limit), daemon=True)
+            process.start()
+            sender.close()
+            running[process] = (run, receiver, time.perf_counter())
+
+        wait([connection for _, connection, _ in running.values()] + [p.sentinel for p in running], timeout=0.1)
+        for process, (run, connection, start_time) in list(running.items()):
+            # checked before polling, so a process that sent the result and exited in between is not lost
+            alive = process.is_alive()
+            if connection.poll():
+                finish(process, connection.recv())
+            elif not alive:
+                finish(process, BenchmarkResult.of(run, "error", error=f"process died with exit code {process.exitcode}"))
+            elif time.perf_counter() - start_time > timeout:
+                process.kill()
+                finish(process, BenchmarkResult.of(run, "timeout", wall_time=timeout))
+    return results
+
+
+def plan_runs(problem_name: str, instances: List[str], algorithms: Optional[List[str]],
+              heuristics: Optional[List[str]]) -> List[BenchmarkRun]:
+    problem_class = avl_problems[problem_name]
+    runs = []
+    for instance in instances:
+        for algorithm_name, algorithm_class in avl_algos.items():
+            if algorithms is not None and algorithm_name not in algorithms:
+                continue
+            if not issubclass(algorithm_class, HeuristicSolver):
+                runs.append(BenchmarkRun(instance, problem_name, algorithm_name, None))
+                continue
+            for heuristic_class in sorted(problem_heuristics[problem_class], key=lambda h: h.__name__):
+                heuristic_name = camel_to_snake(heuristic_class.__name__, "Heuristic")
+                if heuristics is None or heuristic_name in heuristics:
+                    runs.append(BenchmarkRun(instance, problem_name, algorithm_name, heuristic_name))
+    return runs
+
+
+def save_results(results: List[BenchmarkResult], path: Path) -> None:
+    if path.suffix == ".csv":
+        with open(path, "w", newline="") as output_file:
+            writer = csv.DictWriter(output_file, fieldnames=[f.name for f in fields(BenchmarkResult)])
+            writer.writeheader()
+            for result in results:
+                writer.writerow(asdict(result))
+    else:
+        with open(path, "w") as output_file:
+            json.dump([asdict(result) for result in results], output_file, indent=2)
+
+
+def load_results(path: Path) -> List[BenchmarkResult]:
+    if path.suffix != ".csv":
+        with open(path) as input_file:
+            return [BenchmarkResult(**record) for record in json.load(input_file)]
+
+    types = {f.name: f.type for f in fields(BenchmarkResult)}
+
+    def parse(name: str, text: str):
+        if text == '' and types[name] in (Optional[int], Optional[float], Optional[str]):
             return None
+        if types[name] in (int, Optional[int]):
+            return int(text)
+        if types[name] in (float, Optional[float]):
+            return float(text)
+        return text
 
-    def print_stats(self):
-        algo_name = self._solver_name()
-        heur_name = self._heuristic_name()
-        solver_name = f"{algo_name}({heur_name})" if heur_name is not None else algo_name
-        print(f"\r{solver_name: >{self.longest_name}} | {self.opened_nodes:<9} | {self.closed_nodes:<9} | {self.wall_time:<8.2f} |", end='', flush=True)
-
-    def print_result(self, result: Union[str, Optional[Node]]):
-        if result is None:
-            print(" fail")
-        elif isinstance(result, str):
-            print(f" {result}")
-        else:
-            print(f" {result.cost}")
+    with open(path, newline="") as input_file:
+        return [BenchmarkResult(**{name: parse(name, text) for name, text in record.items()})
+                for record in csv.DictReader(input_file)]
+
+
+def compare(results: List[BenchmarkResult], baseline: List[BenchmarkResult], tolerance: float,
+            min_time: float = 0.05) -> List[str]:
+    """
+    Returns descriptions of the regressions: runs that are not solved anymore, solutions with a higher cost,
+    more expansions or longer time than in the baseline (by more than the tolerance, e.g. 0.2 is 20%).
+    Times shorter than `min_time` are too noisy to be compared.
+    """
+    baseline_results = {result.run.key: result for result in baseline}
+    regressions = []
+    for result in results:
+        old = baseline_results.get(result.run.key)
+        if old is None or old.status != "solved":
+            continue
+        name = f"{Path(result.instance).stem} {result.run.solver_name}"
+        if result.status != "solved":
+            regressions.append(f"{name}: {result.status} (solved in the baseline)")
+            continue
+        if result.cost is not None and old.cost is not None and result.cost > old.cost + 1e-9:
+            regressions.append(f"{name}: cost {old.cost} -> {result.cost}")
+        if result.expansions > old.expansions * (1 + tolerance):
+            regressions.append(f"{name}: expansions {old.expansions} -> {result.expansions}")
+        if max(result.wall_time, old.wall_time) >= min_time and result.wall_time > old.wall_time * (1 + tolerance):
+            regressions.append(f"{name}: time {old.wall_time:.3f}s -> {result.wall_time:.3f}s")
+    return regressions
 
-def print_header(problem_class, instance, timeout, longest_name):
+
+def print_header(problem_class, instances, timeout, memory_limit, jobs, longest_name):
     print(f"> State Search Benchmark ({VERSION})")
-    print(f"-  problem: {problem_class.__name__}")
-    print(f"- instance: {Path(instance).stem}")
-    print(f"-  timeout: {timeout}s")
-    print(f"{'solver name': >{longest_name}} | {'open': <9} | {'closed': <9} | {'time (s)': <8} | result")
-    print("-" * 110)
+    print(f"-   problem: {problem_class.__name__}")
+    print(f"- instances: {', '.join(Path(instance).stem for instance in instances)}")
+    print(f"-   timeout: {timeout}s")
+    print(f"-    memory: {f'{memory_limit}MB' if memory_limit is not None else 'unlimited'}")
+    print(f"-      jobs: {jobs}")
+    print(f"{'instance': >10} | {'solver name': >{longest_name}} | {'status': <15} | {'closed': <9} | {'frontier': <9} | {'time (s)': <8} | {'nodes/s': <9} | {'rss (MB)': <8} | result")
+    print("-" * (longest_name + 110))
+
+
+def print_result(result: BenchmarkResult, longest_name: int):
+    name = result.run.solver_name
+    cost = result.cost if result.cost is not None else result.error
+    frontier = result.peak_frontier if result.peak_frontier is not None else '-'
+    print(f"{Path(result.instance).stem: >10} | {name: >{longest_name}} | {result.status: <15} | {result.expansions:<9} | {frontier:<9} | {result.wall_time:<8.2f} | {result.nodes_per_second:<9.0f} | {result.peak_rss_mb:<8.0f} | {cost}", flush=True)
+
 
 def parse_args():
     parser = argparse.ArgumentParser(add_help=False)
-    parser.add_argument("instance", help="path to the problem instance to be solved")
-    parser.add_argument("-p", "--problem", required=True, choices=avl_problems.keys(), help="name of the problem type corresponding to the given instance")
-    parser.add_argument("-t", "--timeout", default=30.0, help="how long each algorithm is allowed to work")
+    parser.add_argument("instances", nargs="+", help="paths to the problem instances to be solved")
+    parser.add_argument("-p", "--problem", required=True, choices=avl_problems.keys(), help="name of the problem type corresponding to the given instances")
+    parser.add_argument("-a", "--algorithms", nargs="+", choices=avl_algos.keys(), help="algorithms to be benchmarked (all by default)")
+    parser.add_argument("-h", "--heuristics", nargs="+", choices=avl_heuristics.keys(), help="heuristics to be benchmarked (all applicable by default)")
+    parser.add_argument("-t", "--timeout", type=float, default=30.0, help="how long each run is allowed to work (in seconds)")
+    parser.add_argument("-m", "--memory", type=float, default=None, help="limit of the address space of each run (in MB)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="how many runs may work at once")
+    parser.add_argument("-o", "--output", type=Path, help="where to save the results (.json or .csv)")
+    parser.add_argument("-b", "--baseline", type=Path, help="results (.json or .csv) to check the new ones against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative growth of time and expansions compared to the baseline")
     return parser.parse_args()
 
+
 if __name__ == "__main__":
     args = parse_args()
-
-    instance = args.instance
     problem_class = avl_problems[args.problem]
-    timeout = args.timeout
 
-    try:
-        with open(instance) as instance_file:
-            instance_text = instance_file.read()
-            problem = problem_class.deserialize(instance_text)
-    except FileNotFoundError as e:
-        print("> Path to the instance seems to be incorrect, are you sure of it?")
-        exit(-1)
-    except Exception as e:
-        print("> Failed to load the instance, are you sure, you've chosen correct problem type?")
+    missing = [instance for instance in args.instances if not Path(instance).exists()]
+    if missing:
+        print(f"> Path to the instance seems to be incorrect, are you sure of it? ({', '.join(missing)})")
         exit(-1)
 
-    longest_name = max([len(a.__name__) + len(h.__name__) 
-                        for a in avl_algos.values()
-                        for h in problem_heuristics[problem_class]]) + 2
-    print_header(problem_class, instance, timeout, longest_name)
-    for algorithm_class in avl_algos.values():
-        algorithm : Optional[Solver] = None
-        if issubclass(algorithm_class, HeuristicSolver):
-            for heuristic_class in problem_heuristics[problem_class]:
-                solver_name = f"{algorithm_class.__name__}({heuristic_class.__name__})"
-                try:
-                    heuristic = heuristic_class(problem)
-                    heuristic(problem.initial)
-                except NotImplementedError as e:
-                    print(f"{solver_name: >{longest_name}} | heuristic is not implemented yet")
-                    continue
-                except Exception as e:
-                    print(f"{solver_name: >{longest_name}} | heuristic raised an error {e}")
-                    continue
-
-                try:
-                    algorithm = algorithm_class(problem, heuristic)
-                    solver_monitor = BenchmarkMonitor(algorithm, longest_name, timeout)
-                    solver_monitor.solve()
-                except NotImplementedError as e:
-                    print(f"{solver_name: >{longest_name}} | algorithm is not implemented yet")
-                except Exception as e:
-                    print(f"{solver_name: >{longest_name}} | algorithm raised an error {e}")
-        else:
-            solver_name = algorithm_class.__name__
-            try:
-                algorithm = algorithm_class(problem)
-                solver_monitor = BenchmarkMonitor(algorithm, longest_name, timeout)
-                solver_monitor.solve()
-            except NotImplementedError as e:
-                print(f"{solver_name: >{longest_name}} | algorithm is not implemented yet")
-            except Exception as e:
-                print(f"{solver_name: >{longest_name}} | algorithm raised an error {e}")
-
-        
-        
-    
-    
-
-        
-
-    
-    
-        
-        
-    
-
-
-    
+    runs = plan_runs(args.problem, args.instances, args.algorithms, args.heuristics)
+    longest_name = max([len(run.solver_name) for run in runs], default=0) + 2
+    print_header(problem_class, args.instances, args.timeout, args.memory, args.jobs, longest_name)
+    results = run_all(runs, args.jobs, args.timeout, args.memory, longest_name)
+    order = {run.key: i for i, run in enumerate(runs)}
+    results.sort(key=lambda result: order[result.run.key])
+
+    if args.output is not None:
+        save_results(results, args.output)
+        print(f"> results saved to {args.output}")
+
+    if args.baseline is not None:
+        regressions = compare(results, load_results(args.baseline), args.tolerance)
+        if regressions:
+            print(f"> {len(regressions)} regression(s) compared to {args.baseline}:")
+            for regression in regressions:
+                print(f"- {regression}")
+            exit(1)
+        print(f"> no regressions compared to {args.baseline}")
@@ -10,17 +10,19 @@ from problems.blocks_world.blocks_world_problem import BlocksWorldProblem
 from problems.n_puzzle.n_puzzle_problem import NPuzzleProblem
 from problems.n_puzzle.heuristics.n_puzzle_manhattan_heuristic import NPuzzleManhattanHeuristic
 from problems.n_puzzle.heuristics.n_puzzle_tiles_out_of_place_heuristic import NPuzzleTilesOutOfPlaceHeuristic
+from problems.n_puzzle.heuristics.n_puzzle_pattern_database_heuristic import NPuzzlePatternDatabaseHeuristic
 
 from problems.grid_pathfinding.grid_pathfinding import GridPathfinding
 from problems.grid_pathfinding.heuristics.manhattan_heuristic import GridManhattanHeuristic
 from problems.grid_pathfinding.heuristics.euclidean_heuristic import GridEuclideanHeuristic
 from problems.grid_pathfinding.heuristics.diagonal_heuristic import GridDiagonalHeuristic
+from problems.grid_pathfinding.heuristics.landmark_heuristic import GridLandmarkHeuristic
 from problems.rush_hour.heuristics.indirect_heuristic import RushHourIndirectHeuristic
 from problems.rush_hour.rush_hour import RushHourProblem
 from problems.rush_hour.heuristics.blocking_cars_heuristic import RushHourBlockingCarsHeuristic
 from problems.rush_hour.heuristics.distance_to_exit_heuristic import RushHourDistanceToExitHeuristic
 
-from solvers import BFS, DFSIter, DFSRecursive, Dijkstra, Greedy, AStar, IDAStar, IDDFS
+from solvers import BFS, DFSIter, DFSRecursive, Dijkstra, Greedy, AStar, IDAStar, IDDFS, BiBFS, BiAStar, JPS
 
 
 VERSION = "0.42 — Lazy Leviathan"
@@ -34,8 +36,8 @@ def camel_to_snake(camel: str, useless_suffix: str = '') -> str:
     return re.sub(r'(?<!^)(?=[A-Z])', '_', useful_camel).lower()
 
 problem_heuristics: Dict[type[Problem], Set[type[Heuristic]]] = {
-    GridPathfinding : {GridEuclideanHeuristic, GridDiagonalHeuristic, GridManhattanHeuristic},
-    NPuzzleProblem : {NPuzzleTilesOutOfPlaceHeuristic, NPuzzleManhattanHeuristic},
+    GridPathfinding : {GridEuclideanHeuristic, GridDiagonalHeuristic, GridManhattanHeuristic, GridLandmarkHeuristic},
+    NPuzzleProblem : {NPuzzleTilesOutOfPlaceHeuristic, NPuzzleManhattanHeuristic, NPuzzlePatternDatabaseHeuristic},
     RushHourProblem : {RushHourDistanceToExitHeuristic, RushHourBlockingCarsHeuristic, RushHourIndirectHeuristic},
     BlocksWorldProblem : {BlocksWorldNaiveHeuristic}
 }
@@ -44,7 +46,7 @@ avl_problems : Dict[str, type[Problem]] = { camel_to_snake(p.__name__, "Problem"
                  for p in
                  [GridPathfinding, NPuzzleProblem, RushHourProblem, BlocksWorldProblem]}
 
-avl_algos : Dict[str, type[Solver]] = { a.__name__.lower() : cast(type[Solver], a) for a in [DFSRecursive, DFSIter, BFS, Dijkstra, Greedy, AStar, IDDFS, IDAStar]}
+avl_algos : Dict[str, type[Solver]] = { a.__name__.lower() : cast(type[Solver], a) for a in [DFSRecursive, DFSIter, BFS, Dijkstra, Greedy, AStar, IDDFS, IDAStar, BiBFS, BiAStar, JPS]}
 
 all_heuristics : Set[type[Heuristic]] = set.union(*problem_heuristics.values())
 avl_heuristics : Dict[str, type[Heuristic]] = { camel_to_snake(h.__name__, "Heuristic") : cast(type[Heuristic], h) 
@@ -25,6 +25,9 @@ class BlocksWorldProblem(Problem[BlocksWorldState, BlocksWorldAction]):
 
     def is_goal(self, state: BlocksWorldState) -> bool:
         return state == self.goal
+
+    def reversed(self) -> BlocksWorldProblem:
+        return BlocksWorldProblem(self.goal, self.initial)
     
     def to_image(self, state: BlocksWorldState, size: Tuple[int, int] = (800, 800)) -> Image.Image:
         state_img = Image.new('RGB', size, color=(248, 255, 229))
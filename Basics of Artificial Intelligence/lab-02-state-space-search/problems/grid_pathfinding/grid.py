@@ -2,9 +2,14 @@ from __future__ import annotations
 from enum import Enum
 
 from base import State
+from problems.grid_pathfinding.grid_move import GridMove
 from typing import Tuple, Union, cast
 from numpy.typing import NDArray
 from dataclasses import dataclass
+from functools import cached_property
+import heapq
+from math import inf
+import numpy as np
 
 
 class GridCell(Enum):
@@ -33,17 +38,84 @@ class GridCoord(State):
 
 @dataclass(frozen=True)
 class Grid:
-    board: NDArray
+    """Board of the grid pathfinding stored as a mask of walls (walls[y, x] is True for a wall)"""
+    walls: NDArray[np.bool_]
 
     def get_cell(self, c: GridCoord) -> GridCell:
-        return cast(GridCell, self.board[c.y, c.x])
+        return GridCell.WALL if self.walls[c.y, c.x] else GridCell.EMPTY
 
     @property
     def shape(self) -> Tuple[int, int]:
-        return cast(Tuple[int, int], self.board.shape)
-    
-    def __iter__(self):
-        return iter(self.board)
+        return cast(Tuple[int, int], self.walls.shape)
+
+    @cached_property
+    def passable(self) -> bytes:
+        """
+        Flags of the not wall cells of the board surrounded by a one cell wide frame of walls, in the row major order.
+        Cell (x, y) has index (y + 1) * (width + 2) + x + 1, so neighbours of a cell never fall out of the array.
+        """
+        return np.pad(~self.walls, 1, constant_values=False).astype(np.uint8).tobytes()
+
+    @cached_property
+    def neighbours(self) -> bytes:
+        """
+        Masks of the legal moves for every cell in the row major order, i-th bit is set if i-th `GridMove`
+        leads to a not wall cell of the board without cutting a corner of a wall (see `GridMove.involved_moves`).
+        """
+        height, width = self.shape
+        free = np.pad(~self.walls, 1, constant_values=False)
+        masks = np.zeros(self.shape, dtype=np.uint8)
+        for bit, move in enumerate(GridMove):
+            legal = np.ones(self.shape, dtype=bool)
+            for involved in move.involved_moves():
+                dy, dx = involved.value
+                legal &= free[1 + dy:height + 1 + dy, 1 + dx:width + 1 + dx]
+            masks |= legal.astype(np.uint8) << bit
+        return masks.tobytes()
 
+    def padded_index(self, c: GridCoord) -> int:
+        return (c.y + 1) * (self.shape[1] + 2) + c.x + 1
+
+    def padded_coord(self, index: int) -> GridCoord:
+        y, x = divmod(index, self.shape[1] + 2)
+        return GridCoord(x - 1, y - 1)
+
+    def distances(self, source: GridCoord, diagonal_weight: float) -> NDArray[np.float64]:
+        """
+        Costs of the cheapest paths from the source to every cell (inf if the cell can't be reached),
+        using the moves of `GridPathfinding` (diagonal moves only if they don't cut corners of walls).
+        """
+        height, width = self.shape
+        row = width + 2
+        passable = self.passable
+        straight_moves = (-row, row, -1, 1)
+        # (index shift, shifts of the cells next to the corner, which must not be walls)
+        diagonal_moves = [(dy * row + dx, dy * row, dx) for dy in (-1, 1) for dx in (-1, 1)] if diagonal_weight > 0 else []
+
+        distances = [inf] * len(passable)
+        start = self.padded_index(source)
+        distances[start] = 0
+        done = bytearray(len(passable))
+        queue = [(0.0, start)]
+        while queue:
+            cost, index = heapq.heappop(queue)
+            if done[index]:
+                continue
+            done[index] = 1
+            target_cost = cost + 1.0
+            for shift in straight_moves:
+                target = index + shift
+                if passable[target] and target_cost < distances[target]:
+                    distances[target] = target_cost
+                    heapq.heappush(queue, (target_cost, target))
+            target_cost = cost + diagonal_weight
+            for shift, corner_y, corner_x in diagonal_moves:
+                target = index + shift
+                if passable[target] and target_cost < distances[target] \
+                   and passable[index + corner_y] and passable[index + corner_x]:
+                    distances[target] = target_cost
+                    heapq.heappush(queue, (target_cost, target))
+        return np.array(distances).reshape(height + 2, row)[1:-1, 1:-1]
+    
     def __getitem__(self, key):
-        return self.board[key]
\ No newline at end of file
+        return self.walls[key]
\ No newline at end of file
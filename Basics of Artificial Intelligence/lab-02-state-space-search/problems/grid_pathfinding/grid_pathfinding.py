@@ -2,7 +2,8 @@ from __future__ import annotations
 from base import Problem
 from problems.grid_pathfinding.grid import Grid, GridCell, GridCoord
 from problems.grid_pathfinding.grid_move import GridMove 
-from typing import List, Optional, Tuple
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
 import numpy as np
 from PIL import Image, ImageDraw
 
@@ -14,25 +15,19 @@ class GridPathfinding(Problem[GridCoord, GridMove]):
         self.goal = goal
         self.grid = grid
         self.diagonal_weight = diagonal_weight
+        allowed = [m for m in GridMove if diagonal_weight > 0 or m not in GridMove.diagonal_moves()]
+        # legal_moves[mask] - moves allowed by a mask from `Grid.neighbours`
+        self.legal_moves: List[List[GridMove]] = [
+            [m for bit, m in enumerate(GridMove) if mask >> bit & 1 and m in allowed]
+            for mask in range(256)]
+        self.neighbours = grid.neighbours
+        self.width = grid.shape[1]
 
     def actions(self, state: GridCoord) -> List[GridMove]:
-        return [a for a in GridMove if self.is_legal_move(state, a)]
+        return self.legal_moves[self.neighbours[state.y * self.width + state.x]]
 
     def is_legal_move(self, coord: GridCoord, move: GridMove) -> bool:
-        if move in GridMove.diagonal_moves() and self.diagonal_weight <= 0:
-            return False
-
-        for m in move.involved_moves():
-            new_coord = coord + m.value
-            if not (0 <= new_coord.x < self.grid.shape[1]):
-                return False 
-            if not (0 <= new_coord.y < self.grid.shape[0]):
-                return False
-
-            new_location = self.grid.get_cell(new_coord)
-            if new_location == GridCell.WALL:
-                return False 
-        return True
+        return move in self.actions(coord)
 
     def take_action(self, state: GridCoord, action: GridMove) -> GridCoord:
         return state + action.value
@@ -44,15 +39,16 @@ class GridPathfinding(Problem[GridCoord, GridMove]):
 
     def is_goal(self, state: GridCoord) -> bool:
         return state == self.goal
+
+    def reversed(self) -> GridPathfinding:
+        return GridPathfinding(self.grid, self.goal, self.initial, self.diagonal_weight)
     
     def to_image(self, state: GridCoord, size: Tuple[int, int]=(800, 800)) -> Image.Image:
         image = Image.new("RGB", size, (248, 255, 229))
         grid_drawer = GridDrawer(image, self.grid)
         grid_drawer.draw_grid()
-        for y, row in enumerate(self.grid):
-            for x, cell in enumerate(row):
-                if cell == GridCell.WALL:
-                    grid_drawer.draw_rectangle((x,y), fill=(31, 122, 140), padding=-grid_drawer.border)
+        for y, x in np.argwhere(self.grid.walls):
+            grid_drawer.draw_rectangle((int(x), int(y)), fill=(31, 122, 140), padding=-grid_drawer.border)
         grid_drawer.draw_circle(self.goal.x, self.goal.y, fill=(255, 100, 100))
         grid_drawer.draw_circle(state.x, state.y, (100, 100, 100))
         return image
@@ -60,29 +56,77 @@ class GridPathfinding(Problem[GridCoord, GridMove]):
 
     @staticmethod
     def deserialize(text: str) -> GridPathfinding:
-        lines = text.splitlines()
-        header = lines[0]
+        return GridPathfinding.parse(text.splitlines())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> GridPathfinding:
+        path = Path(path)
+        if path.suffix == ".scen":
+            return GridPathfinding.load_moving_ai(path)
+        with open(path) as instance_file:
+            return GridPathfinding.parse(instance_file)
+
+    @staticmethod
+    def parse(lines: Iterable[str]) -> GridPathfinding:
+        """
+        Reads the instance line by line, so the text of a big map never has to be kept in memory.
+        Every row is turned into a mask at once, as an array of its characters' codes.
+        """
+        lines = iter(lines)
+        header = next(lines)
         raw_width, raw_diagonal_weight = header.strip().split()
         width, diagonal_weight = int(raw_width), float(raw_diagonal_weight)
-        raw_grid = [l[1:] for l in lines[1:] if l.startswith("|")]
 
         start: Optional[GridCoord] = None 
         goal: Optional[GridCoord] = None
-        board = np.full((len(raw_grid), width), GridCell.EMPTY)
+        rows: List[np.ndarray] = []
+        for line in lines:
+            if not line.startswith("|"):
+                continue
+            raw_row = line[1:].rstrip("\r\n").ljust(width)[:width].encode("ascii", "replace").upper()
+            y = len(rows)
+            rows.append(np.frombuffer(raw_row, dtype=np.uint8) == ord(GridCell.WALL.value))
+            if b"S" in raw_row:
+                start = GridCoord(raw_row.rindex(b"S"), y)
+            if b"G" in raw_row:
+                goal = GridCoord(raw_row.rindex(b"G"), y)
 
-        for y, row in enumerate(raw_grid):
-            for x, cell in enumerate(row):
-                if cell.upper() == "S":
-                    start = GridCoord(x, y)
-                elif cell.upper() == "G":
-                    goal = GridCoord(x, y)
-                elif cell == GridCell.WALL.value:
-                    board[y,x] = GridCell.WALL
-        
         assert start is not None, "grid is missing a start cell 'S'"
         assert goal is not None, "grid is missing a goal cell 'G'"
-        return GridPathfinding(Grid(board), start, goal, diagonal_weight)
-
-
+        return GridPathfinding(Grid(np.array(rows).reshape(len(rows), width)), start, goal, diagonal_weight)
 
+    @staticmethod
+    def load_moving_ai(scenario_path: Union[str, Path], index: int = 0) -> GridPathfinding:
+        """
+        Loads a problem from the Moving AI Lab benchmarks (https://movingai.com/benchmarks/grids.html):
+        `index`-th scenario of the .scen file on the .map file it refers to (looked up next to the .scen file).
+        The benchmarks use octile moves without cutting corners, just like this problem with diagonal weight sqrt(2).
+        """
+        scenario_path = Path(scenario_path)
+        with open(scenario_path) as scenario_file:
+            scenarios = (line.split() for line in scenario_file if not line.startswith("version"))
+            scenario = next(s for i, s in enumerate(scenarios) if i == index)
+        # bucket, map, map width, map height, start x, start y, goal x, goal y, optimal length
+        map_name, start_x, start_y, goal_x, goal_y = scenario[1], *map(int, scenario[4:8])
+        map_path = scenario_path.parent.joinpath(Path(map_name).name)
+        return GridPathfinding(GridPathfinding.load_moving_ai_map(map_path),
+                               GridCoord(start_x, start_y), GridCoord(goal_x, goal_y), 2 ** 0.5)
 
+    @staticmethod
+    def load_moving_ai_map(path: Union[str, Path]) -> Grid:
+        """Reads a .map file row by row into a preallocated mask ('.', 'G' and 'S' cells are passable)"""
+        with open(path, "rb") as map_file:
+            header = {}
+            for line in map_file:
+                if line.strip() == b"map":
+                    break
+                key, value = line.split()
+                header[key.decode()] = value.decode()
+            height, width = int(header["height"]), int(header["width"])
+            walls = np.empty((height, width), dtype=bool)
+            passable = np.zeros(256, dtype=bool)
+            passable[list(b".GS")] = True
+            for y in range(height):
+                row = np.frombuffer(map_file.readline().rstrip(b"\r\n")[:width].ljust(width, b"@"), dtype=np.uint8)
+                walls[y] = ~passable[row]
+        return Grid(walls)
@@ -0,0 +1,50 @@
+from typing import List
+import numpy as np
+from numpy.typing import NDArray
+from base import Heuristic
+from problems.grid_pathfinding.grid_pathfinding import GridPathfinding
+from problems.grid_pathfinding.grid import GridCoord
+
+
+class GridLandmarkHeuristic(Heuristic[GridCoord]):
+    """
+    ALT heuristic (A*, landmarks, triangle inequality): exact distances from a few landmark cells to every cell
+    are precomputed, then for every landmark L: cost(state, goal) >= |dist(L, goal) - dist(L, state)|.
+    Landmarks are chosen greedily, each as far as possible from the goal and the already chosen landmarks,
+    so they end up in corners and dead ends, where walls make the geometric heuristics most optimistic.
+    Far from the landmarks the bound may be weak, so it is never lower than the distance ignoring walls.
+    """
+
+    def __init__(self, problem: GridPathfinding, landmarks: int = 4):
+        self.problem = problem
+        grid, weight = problem.grid, problem.diagonal_weight
+        closest = grid.distances(problem.goal, weight)
+        # only cells connected with the goal may be landmarks
+        closest[~np.isfinite(closest)] = -1
+        tables: List[NDArray[np.float64]] = []
+        for _ in range(landmarks):
+            y, x = np.unravel_index(np.argmax(closest), closest.shape)
+            if closest[y, x] <= 0:
+                break
+            table = grid.distances(GridCoord(int(x), int(y)), weight)
+            tables.append(table)
+            closest = np.minimum(closest, table)
+
+        # distances[y, x] - distances between the cell and all the landmarks
+        self.distances: NDArray[np.float64] = np.stack(tables, axis=-1) if tables else np.zeros(grid.shape + (1,))
+        self.goal_distances = self.distances[problem.goal.y, problem.goal.x]
+        weight = problem.diagonal_weight
+        # cost of a diagonal move, that can't be made cheaper using the straight ones
+        self.diagonal_cost = min(weight, 2.0) if weight > 0 else 2.0
+
+    def open_grid_distance(self, state: GridCoord) -> float:
+        x_dist = abs(state.x - self.problem.goal.x)
+        y_dist = abs(state.y - self.problem.goal.y)
+        if self.diagonal_cost < 1:
+            return max(x_dist, y_dist) * self.diagonal_cost
+        diagonal = min(x_dist, y_dist)
+        return x_dist + y_dist - 2 * diagonal + diagonal * self.diagonal_cost
+
+    def __call__(self, state: GridCoord) -> float:
+        landmarks_bound = float(np.abs(self.distances[state.y, state.x] - self.goal_distances).max())
+        return max(landmarks_bound, self.open_grid_distance(state))
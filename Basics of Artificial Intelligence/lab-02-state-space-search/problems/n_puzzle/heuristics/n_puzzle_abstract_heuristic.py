@@ -1,15 +1,25 @@
-from abc import ABC
-from typing import Dict, Tuple
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
 from base import Heuristic
 from problems.n_puzzle import NPuzzleState
 from problems.n_puzzle import NPuzzleProblem
 
 
-class NPuzzleAbstractHeuristic(Heuristic[NPuzzleState], ABC):
+class NPuzzleCachedHeuristic(Heuristic[NPuzzleState], ABC):
+    """
+    The value is cached in the state and a child state computes it from the value of its parent (see `update`).
+    Heuristics needing more than the parent value for the update can cache extra data with it
+    (see `evaluate_with_data` and `update_with_data`).
+    """
 
     def __init__(self, problem: NPuzzleProblem):
         self.problem = problem
         self.goal_coords = self.positions(problem.goal)
+        goal = problem.goal
+        # goal_index[tile] - index of the cell, where the tile should end up
+        self.goal_index: List[int] = [0] * (goal.nx * goal.ny)
+        for idx in range(goal.nx * goal.ny):
+            self.goal_index[goal.tile(idx)] = idx
 
     def positions(self, goal: NPuzzleState) -> Dict[int,Tuple[int,int]]:
         positions: Dict[int,Tuple[int,int]] = dict()
@@ -18,3 +28,53 @@ class NPuzzleAbstractHeuristic(Heuristic[NPuzzleState], ABC):
                 if cell != 0:
                     positions[cell] = (x,y)
         return positions
+
+    @abstractmethod
+    def evaluate(self, state: NPuzzleState) -> float:
+        """Computes the heuristic from scratch"""
+
+    def update(self, state: NPuzzleState, parent_value: float) -> float:
+        """Computes the heuristic from the value of the parent state"""
+        return self.evaluate(state)
+
+    def evaluate_with_data(self, state: NPuzzleState) -> Tuple[float, Any]:
+        """Computes the heuristic from scratch, together with the data cached for updating the children"""
+        return self.evaluate(state), None
+
+    def update_with_data(self, state: NPuzzleState, parent_value: float, parent_data: Any) -> Tuple[float, Any]:
+        """Computes the heuristic and the cached data from the ones of the parent state"""
+        return self.update(state, parent_value), None
+
+    def __call__(self, state: NPuzzleState) -> float:
+        if state.heuristic_value is not None and state.heuristic_value[0] is self:
+            return state.heuristic_value[1]
+        inherited = state.parent_heuristic_value
+        if inherited is not None and inherited[0] is self:
+            value, data = self.update_with_data(state, inherited[1], inherited[2])
+        else:
+            value, data = self.evaluate_with_data(state)
+        state.heuristic_value = (self, value, data)
+        state.parent_heuristic_value = None
+        return value
+
+
+class NPuzzleAbstractHeuristic(NPuzzleCachedHeuristic, ABC):
+    """
+    Sum of per tile values (see `tile_value`), so a child state looks only at the moved tile.
+    """
+
+    @abstractmethod
+    def tile_value(self, tile: int, idx: int) -> float:
+        """Returns contribution of the (non blank) tile placed in the cell with given index"""
+
+    def evaluate(self, state: NPuzzleState) -> float:
+        return sum(self.tile_value(state.tile(idx), idx)
+                   for idx in range(state.nx * state.ny)
+                   if idx != state.blank)
+
+    def update(self, state: NPuzzleState, parent_value: float) -> float:
+        # the moved tile went from the current blank cell to the previous one
+        tile = state.tile(state.previous_blank)
+        return parent_value \
+            - self.tile_value(tile, state.blank) \
+            + self.tile_value(tile, state.previous_blank)
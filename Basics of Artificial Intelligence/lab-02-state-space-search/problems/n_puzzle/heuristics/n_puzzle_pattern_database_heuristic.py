@@ -0,0 +1,63 @@
+from typing import List, Optional, Tuple
+from problems.n_puzzle import NPuzzleProblem, NPuzzleState
+from problems.n_puzzle.heuristics.n_puzzle_abstract_heuristic import NPuzzleCachedHeuristic
+from problems.n_puzzle.heuristics.pattern_database import PatternDatabase
+
+# size of the BFS table (cells ** (group size + 1)) the default groups are limited to
+MAX_BFS_TABLE_SIZE = 2 ** 24
+
+
+class NPuzzlePatternDatabaseHeuristic(NPuzzleCachedHeuristic):
+    """
+    Sum of disjoint (additive) pattern databases. By default tiles are split, in the goal order,
+    into equal groups as big as the build allows (5-5-5 for the 15-puzzle, 4-4 for the 8-puzzle).
+    Table indices of all the groups are cached with the value, so a child updates only the index of the moved tile.
+    """
+
+    def __init__(self, problem: NPuzzleProblem, groups: Optional[List[List[int]]] = None):
+        super().__init__(problem)
+        goal = problem.goal
+        self.groups = groups or self.default_groups(goal)
+        self.databases = [PatternDatabase(goal, group) for group in self.groups]
+        # group_of[tile] - index of the database containing the tile, weight_of[tile] - its digit in the table index
+        self.group_of = [-1] * (goal.nx * goal.ny)
+        self.weight_of = [0] * (goal.nx * goal.ny)
+        for group_idx, (group, database) in enumerate(zip(self.groups, self.databases)):
+            for tile, weight in zip(group, database.weights):
+                self.group_of[tile] = group_idx
+                self.weight_of[tile] = weight
+
+    @staticmethod
+    def default_groups(goal: NPuzzleState) -> List[List[int]]:
+        cells = goal.nx * goal.ny
+        tiles = [goal.tile(idx) for idx in range(cells) if idx != goal.blank]
+        max_size = 1
+        while cells ** (max_size + 2) <= MAX_BFS_TABLE_SIZE:
+            max_size += 1
+        n_groups = -(-len(tiles) // max_size)
+        size = -(-len(tiles) // n_groups)
+        return [tiles[i:i + size] for i in range(0, len(tiles), size)]
+
+    def evaluate(self, state: NPuzzleState) -> float:
+        return self.evaluate_with_data(state)[0]
+
+    def evaluate_with_data(self, state: NPuzzleState) -> Tuple[float, Tuple[int, ...]]:
+        positions = [0] * (state.nx * state.ny)
+        for idx in range(state.nx * state.ny):
+            positions[state.tile(idx)] = idx
+        indices = tuple(database.index([positions[tile] for tile in group])
+                        for group, database in zip(self.groups, self.databases))
+        return sum(database[index] for index, database in zip(indices, self.databases)), indices
+
+    def update_with_data(self, state: NPuzzleState, parent_value: float,
+                         parent_indices: Tuple[int, ...]) -> Tuple[float, Tuple[int, ...]]:
+        # the moved tile went from the current blank cell to the previous one
+        tile = state.tile(state.previous_blank)
+        group_idx = self.group_of[tile]
+        if group_idx < 0:
+            return parent_value, parent_indices
+        database = self.databases[group_idx]
+        parent_index = parent_indices[group_idx]
+        index = parent_index + (state.previous_blank - state.blank) * self.weight_of[tile]
+        indices = parent_indices[:group_idx] + (index,) + parent_indices[group_idx + 1:]
+        return parent_value - database[parent_index] + database[index], indices
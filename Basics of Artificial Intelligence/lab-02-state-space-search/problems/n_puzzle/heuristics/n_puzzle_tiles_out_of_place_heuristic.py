@@ -1,15 +1,8 @@
-from problems.n_puzzle import NPuzzleState
 from problems.n_puzzle.heuristics.n_puzzle_abstract_heuristic import NPuzzleAbstractHeuristic
 
 
-
 class NPuzzleTilesOutOfPlaceHeuristic(NPuzzleAbstractHeuristic):
 
-    def __call__(self, state: NPuzzleState) -> float:
-        # TODO:
-        # Calculate how many tiles are not on their expected positions
-        # tip 1.'state' is the current state, 
-        # tip 2. you can use self.positions function to get from it a dictionary:
-        #   { tile_number : (x_coordinate, y_coordinate) }
-        # tip 3. self.goal_coords contains such a dictionary for the goal state
-        raise NotImplementedError()
\ No newline at end of file
+    def tile_value(self, tile: int, idx: int) -> float:
+        # 1 if the tile is not on its expected position
+        return 0 if self.goal_index[tile] == idx else 1
@@ -0,0 +1,107 @@
+from __future__ import annotations
+import hashlib
+import os
+from pathlib import Path
+from typing import List
+
+import numpy as np
+from numpy.typing import NDArray
+
+from problems.n_puzzle import NPuzzleState
+
+DATABASES_DIR = Path(__file__).parent.joinpath("pattern_databases")
+UNREACHABLE = 255
+
+
+class PatternDatabase:
+    """
+    Exact number of moves of the given tiles needed to put them on their goal positions,
+    for every placement of these tiles (moves of other tiles are free).
+    Databases of disjoint groups of tiles can be added.
+
+    The table is indexed by positions of the tiles, written in base `cells` (first tile is the least significant digit).
+    It is built once per goal and group by a retrograde BFS and cached as a raw uint8 file, opened with np.memmap.
+    """
+
+    def __init__(self, goal: NPuzzleState, tiles: List[int], directory: Path = DATABASES_DIR):
+        self.tiles = tiles
+        self.cells = goal.nx * goal.ny
+        self.weights = [self.cells ** i for i in range(len(tiles))]
+        key = f"{goal.nx}x{goal.ny}:{goal.tiles}:{'-'.join(map(str, tiles))}"
+        path = directory.joinpath(f"{hashlib.sha1(key.encode()).hexdigest()[:16]}.pdb")
+        if not path.exists():
+            directory.mkdir(parents=True, exist_ok=True)
+            self._save(self._build(goal), path)
+        self.table: NDArray[np.uint8] = np.memmap(path, dtype=np.uint8, mode='r')
+
+    def __getitem__(self, index: int) -> int:
+        return int(self.table[index])
+
+    def index(self, positions: List[int]) -> int:
+        """Returns index in the table for the positions of the database tiles"""
+        return sum(position * weight for position, weight in zip(positions, self.weights))
+
+    @staticmethod
+    def _save(table: NDArray[np.uint8], path: Path) -> None:
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        stored = np.memmap(tmp_path, dtype=np.uint8, mode='w+', shape=table.shape)
+        stored[:] = table
+        stored.flush()
+        del stored
+        os.replace(tmp_path, path)
+
+    def _build(self, goal: NPuzzleState) -> NDArray[np.uint8]:
+        """
+        0-1 BFS from the goal over abstract states (blank position, positions of the tiles).
+        Blank moves over other tiles cost 0, moving one of the database tiles costs 1.
+        Abstract state is encoded as blank + cells * (index of tiles positions), so distances are finally
+        minimized over the blank position.
+        """
+        cells, nx, ny = self.cells, goal.nx, goal.ny
+        k = len(self.tiles)
+        digits = np.array([cells ** i for i in range(k + 1)], dtype=np.int64)
+        goal_index = {goal.tile(idx): idx for idx in range(cells)}
+        assert all(tile in goal_index for tile in self.tiles), "pattern database tiles should be present in the goal"
+        goal_positions = [goal_index[tile] for tile in self.tiles]
+
+        distances = np.full(cells ** (k + 1), UNREACHABLE, dtype=np.uint8)
+        start = np.array([goal.blank + cells * self.index(goal_positions)], dtype=np.int64)
+        distances[start] = 0
+
+        def neighbours(codes: NDArray[np.int64]):
+            """Yields (neighbour codes, if database tile was moved) for every blank move"""
+            state = (codes[:, np.newaxis] // digits) % cells
+            blank, positions = state[:, 0], state[:, 1:]
+            row, col = blank // ny, blank % ny
+            for valid, shift in ((row > 0, -ny), (row < nx - 1, ny), (col > 0, -1), (col < ny - 1, 1)):
+                moved_blank = blank + shift
+                hits = positions == moved_blank[:, np.newaxis]
+                # the tile on the target cell goes to the previous position of the blank
+                swap = (hits * digits[1:] * (blank - moved_blank)[:, np.newaxis]).sum(axis=1)
+                neighbour = codes + shift + swap
+                yield neighbour[valid], hits.any(axis=1)[valid]
+
+        level, distance = start, 0
+        while level.size > 0:
+            # close the level under free moves
+            frontier, closed = level, [level]
+            while frontier.size > 0:
+                found = []
+                for neighbour, moved_tile in neighbours(frontier):
+                    neighbour = neighbour[~moved_tile]
+                    found.append(neighbour[distances[neighbour] == UNREACHABLE])
+                frontier = np.unique(np.concatenate(found))
+                distances[frontier] = distance
+                closed.append(frontier)
+            level = np.concatenate(closed)
+
+            distance += 1
+            assert distance < UNREACHABLE, "pattern database distances do not fit in uint8"
+            found = []
+            for neighbour, moved_tile in neighbours(level):
+                neighbour = neighbour[moved_tile]
+                found.append(neighbour[distances[neighbour] == UNREACHABLE])
+            level = np.unique(np.concatenate(found))
+            distances[level] = distance
+
+        return distances.reshape(-1, cells).min(axis=1)
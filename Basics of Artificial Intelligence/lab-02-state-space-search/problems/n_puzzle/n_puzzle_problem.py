@@ -5,7 +5,6 @@ from PIL import Image
 from base import Problem
 from problems.n_puzzle import NPuzzleState
 from typing import List, Tuple, Set
-from copy import deepcopy
 
 from problems.n_puzzle.n_puzzle_action import NPuzzleAction
 
@@ -24,12 +23,7 @@ class NPuzzleProblem(Problem[NPuzzleState, NPuzzleAction]):
     def take_action(self, state: NPuzzleState, action: NPuzzleAction) -> NPuzzleState:
         shift_x, shift_y = action.value
         if self.valid(state.x+shift_x, state.y+shift_y, state.nx, state.ny):
-            state2 = deepcopy(state)
-            state2.matrix[state2.x][state2.y] = state2.matrix[state2.x+shift_x][state2.y+shift_y]
-            state2.matrix[state2.x+shift_x][state2.y+shift_y] = state.matrix[state.x][state.y]
-            state2.x = state2.x + shift_x
-            state2.y = state2.y + shift_y
-            return state2
+            return state.move_blank(state.blank + shift_x * state.ny + shift_y)
 
         raise Exception("Illegal action")
 
@@ -39,7 +33,11 @@ class NPuzzleProblem(Problem[NPuzzleState, NPuzzleAction]):
 
 
     def is_goal(self, state: NPuzzleState) -> bool:
-        return self.goal.matrix == state.matrix
+        return self.goal.tiles == state.tiles
+
+
+    def reversed(self) -> NPuzzleProblem:
+        return NPuzzleProblem(self.goal, self.initial)
 
 
     def valid(self, x: int, y: int, nx: int, ny: int) -> bool:
@@ -112,6 +110,6 @@ class NPuzzleProblem(Problem[NPuzzleState, NPuzzleAction]):
         assert init_numbers == goal_numbers, \
             "the n-puzzle init and goal states should share the same numbers"
 
-        ix, iy = zero_coords(initial)
-        gx, gy = zero_coords(goal)
-        return NPuzzleProblem(NPuzzleState(initial, ix, iy), NPuzzleState(goal, gx, gy))
+        zero_coords(initial)
+        zero_coords(goal)
+        return NPuzzleProblem(NPuzzleState.from_matrix(initial), NPuzzleState.from_matrix(goal))
@@ -1,28 +1,72 @@
+from __future__ import annotations
 from base import State
-from typing import List
+from typing import Any, List, Optional, Tuple
 
 
 class NPuzzleState(State):
-    def __init__(self, matrix: List[List[int]], x: int, y: int):
+    """
+    Board packed into a single int, `bits` per tile in row-major order (4 bits for the 15-puzzle).
+    The blank (0) is kept as the index of its cell, so moving it takes O(1).
+    """
+    __slots__ = ('tiles', 'blank', 'nx', 'ny', 'bits', '_hash',
+                 'heuristic_value', 'parent_heuristic_value', 'previous_blank')
+
+    def __init__(self, tiles: int, blank: int, nx: int, ny: int):
         super().__init__()
-        self.matrix = matrix
-        self.x = x
-        self.y = y
-        self.nx = len(self.matrix)
-        self.ny = len(self.matrix[0])
+        self.tiles = tiles
+        self.blank = blank
+        self.nx = nx
+        self.ny = ny
+        self.bits = max(4, (nx * ny - 1).bit_length())
+        self._hash = hash(tiles)
+        # (heuristic, value, data) cached by NPuzzleCachedHeuristic,
+        # children inherit it from the parent to update it only for the moved tile
+        self.heuristic_value: Optional[Tuple[Any, float, Any]] = None
+        self.parent_heuristic_value: Optional[Tuple[Any, float, Any]] = None
+        self.previous_blank: Optional[int] = None
+
+    @staticmethod
+    def from_matrix(matrix: List[List[int]]) -> NPuzzleState:
+        nx, ny = len(matrix), len(matrix[0])
+        bits = max(4, (nx * ny - 1).bit_length())
+        cells = [cell for row in matrix for cell in row]
+        tiles = 0
+        for idx, cell in enumerate(cells):
+            tiles |= cell << (idx * bits)
+        return NPuzzleState(tiles, cells.index(0), nx, ny)
+
+    def tile(self, idx: int) -> int:
+        return (self.tiles >> (idx * self.bits)) & ((1 << self.bits) - 1)
+
+    def move_blank(self, to: int) -> NPuzzleState:
+        """Returns a new state with the blank swapped with the tile at index `to`"""
+        tile = self.tile(to)
+        tiles = self.tiles - (tile << (to * self.bits)) + (tile << (self.blank * self.bits))
+        child = NPuzzleState(tiles, to, self.nx, self.ny)
+        child.parent_heuristic_value = self.heuristic_value
+        child.previous_blank = self.blank
+        return child
+
+    @property
+    def x(self) -> int:
+        return self.blank // self.ny
+
+    @property
+    def y(self) -> int:
+        return self.blank % self.ny
+
+    @property
+    def matrix(self) -> List[List[int]]:
+        return [[self.tile(i * self.ny + j) for j in range(self.ny)] for i in range(self.nx)]
 
     def __hash__(self):
-        return hash(tuple([tuple(l) for l in self.matrix]))
+        return self._hash
 
     def __str__(self) -> str:
         s = "\n"
-        for i in range(self.nx):
-            for j in range(self.ny):
-                if j == self.ny - 1:
-                    s += ''.join(f"{self.matrix[i][j]}\n")
-                else:
-                    s += ''.join(f"{self.matrix[i][j]} ")
+        for row in self.matrix:
+            s += ' '.join(str(cell) for cell in row) + "\n"
         return s
 
     def __eq__(self, other):
-        return self.matrix == other.matrix
+        return isinstance(other, NPuzzleState) and self.tiles == other.tiles
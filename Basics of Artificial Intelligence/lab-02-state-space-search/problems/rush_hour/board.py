@@ -1,28 +1,116 @@
+from __future__ import annotations
 import numpy as np
-from typing import Set, Tuple
-from problems.rush_hour.vehicle import RushHourVehicle
+from typing import Dict, List, Optional, Set, Tuple
+from problems.rush_hour.vehicle import Orientation, RushHourVehicle
+from problems.rush_hour.rush_hour_action import Direction, VehicleShift
 from base import State
 
 
-class RushHourBoard(State):
-    def __init__(self, vehicles: Set[RushHourVehicle], shape:Tuple[int,int] = (6,6)):
-        self.vehicles = vehicles
+class RushHourLayout:
+    """
+    Part of the board that doesn't change between states: vehicles (in a fixed order), their lanes
+    and bit masks. Cell (x, y) is the bit y * width + x, the variable coordinate of a vehicle
+    (x for horizontal, y for vertical ones) is called its position.
+    """
+
+    def __init__(self, vehicles: List[RushHourVehicle], shape: Tuple[int, int]):
         self.shape = shape
+        height, width = shape
+        self.vehicles = vehicles
+        self.index: Dict[str, int] = {vehicle.id: i for i, vehicle in enumerate(vehicles)}
+        # masks[i][position] - cells covered by the i-th vehicle,
+        # before/after[i][position] - the cell the vehicle moves onto going backward/forward (0 if off the board)
+        self.masks: List[List[int]] = []
+        self.before: List[List[int]] = []
+        self.after: List[List[int]] = []
+        # shifts[i] - (backward, forward) actions of the i-th vehicle
+        self.shifts: List[Tuple[VehicleShift, VehicleShift]] = []
+        # steps[action] - (vehicle index, position change)
+        self.steps: Dict[VehicleShift, Tuple[int, int]] = {}
+        for i, vehicle in enumerate(vehicles):
+            if vehicle.orientation == Orientation.HORIZONTAL:
+                limit, stride, lane_offset = width, 1, vehicle.y * width
+                backward, forward = Direction.LEFT, Direction.RIGHT
+            else:
+                limit, stride, lane_offset = height, width, vehicle.x
+                backward, forward = Direction.UP, Direction.DOWN
+
+            def cell(position: int) -> int:
+                return 1 << (lane_offset + position * stride) if 0 <= position < limit else 0
+
+            positions = range(limit - vehicle.length + 1)
+            self.masks.append([sum(cell(p + k) for k in range(vehicle.length)) for p in positions])
+            self.before.append([cell(p - 1) for p in positions])
+            self.after.append([cell(p + vehicle.length) for p in positions])
+            self.shifts.append((VehicleShift(backward, vehicle.id), VehicleShift(forward, vehicle.id)))
+            self.steps[self.shifts[i][0]] = (i, -1)
+            self.steps[self.shifts[i][1]] = (i, 1)
+
+    def position(self, vehicle: RushHourVehicle) -> int:
+        return vehicle.x if vehicle.orientation == Orientation.HORIZONTAL else vehicle.y
+
+    def vehicle_at(self, i: int, position: int) -> RushHourVehicle:
+        vehicle = self.vehicles[i]
+        if vehicle.orientation == Orientation.HORIZONTAL:
+            return RushHourVehicle(vehicle.id, position, vehicle.y, vehicle.orientation, vehicle.length)
+        return RushHourVehicle(vehicle.id, vehicle.x, position, vehicle.orientation, vehicle.length)
+
+
+class RushHourBoard(State):
+    """
+    Bitboard: positions of the vehicles (ordered as in the layout) and an occupancy mask of the whole board
+    """
+    __slots__ = ('layout', 'positions', 'occupancy', '_hash', '_vehicles')
+
+    def __init__(self, layout: RushHourLayout, positions: Tuple[int, ...], occupancy: Optional[int] = None):
+        self.layout = layout
+        self.positions = positions
+        if occupancy is None:
+            occupancy = 0
+            for i, position in enumerate(positions):
+                occupancy |= layout.masks[i][position]
+        self.occupancy = occupancy
+        self._hash = hash(positions)
+        self._vehicles: Optional[Set[RushHourVehicle]] = None
 
+    @staticmethod
+    def from_vehicles(vehicles: List[RushHourVehicle], shape: Tuple[int, int] = (6, 6)) -> RushHourBoard:
+        layout = RushHourLayout(vehicles, shape)
+        return RushHourBoard(layout, tuple(layout.position(vehicle) for vehicle in vehicles))
+
+    def moved(self, i: int, step: int) -> RushHourBoard:
+        """Returns a new board with the i-th vehicle shifted by step (-1 or 1)"""
+        position = self.positions[i]
+        masks = self.layout.masks[i]
+        positions = self.positions[:i] + (position + step,) + self.positions[i + 1:]
+        return RushHourBoard(self.layout, positions,
+                             self.occupancy ^ masks[position] ^ masks[position + step])
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.layout.shape
+
+    @property
+    def vehicles(self) -> Set[RushHourVehicle]:
+        if self._vehicles is None:
+            self._vehicles = {self.layout.vehicle_at(i, position)
+                              for i, position in enumerate(self.positions)}
+        return self._vehicles
+
+    def vehicle(self, id: str) -> RushHourVehicle:
+        i = self.layout.index[id]
+        return self.layout.vehicle_at(i, self.positions[i])
 
     def get_board(self):
         board = np.full(self.shape, ' ')
         for vehicle in self.vehicles:
             x, y = vehicle.x, vehicle.y
             xEnd, yEnd = vehicle.xEnd, vehicle.yEnd
-            # assert (board[y:yEnd+1, x:xEnd+1] == ' ').all(), f"Vehicle {vehicle.id} can't be place on another"
             board[y:yEnd+1, x:xEnd+1] = vehicle.id
         return board
 
-
     def __hash__(self):
-        return hash(self.__str__())
-
+        return self._hash
 
     def __str__(self) -> str:
         s = '\n'
@@ -30,11 +118,5 @@ class RushHourBoard(State):
             s += ''.join(line) + '\n'
         return s
 
-
     def __eq__(self, other):
-        return (self.get_board() == other.get_board()).all()     
-
-
-
-
-    
\ No newline at end of file
+        return isinstance(other, RushHourBoard) and self.positions == other.positions
@@ -8,14 +8,21 @@ from base import Heuristic
 class RushHourBlockingCarsHeuristic(Heuristic[RushHourBoard]):
     def __init__(self, problem: RushHourProblem) -> None:
         super().__init__(problem)
+        layout = problem.initial.layout
+        self.target = layout.index['X']
+        self.vertical = [i for i, vehicle in enumerate(layout.vehicles)
+                         if vehicle.orientation == Orientation.VERTICAL]
 
     def __call__(self, board: RushHourBoard) -> float:
-        target_vehicle = [vehicle for vehicle in board.vehicles if vehicle.id == 'X'][0]
+        target_vehicle = board.vehicle('X')
         if target_vehicle.x == 4:
             return 0
-        blockingcars = 0
-        for vehicle in board.vehicles:
-            if vehicle.orientation == Orientation.VERTICAL and vehicle.x > target_vehicle.xEnd and vehicle.y <= target_vehicle.y and vehicle.yEnd >= target_vehicle.y:
-                blockingcars += 1
+        # cells of the target row to the right of the target vehicle
+        width = board.shape[1]
+        row_start = target_vehicle.y * width
+        lane = ((1 << width) - 1) << row_start
+        ahead = lane & ~((1 << (row_start + target_vehicle.xEnd + 1)) - 1)
+        masks = board.layout.masks
+        blockingcars = sum(1 for i in self.vertical if masks[i][board.positions[i]] & ahead)
         distance = board.shape[1] - (target_vehicle.xEnd)
         return blockingcars + distance
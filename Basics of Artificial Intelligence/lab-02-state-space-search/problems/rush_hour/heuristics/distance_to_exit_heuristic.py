@@ -8,6 +8,6 @@ class RushHourDistanceToExitHeuristic(Heuristic[RushHourBoard]):
         super().__init__(problem)
 
     def __call__(self, board: RushHourBoard) -> float:
-        target_vehicle = [vehicle for vehicle in board.vehicles if vehicle.id == 'X'][0]
+        target_vehicle = board.vehicle('X')
         distance = board.shape[1] - (target_vehicle.xEnd)
         return distance
@@ -29,7 +29,7 @@ class RushHourIndirectHeuristic(Heuristic[RushHourBoard]):
             to_bot += len(bot_blocking_vhs)
             return min(to_top, to_bot)
 
-        target_vehicle = [v for v in board.vehicles if v.id == 'X'][0]
+        target_vehicle = board.vehicle('X')
         if target_vehicle.x == 4:
             return 0
         blocking_vehicles = [v for v in board.vehicles 
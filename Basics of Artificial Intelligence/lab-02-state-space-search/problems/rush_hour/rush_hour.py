@@ -13,38 +13,28 @@ from utils.pil_utils import GridDrawer
 
 
 class RushHourProblem(Problem[RushHourBoard, VehicleShift]):
-    def __init__(self, vehicles: Set[RushHourVehicle], initial: RushHourBoard, goal: RushHourVehicle = RushHourVehicle('X', 4, 2, Orientation.HORIZONTAL)):
+    def __init__(self, vehicles: List[RushHourVehicle], initial: RushHourBoard, goal: RushHourVehicle = RushHourVehicle('X', 4, 2, Orientation.HORIZONTAL)):
         super().__init__(initial)
         self.goal = goal
         self.vehicles = vehicles
+        self._goal_index = initial.layout.index[goal.id]
+        self._goal_position = initial.layout.position(goal)
 
 
     def actions(self, board: RushHourBoard) -> List[VehicleShift]:
-
-        shifts = {
-            Orientation.VERTICAL: [Direction.UP, Direction.DOWN],
-            Orientation.HORIZONTAL: [Direction.LEFT, Direction.RIGHT]
-        }
-
-        matrix = board.get_board()
-        actions = [VehicleShift(shift, vehicle.id)
-                   for vehicle in board.vehicles 
-                   for shift in shifts[vehicle.orientation]
-                   if self.is_valid_move(matrix, vehicle, shift)]
+        layout, occupancy = board.layout, board.occupancy
+        actions = []
+        for i, position in enumerate(board.positions):
+            before, after = layout.before[i][position], layout.after[i][position]
+            if before and not occupancy & before:
+                actions.append(layout.shifts[i][0])
+            if after and not occupancy & after:
+                actions.append(layout.shifts[i][1])
         return actions
 
 
     def take_action(self, board: RushHourBoard, action: VehicleShift) -> RushHourBoard:
-        for vehicle in board.vehicles:
-            if vehicle.id == action.vehicle_id:
-                y = vehicle.y + action.shift.value[0]
-                x = vehicle.x + action.shift.value[1]
-                new_vehicle = RushHourVehicle(vehicle.id, x, y, vehicle.orientation, vehicle.length)
-                new_vehicles = deepcopy(board.vehicles)
-                new_vehicles.remove(vehicle)
-                new_vehicles.add(new_vehicle)
-                new_board = RushHourBoard(new_vehicles, board.shape)
-        return new_board
+        return board.moved(*board.layout.steps[action])
 
 
     def action_cost(self, board: RushHourBoard, action: VehicleShift, new_board: RushHourBoard) -> float:
@@ -52,21 +42,12 @@ class RushHourProblem(Problem[RushHourBoard, VehicleShift]):
 
 
     def is_goal(self, board: RushHourBoard) -> bool:
-        return self.goal in board.vehicles
+        return board.positions[self._goal_index] == self._goal_position
 
 
     def on_board(self, x: int, y: int) -> bool:
-        board = self.initial.get_board()
-        return 0 <= x < board.shape[1] and 0 <= y < board.shape[0]
-
-
-    def is_valid_move(self, matrix, vehicle: RushHourVehicle, shift: Direction):
-        y, x = shift.value
-        if self.on_board(vehicle.x+x, vehicle.y+y) and (shift == Direction.UP or Direction.LEFT) and matrix[vehicle.y+y, vehicle.x+x] == ' ':
-            return True
-        if self.on_board(vehicle.xEnd+x, vehicle.yEnd+y) and (shift == Direction.DOWN or Direction.RIGHT) and matrix[vehicle.yEnd+y, vehicle.xEnd+x] == ' ':
-            return True  
-        return False
+        height, width = self.initial.shape
+        return 0 <= x < width and 0 <= y < height
 
     def to_image(self, board: RushHourBoard, size: Tuple[int, int] = (800, 800)) -> Image.Image:
         background_color = (248, 255, 229)
@@ -122,8 +103,8 @@ class RushHourProblem(Problem[RushHourBoard, VehicleShift]):
                 vehicles[v] = RushHourVehicle(v, x, y, Orientation.VERTICAL, len(dy))
         
         
-        initial_vehicles = set(vehicles.values())
-        initial = RushHourBoard(initial_vehicles, cast(Tuple[int,int], board.shape))
+        initial_vehicles = list(vehicles.values())
+        initial = RushHourBoard.from_vehicles(initial_vehicles, cast(Tuple[int,int], board.shape))
         goal = deepcopy(vehicles["X"])
         goal.x = width - vehicles["X"].length
 
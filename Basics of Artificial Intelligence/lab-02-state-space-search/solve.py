@@ -87,8 +87,9 @@ class SolvingMonitor(NodeEventSubscriber, Solver):
         imgs = []
 
         path_limit = 1000
-        if len(result.path()) < path_limit:
-            for node in result.path():
+        path = result.path()
+        if len(path) < path_limit:
+            for node in path:
                 imgs.append(self.solver.problem.to_image(node.state))
             imgs[0].save(img_name, save_all=True, append_images=imgs[1:], format='GIF', optimize=False, duration=500, loop=1)
         else:
@@ -117,9 +118,7 @@ if __name__ == "__main__":
     algorithm_class = avl_algos[args.algorithm]
 
     try:
-        with open(instance) as instance_file:
-            instance_text = instance_file.read()
-            problem = problem_class.deserialize(instance_text)
+        problem = problem_class.load(instance)
     except FileNotFoundError as e:
         print("> Path to the instance seems to be incorrect, are you sure of it?")
         exit(-1)
@@ -128,22 +127,29 @@ if __name__ == "__main__":
         exit(-1)
 
     algorithm : Optional[Solver] = None
-    if issubclass(algorithm_class, HeuristicSolver):
-        if not args.heuristic:
-            print("> Chosen algorithm requires a heuristic, please specify it!")
-            exit(-1)
+    try:
+        if issubclass(algorithm_class, HeuristicSolver):
+            if not args.heuristic:
+                print("> Chosen algorithm requires a heuristic, please specify it!")
+                exit(-1)
 
-        heuristic_class = avl_heuristics[args.heuristic]
+            heuristic_class = avl_heuristics[args.heuristic]
+
+            if heuristic_class not in problem_heuristics[problem_class]:
+                print("> Chosen heuristic doesn't apply to the given problem. Choose another!")
+                print("> Lifehack: names of heuristics and related problems are pretty similar :)")
+                exit(-1)
+
+            algorithm = algorithm_class(problem, heuristic_class(problem))
+        else:
+            algorithm = algorithm_class(problem)
+    except NotImplementedError as e:
+        # e.g. bidirectional search of a problem that can't be reversed or JPS outside of the grid
+        print("> Chosen algorithm doesn't apply to the given problem. Choose another!")
+        if str(e):
+            print(f"> {e}")
+        exit(-1)
 
-        if heuristic_class not in problem_heuristics[problem_class]:
-            print("> Chosen heuristic doesn't apply to the given problem. Choose another!")
-            print("> Lifehack: names of heuristics and related problems are pretty similar :)")
-            exit(-1)
-        
-        algorithm = algorithm_class(problem, heuristic_class(problem))
-    else:
-        algorithm = algorithm_class(problem)
-    
     assert algorithm is not None
     solver_monitor = SolvingMonitor(algorithm, instance)
     solver_monitor.solve()
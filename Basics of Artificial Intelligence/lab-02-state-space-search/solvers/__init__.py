@@ -6,5 +6,8 @@ from solvers.greedy import Greedy
 from solvers.astar import AStar
 from solvers.idastar import IDAStar
 from solvers.iddfs import IDDFS 
+from solvers.bidirectional_bfs import BiBFS
+from solvers.bidirectional_astar import BiAStar
+from solvers.jps import JPS
 
 
@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import Optional, Tuple
 from base.heuristic import Heuristic
 from base.solver import HeuristicSolver
 from solvers.generic.best_first import BestFirstSearch
+from solvers.utils import CachedHeuristic
 from tree.tree import Tree
 from tree.node import Node
 
@@ -9,12 +10,19 @@ from tree.node import Node
 class AStar(HeuristicSolver):
     def __init__(self, problem, heuristic):
         super().__init__(problem, heuristic)
-        self.search = BestFirstSearch(problem, lambda node: node.cost + heuristic(node.state))
+        self.cached_heuristic = CachedHeuristic(heuristic)
+        self.search = BestFirstSearch(problem, self._priority)
+
+    def _priority(self, node: Node) -> Tuple[float, float]:
+        # among nodes with the same f cost prefer the ones closer to the goal
+        h = self.cached_heuristic(node.state)
+        return node.cost + h, h
 
     def solve(self) -> Optional[Node]:
         return self.search.solve()
 
     def search_tree(self) -> Tree:
         return self.search.tree
-        
-        
\ No newline at end of file
+
+    def frontier_size(self) -> Optional[int]:
+        return len(self.search.frontier)
@@ -0,0 +1,66 @@
+from math import inf
+from typing import Optional, Tuple
+from base.heuristic import Heuristic
+from base.solver import HeuristicSolver
+from solvers.generic.bidirectional import BidirectionalSearch
+from solvers.utils import CachedHeuristic, PriorityQueue
+from tree import Node, Tree
+
+
+class BiAStar(HeuristicSolver):
+    """
+    Bidirectional A* meeting in the middle (the MM algorithm by Holte et al.).
+    Nodes are prioritized by max(f, 2g), so neither search goes past the middle of the optimal path,
+    the backward search uses the same heuristic built for the reversed problem.
+    The search stops when the best found path is not more expensive than the smallest priority,
+    so the solution is optimal for any admissible heuristic.
+    """
+    def __init__(self, problem, heuristic: Heuristic):
+        super().__init__(problem, heuristic)
+        self.search = BidirectionalSearch(problem)
+        backward_heuristic = type(heuristic)(self.search.backward_problem)
+        self.heuristics = [CachedHeuristic(heuristic), CachedHeuristic(backward_heuristic)]
+        self.frontiers = [
+            PriorityQueue(lambda node, h=h: self._priority(node, h), item_id=lambda node: node.state)
+            for h in self.heuristics]
+
+    @staticmethod
+    def _priority(node: Node, heuristic: CachedHeuristic) -> Tuple[float, float]:
+        return max(node.cost + heuristic(node.state), 2 * node.cost), node.cost
+
+    def solve(self) -> Optional[Node]:
+        search = self.search
+        if self.problem.is_goal(search.roots[0].state):
+            return search.roots[0]
+
+        for frontier, root in zip(self.frontiers, search.roots):
+            frontier.push(root)
+        meeting: Optional[Tuple[Node, Node]] = None
+        meeting_cost = inf
+        while not (self.frontiers[0].is_empty() or self.frontiers[1].is_empty()):
+            priorities = [frontier.key(frontier.peek()) for frontier in self.frontiers]
+            if meeting_cost <= min(priorities)[0]:
+                break
+            direction = 0 if priorities[0] <= priorities[1] else 1
+            visited, other_visited = search.visited[direction], search.visited[1 - direction]
+            node = self.frontiers[direction].pop()
+            for child in search.trees[direction].expand(search.problems[direction], node):
+                known = visited.get(child.state)
+                if known is not None and known.cost <= child.cost:
+                    continue
+                visited[child.state] = child
+                self.frontiers[direction].push(child)
+                other = other_visited.get(child.state)
+                if other is not None and child.cost + other.cost < meeting_cost:
+                    meeting_cost = child.cost + other.cost
+                    meeting = (child, other) if direction == 0 else (other, child)
+
+        if meeting is None:
+            return None
+        return search.join(*meeting)
+
+    def search_tree(self) -> Tree:
+        return self.search.tree
+
+    def frontier_size(self) -> Optional[int]:
+        return sum(len(frontier) for frontier in self.frontiers)
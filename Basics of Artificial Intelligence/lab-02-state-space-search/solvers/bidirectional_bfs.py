@@ -0,0 +1,49 @@
+from typing import List, Optional, Tuple
+from base.solver import P, Solver
+from solvers.generic.bidirectional import BidirectionalSearch
+from tree import Node, Tree
+
+
+class BiBFS(Solver):
+    """
+    Breadth first search run from both ends at once, every step expands a whole layer of the smaller frontier.
+    Finds the solution with the fewest actions (as BFS does), but visits roughly two trees of half the depth.
+    """
+    def __init__(self, problem: P):
+        super().__init__(problem)
+        self.search = BidirectionalSearch(problem)
+        # layers of both searches and the one being built
+        self.layers: List[List[Node]] = []
+        self.next_layer: List[Node] = []
+
+    def solve(self) -> Optional[Node]:
+        search = self.search
+        if self.problem.is_goal(search.roots[0].state):
+            return search.roots[0]
+
+        self.layers = layers = [[root] for root in search.roots]
+        while layers[0] and layers[1]:
+            direction = 0 if len(layers[0]) <= len(layers[1]) else 1
+            visited, other_visited = search.visited[direction], search.visited[1 - direction]
+            meeting: Optional[Tuple[Node, Node]] = None
+            self.next_layer = next_layer = []
+            for node in layers[direction]:
+                for child in search.trees[direction].expand(search.problems[direction], node):
+                    if child.state in visited:
+                        continue
+                    visited[child.state] = child
+                    next_layer.append(child)
+                    other = other_visited.get(child.state)
+                    if other is not None and (meeting is None or child.cost + other.cost < meeting[0].cost + meeting[1].cost):
+                        meeting = (child, other)
+            if meeting is not None:
+                forward, backward = meeting if direction == 0 else meeting[::-1]
+                return search.join(forward, backward)
+            layers[direction] = next_layer
+        return None
+
+    def search_tree(self) -> Tree:
+        return self.search.tree
+
+    def frontier_size(self) -> Optional[int]:
+        return sum(len(layer) for layer in self.layers) + len(self.next_layer)
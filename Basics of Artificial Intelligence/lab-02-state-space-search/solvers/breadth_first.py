@@ -1,4 +1,5 @@
 from queue import Queue as FifoQueue
+from typing import Optional
 from base.solver import P, Solver
 from solvers.generic.uninformed import UninformedSearch
 from solvers.utils import FIFO
@@ -16,4 +17,7 @@ class BFS(Solver):
     def search_tree(self) -> Tree:
         return self.search.tree
 
+    def frontier_size(self) -> Optional[int]:
+        return len(self.search.frontier)
+
 
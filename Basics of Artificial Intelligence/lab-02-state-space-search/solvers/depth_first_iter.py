@@ -1,5 +1,5 @@
 from collections import deque
-from typing import Deque
+from typing import Deque, Optional
 from base.solver import P, Solver
 from solvers.generic.uninformed import UninformedSearch
 from solvers.utils import LIFO
@@ -15,4 +15,7 @@ class DFSIter(Solver):
         return self.search.solve()
 
     def search_tree(self) -> Tree:
-        return self.search.tree
\ No newline at end of file
+        return self.search.tree
+
+    def frontier_size(self) -> Optional[int]:
+        return len(self.search.frontier)
\ No newline at end of file
@@ -15,5 +15,8 @@ class Dijkstra(Solver):
 
     def search_tree(self) -> Tree:
         return self.search.tree
+
+    def frontier_size(self) -> Optional[int]:
+        return len(self.search.frontier)
         
         
\ No newline at end of file
@@ -1,16 +1,20 @@
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 from base.problem import Problem
 from solvers.utils import PriorityQueue, Queue
 from tree import Node, Tree
 
 
 class BestFirstSearch():
-    def __init__(self, problem: Problem, eval_fun: Callable[[Node], float]):
+    """
+    Frontier keeps at most one node per state, so when a cheaper path to a queued state is found,
+    the old node is dropped instead of being expanded again. `eval_fun` may return a tuple to break ties.
+    """
+    def __init__(self, problem: Problem, eval_fun: Callable[[Node], Any]):
         self.problem = problem
         self.eval_fun = eval_fun
         self.start = problem.initial
         self.root = Node(self.start)
-        self.frontier:PriorityQueue = PriorityQueue(eval_fun)
+        self.frontier:PriorityQueue = PriorityQueue(eval_fun, item_id=lambda node: node.state)
         self.visited = {self.start: self.root.cost}
         self.tree = Tree(self.root)
     
@@ -0,0 +1,43 @@
+from typing import Dict, List
+from base.problem import Problem
+from tree import Node, Tree
+
+
+class BidirectionalSearch():
+    """
+    Common part of the bidirectional solvers: a forward search from the initial state and a backward one
+    from the goal state (a forward search in the reversed problem, see `Problem.reversed`).
+    Both trees notify the same subscribers, so the monitors count nodes of both searches.
+    """
+    def __init__(self, problem: Problem):
+        self.problem = problem
+        self.backward_problem = problem.reversed()
+        self.problems: List[Problem] = [problem, self.backward_problem]
+        self.roots = [Node(problem.initial), Node(self.backward_problem.initial)]
+        self.trees = [Tree(root) for root in self.roots]
+        self.trees[1].subscribers = self.trees[0].subscribers
+        # visited[direction][state] - the cheapest node with the state found in the given direction
+        self.visited: List[Dict] = [{root.state: root} for root in self.roots]
+
+    @property
+    def tree(self) -> Tree:
+        return self.trees[0]
+
+    def join(self, forward: Node, backward: Node) -> Node:
+        """
+        Connects the forward path with the backward one meeting it in the same state,
+        returns the goal node of the joined path (its ancestors lead back to the initial state)
+        """
+        node = forward
+        backward = backward.parent
+        while backward is not None:
+            action = next(a for a in self.problem.actions(node.state)
+                          if self.problem.take_action(node.state, a) == backward.state)
+            node = Node(
+                state=backward.state,
+                parent=node,
+                action=action,
+                cost=node.cost + self.problem.action_cost(node.state, action, backward.state)
+                )
+            backward = backward.parent
+        return node
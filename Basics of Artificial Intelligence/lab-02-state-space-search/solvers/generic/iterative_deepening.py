@@ -0,0 +1,102 @@
+from collections import OrderedDict
+from math import inf
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Tuple
+from base.problem import Problem
+from tree import Node, Tree
+
+# (step + heuristic of the successor, step, heuristic, action, successor state, action cost)
+Successor = Tuple[float, float, float, Any, Any, float]
+
+TABLE_SIZE = 200_000
+
+
+class IterativeDeepeningSearch():
+    """
+    Depth first searches limited by a growing bound on g + h, where g is the cost of the path
+    (or its length, if `unit_steps` is set) and h is the heuristic (IDDFS uses h = 0).
+
+    The search keeps an explicit stack, so the depth is not limited by the recursion limit, and memory is linear
+    in the depth plus a transposition table of at most `table_size` states. The table remembers the smallest g
+    a state has been reached with in the current iteration (the subtree of a state reached again with a larger g
+    has been already searched), and successors of the state ordered by their f cost, which are reused
+    by the next iterations. When the table is full, the least recently used state is evicted.
+    """
+    def __init__(self, problem: Problem, heuristic: Callable[[Any], float] = lambda state: 0,
+                 unit_steps: bool = False, table_size: int = TABLE_SIZE):
+        self.problem = problem
+        self.heuristic = heuristic
+        self.unit_steps = unit_steps
+        self.table_size = table_size
+        self.root = Node(problem.initial)
+        self.tree = Tree(self.root)
+        # state -> [g, iteration, successors]
+        self.table: OrderedDict[Hashable, List] = OrderedDict()
+        self.iteration = 0
+        # (node, g, children left to be searched) for the nodes on the current path
+        self.stack: List[Tuple[Node, float, Iterator[Tuple[Node, Successor]]]] = []
+
+    def bounded_search(self, bound: float) -> Tuple[Optional[Node], float]:
+        """
+        Looks for a goal among nodes with g + h not exceeding the bound, returns the found goal node (or None)
+        and the smallest g + h exceeding the bound (inf if no node has been cut off)
+        """
+        self.iteration += 1
+        self._visit(self.root.state, 0)
+        next_bound = inf
+        self.stack = stack = [(self.root, 0.0, self._expand(self.root, None))]
+        while stack:
+            node, g, children = stack[-1]
+            try:
+                child, (order_key, step, _, _, _, _) = next(children)
+            except StopIteration:
+                stack.pop()
+                continue
+            if g + order_key > bound:
+                # successors are ordered, so the rest exceeds the bound too
+                next_bound = min(next_bound, g + order_key)
+                stack.pop()
+                continue
+            if self.problem.is_goal(child.state):
+                return child, next_bound
+            child_g = g + step
+            if self._visit(child.state, child_g):
+                stack.append((child, child_g, self._expand(child, node.state)))
+        return None, next_bound
+
+    def _expand(self, node: Node, parent_state: Any) -> Iterator[Tuple[Node, Successor]]:
+        """Pairs of child nodes and their successor entries, skipping the move back to the parent"""
+        successors = [s for s in self._successors(node.state) if s[4] != parent_state]
+        children = (Node(state=state, parent=node, action=action, cost=node.cost + cost)
+                    for _, _, _, action, state, cost in successors)
+        # expand_with yields the children one by one, in step with the successors
+        return zip(self.tree.expand_with(node, children), successors)
+
+    def _successors(self, state: Any) -> List[Successor]:
+        entry = self.table.get(state)
+        if entry is not None and entry[2] is not None:
+            return entry[2]
+        successors = []
+        for action in self.problem.actions(state):
+            next_state = self.problem.take_action(state, action)
+            cost = self.problem.action_cost(state, action, next_state)
+            step = 1 if self.unit_steps else cost
+            h = self.heuristic(next_state)
+            successors.append((step + h, step, h, action, next_state, cost))
+        successors.sort(key=lambda successor: successor[0])
+        if entry is not None:
+            entry[2] = successors
+        return successors
+
+    def _visit(self, state: Any, g: float) -> bool:
+        """Stores the state in the table, returns False if it has been already reached as cheaply in this iteration"""
+        entry = self.table.get(state)
+        if entry is None:
+            self.table[state] = [g, self.iteration, None]
+            if len(self.table) > self.table_size:
+                self.table.popitem(last=False)
+            return True
+        self.table.move_to_end(state)
+        if entry[1] == self.iteration and entry[0] <= g:
+            return False
+        entry[0], entry[1] = g, self.iteration
+        return True
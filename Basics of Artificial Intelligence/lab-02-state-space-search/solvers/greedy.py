@@ -2,6 +2,7 @@ from typing import Optional
 from base.heuristic import Heuristic
 from base.solver import HeuristicSolver
 from solvers.generic.best_first import BestFirstSearch
+from solvers.utils import CachedHeuristic
 from tree.node import Node
 from tree.tree import Tree
 
@@ -9,10 +10,14 @@ from tree.tree import Tree
 class Greedy(HeuristicSolver):
     def __init__(self, problem, heuristic):
         super().__init__(problem, heuristic)
-        self.search = BestFirstSearch(problem, lambda node: heuristic(node.state))
+        self.cached_heuristic = CachedHeuristic(heuristic)
+        self.search = BestFirstSearch(problem, lambda node: self.cached_heuristic(node.state))
 
     def solve(self) -> Optional[Node]:
         return self.search.solve()
         
     def search_tree(self) -> Tree:
-        return self.search.tree    
\ No newline at end of file
+        return self.search.tree
+
+    def frontier_size(self) -> Optional[int]:
+        return len(self.search.frontier)    
\ No newline at end of file
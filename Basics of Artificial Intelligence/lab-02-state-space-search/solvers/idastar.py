@@ -1,40 +1,37 @@
+from math import inf
 from typing import Tuple, Optional
 from base.solver import H, P, HeuristicSolver
-from solvers.utils import LIFO, PriorityQueue
+from solvers.generic.iterative_deepening import IterativeDeepeningSearch, TABLE_SIZE
 from tree import Node, Tree
 
 
 class IDAStar(HeuristicSolver):
-    def __init__(self, problem: P, heuristic: H):
+    def __init__(self, problem: P, heuristic: H, table_size: int = TABLE_SIZE):
         super().__init__(problem, heuristic)
-        self.start = problem.initial
-        self.root = Node(self.start, cost=0)
-        self.tree = Tree(self.root)
+        self.search = IterativeDeepeningSearch(problem, heuristic, table_size=table_size)
+        self.root = self.search.root
+        self.tree = self.search.tree
 
     
     def solve(self) -> Optional[Node]:
-        # TODO:
-        # - if the root node is a goal, just return it
-        #   tip. use 'is_goal' method from Problem
-        # - set bound to the heuristic of the start state
-        # - run self._cost_limited search
-        #   * if it returned a node, return it!
-        #   * if returned cost equals bound, return None
-        #   * otherwise update bound to cost and repeat the limited search
-        raise NotImplementedError()
+        if self.problem.is_goal(self.root.state):
+            return self.root
+        bound = self.heuristic(self.root.state)
+        while True:
+            node, next_bound = self._cost_limited_search(self.root, bound)
+            if node is not None:
+                return node
+            if next_bound == inf:
+                return None
+            bound = next_bound
 
     
     def _cost_limited_search(self, root: Node, bound: float) -> Tuple[Optional[Node], float]:
-        # TODO:
-        # - do a DFS with depth limited by a given bound
-        #   tip. base in on the BestFirstSearch you have already done by now
-        # differences:
-        # - sort children using A* fcost (cost + heuristic)
-        # - if fcost of child is bigger than the bound, do not expand this child
-        # - this method return a tuple:
-        #   * first element is the node if the method finds a goal state, otherwise it should be None
-        #   * second element is a new bound (the smallest fcost of a not expanded child)
-        raise NotImplementedError()
+        """Returns the goal node with the cost not exceeding the bound (if found) and the next bound"""
+        return self.search.bounded_search(bound)
                 
     def search_tree(self) -> Tree:
         return self.tree
+
+    def frontier_size(self) -> Optional[int]:
+        return len(self.search.stack)
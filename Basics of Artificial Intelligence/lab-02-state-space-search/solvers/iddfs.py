@@ -1,65 +1,39 @@
+from math import inf
 from typing import Tuple, Optional
 from base.solver import P, Solver
-from solvers.utils import PriorityQueue
-from solvers.utils import LIFO
+from solvers.generic.iterative_deepening import IterativeDeepeningSearch, TABLE_SIZE
 from tree import Node, Tree
 
 
 class IDDFS(Solver):
-    def __init__(self, problem: P):
-        self.problem = problem
-        self.start = problem.initial
-        self.root = Node(self.start)
-        self.tree = Tree(self.root)
+    def __init__(self, problem: P, table_size: int = TABLE_SIZE):
+        super().__init__(problem)
+        self.search = IterativeDeepeningSearch(problem, unit_steps=True, table_size=table_size)
+        self.root = self.search.root
+        self.tree = self.search.tree
 
 
     def solve(self) -> Optional[Node]:
-        # TODO:
-        # - if the root node is a goal, just return it
-        if self.problem.is_goal(self.root):
+        if self.problem.is_goal(self.root.state):
             return self.root
-        #   tip. use 'is_goal' method from Problem
-        # - set depth to 1
         depth = 1
-        while (depth < len(self.tree.expand())):
-            # - run self._depth_limited search
-            node = self._depth_limited_search(self.root, depth)
-            #   * if it returned a node, return it!
-            if node != None:
+        while True:
+            node, nodes_left = self._depth_limited_search(self.root, depth)
+            if node is not None:
                 return node
-            else:
-                depth += 1
-        return None
-
-        #   * if there is no nodes left, return None 
-        #   * otherwise increment depth and repeat the limited search
+            if not nodes_left:
+                return None
+            depth += 1
     
 
     def _depth_limited_search(self, root: Node, max_depth: int) -> Tuple[Optional[Node], bool]:
-        # TODO:
-        # - do a DFS with depth limited by a given depth
-        #   tip. base in on the Uninformed search you have already done by now
-        # differences:
-        # - you should store in the frontier a tuple (node, depth), so later you could easily access current depth
-        # - if depth of child is bigger than the max_depth, do not expand this child and store info there are still nodes left
-        # - this method return a tuple:
-        #   * first element is the node if the method finds a goal state, otherwise it should be None
-        #   * second element is a boolean telling whether there are any nodes left to be expanded
-        raise NotImplementedError()
-
-    # self.frontier.push(self.root)
-    # while not self.frontier.is_empty():
-    #     node = self.frontier.pop()
-    #     if self.problem.is_goal(node.state):
-    #         return node
-    #     else:
-    #         for child in self.tree.expand(self.problem, node):
-    #             if child.state not in self.visited:
-    #                 self.visited.add(child.state)
-    #                 self.frontier.push(child)
-    # return None
+        """Returns the goal node not deeper than max_depth (if found) and whether any deeper nodes were left"""
+        node, next_bound = self.search.bounded_search(max_depth)
+        return node, next_bound < inf
 
 
     def search_tree(self) -> Tree:
         return self.tree
-        
\ No newline at end of file
+
+    def frontier_size(self) -> Optional[int]:
+        return len(self.search.stack)
@@ -0,0 +1,143 @@
+from typing import Iterator, List, Optional, Tuple
+from base.heuristic import Heuristic
+from base.solver import HeuristicSolver
+from problems.grid_pathfinding.grid import GridCoord
+from problems.grid_pathfinding.grid_move import GridMove
+from problems.grid_pathfinding.grid_pathfinding import GridPathfinding
+from solvers.utils import CachedHeuristic, PriorityQueue
+from tree import Node, Tree
+
+
+class JPS(HeuristicSolver):
+    """
+    Jump Point Search: A* over the GridPathfinding problem, which instead of expanding every neighbour of a cell
+    keeps moving in the same direction until it reaches a cell, where some optimal path may turn (a jump point).
+    Only the jump points are put in the search tree, the returned path is filled with the skipped cells.
+
+    Works on the padded wall flags of the grid (see `Grid.passable`). Diagonal moves are used only if they are cheaper
+    than two straight ones, otherwise every diagonal move can be replaced by two straight moves of the same cost,
+    so the cheapest path is searched for with the straight moves only. Diagonal moves cheaper than the straight ones
+    break the path symmetries the pruning relies on (zig-zags beat straight lines), so such grids are not supported.
+    """
+    def __init__(self, problem: GridPathfinding, heuristic: Heuristic):
+        if not isinstance(problem, GridPathfinding):
+            raise NotImplementedError("Jump Point Search works only for the grid pathfinding")
+        if 0 < problem.diagonal_weight < 1:
+            raise NotImplementedError("Jump Point Search requires diagonal moves not cheaper than the straight ones")
+        super().__init__(problem, heuristic)
+        self.cached_heuristic = CachedHeuristic(heuristic)
+        self.grid = problem.grid
+        self.row = problem.grid.shape[1] + 2
+        self.passable = problem.grid.passable
+        self.diagonal = 0 < problem.diagonal_weight < 2
+        self.goal = problem.grid.padded_index(problem.goal)
+        self.root = Node(problem.initial)
+        self.tree = Tree(self.root)
+        self.frontier = PriorityQueue(self._priority, item_id=lambda node: node.state)
+        self.visited = {self.root.state: self.root.cost}
+
+    def _priority(self, node: Node) -> Tuple[float, float]:
+        h = self.cached_heuristic(node.state)
+        return node.cost + h, h
+
+    def solve(self) -> Optional[Node]:
+        self.frontier.push(self.root)
+        while not self.frontier.is_empty():
+            node = self.frontier.pop()
+            if self.problem.is_goal(node.state):
+                return self._fill_path(node)
+            for child in self.tree.expand_with(node, self._jump_points(node)):
+                if child.state not in self.visited or self.visited[child.state] > child.cost:
+                    self.visited[child.state] = child.cost
+                    self.frontier.push(child)
+        return None
+
+    def search_tree(self) -> Tree:
+        return self.tree
+
+    def frontier_size(self) -> Optional[int]:
+        return len(self.frontier)
+
+    def _jump_points(self, node: Node) -> Iterator[Node]:
+        index = self.grid.padded_index(node.state)
+        for dx, dy in self._directions(node, index):
+            jump_point = self._jump(index, dx, dy)
+            if jump_point is None:
+                continue
+            steps = max(abs(jump_point % self.row - index % self.row), abs(jump_point // self.row - index // self.row))
+            move = GridMove.from_value((dy, dx))
+            step_cost = self.problem.diagonal_weight if dx and dy else 1.0
+            yield Node(
+                state=self.grid.padded_coord(jump_point),
+                parent=node,
+                action=move,
+                cost=node.cost + steps * step_cost
+                )
+
+    def _directions(self, node: Node, index: int) -> List[Tuple[int, int]]:
+        """Directions (dx, dy) worth searching from the node, given the direction it has been reached from"""
+        free, row = self.passable, self.row
+        if node.parent is None:
+            straight = [(dx, dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)) if free[index + dy * row + dx]]
+            if not self.diagonal:
+                return straight
+            return straight + [(dx, dy) for dx in (1, -1) for dy in (1, -1)
+                               if free[index + dx] and free[index + dy * row] and free[index + dy * row + dx]]
+
+        dy, dx = node.action.value
+        if dx and dy:
+            directions = [(d_x, d_y) for d_x, d_y in ((0, dy), (dx, 0)) if free[index + d_y * row + d_x]]
+            if len(directions) == 2 and free[index + dy * row + dx]:
+                directions.append((dx, dy))
+            return directions
+
+        # moving straight: go further or turn to any side (turns are pruned by the jumps themselves)
+        side_x, side_y = dy, dx
+        directions = [(d_x, d_y) for d_x, d_y in ((dx, dy), (side_x, side_y), (-side_x, -side_y))
+                      if free[index + d_y * row + d_x]]
+        if self.diagonal and free[index + dy * row + dx]:
+            for sx, sy in ((side_x, side_y), (-side_x, -side_y)):
+                if free[index + sy * row + sx] and free[index + (dy + sy) * row + dx + sx]:
+                    directions.append((dx + sx, dy + sy))
+        return directions
+
+    def _jump(self, index: int, dx: int, dy: int) -> Optional[int]:
+        """Index of the first jump point met when going from the index in the given direction"""
+        free, row, goal = self.passable, self.row, self.goal
+        shift = dy * row + dx
+        if dx and dy:
+            while True:
+                index += shift
+                if index == goal or self._jump(index, dx, 0) is not None or self._jump(index, 0, dy) is not None:
+                    return index
+                if not (free[index + dx] and free[index + dy * row] and free[index + shift]):
+                    return None
+
+        # the side cells are the cells next to the path, the jump point is found when a wall next to the path ends
+        side = dx * row + dy
+        while True:
+            index += shift
+            if not free[index]:
+                return None
+            if index == goal:
+                return index
+            if (free[index + side] and not free[index - shift + side]) or \
+               (free[index - side] and not free[index - shift - side]):
+                return index
+            if not self.diagonal and dy and (self._jump(index, 1, 0) is not None or self._jump(index, -1, 0) is not None):
+                return index
+
+    def _fill_path(self, goal: Node) -> Node:
+        """Replaces jumps between the jump points with single moves"""
+        jump_points = goal.path()
+        node = jump_points[0]
+        for jump_point in jump_points[1:]:
+            while node.state != jump_point.state:
+                state = self.problem.take_action(node.state, jump_point.action)
+                node = Node(
+                    state=state,
+                    parent=node,
+                    action=jump_point.action,
+                    cost=node.cost + self.problem.action_cost(node.state, jump_point.action, state)
+                    )
+        return node
@@ -1,9 +1,8 @@
 from abc import ABC, abstractmethod
 from collections import deque
-from dataclasses import dataclass
+from itertools import count
 import heapq
-from dataclasses import dataclass, field
-from typing import Any, Callable, Deque, List
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
 
 
 class Queue(ABC):
@@ -19,6 +18,10 @@ class Queue(ABC):
     def is_empty(self) -> bool:
         pass
 
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
 class FIFO(Queue):
 
     def __init__(self) -> None:
@@ -34,6 +37,9 @@ class FIFO(Queue):
     def is_empty(self) -> bool:
         return len(self.queue) == 0
 
+    def __len__(self) -> int:
+        return len(self.queue)
+
 class LIFO(Queue):
 
     def __init__(self) -> None:
@@ -49,25 +55,83 @@ class LIFO(Queue):
     def is_empty(self) -> bool:
         return len(self.queue) == 0
 
-@dataclass(order=True)
-class PQItem():
-    distance: int
-    item: Any=field(compare=False)
+    def __len__(self) -> int:
+        return len(self.queue)
 
 class PriorityQueue(Queue):
-       
-    def __init__(self, key: Callable):
-        self.key=key
-        self.heap: List[PQItem] = []
-        heapq.heapify(self.heap)
+    """
+    Binary heap ordered by `key` (ties are popped in the FIFO order).
+    If `item_id` is given, at most one item with the given id is queued: pushing an item with a key that is not worse
+    replaces the queued one (the old heap entry becomes a tombstone skipped by pop), a worse one is dropped.
+    """
+
+    def __init__(self, key: Callable, item_id: Optional[Callable[[Any], Hashable]] = None):
+        self.key = key
+        self.item_id = item_id
+        self.heap: List[Tuple[Any, int, Any]] = []
+        # id -> (key, counter) of the live entry
+        self.queued: Dict[Hashable, Tuple[Any, int]] = {}
+        self.counter = count()
 
     def push(self, x: Any):
-        heapq.heappush(self.heap, PQItem(self.key(x), x))
+        priority = self.key(x)
+        entry = (priority, next(self.counter), x)
+        if self.item_id is not None:
+            x_id = self.item_id(x)
+            queued = self.queued.get(x_id)
+            if queued is not None and queued[0] < priority:
+                return
+            self.queued[x_id] = entry[:2]
+            if len(self.heap) > 2 * len(self.queued) + 64:
+                self._drop_tombstones()
+        heapq.heappush(self.heap, entry)
 
     def pop(self) -> Any:
-        hitem = heapq.heappop(self.heap)
-        return hitem.item
-        
+        while True:
+            priority, counter, x = heapq.heappop(self.heap)
+            if self.item_id is None:
+                return x
+            x_id = self.item_id(x)
+            queued = self.queued.get(x_id)
+            if queued is not None and queued[1] == counter:
+                del self.queued[x_id]
+                return x
+
+    def peek(self) -> Any:
+        """Returns the item that would be popped next, without removing it"""
+        while self.item_id is not None:
+            priority, counter, x = self.heap[0]
+            queued = self.queued.get(self.item_id(x))
+            if queued is not None and queued[1] == counter:
+                break
+            heapq.heappop(self.heap)
+        return self.heap[0][2]
+
     def is_empty(self):
-        return len(self.heap) == 0
+        return len(self) == 0
+
+    def __len__(self) -> int:
+        if self.item_id is None:
+            return len(self.heap)
+        return len(self.queued)
+
+    def _drop_tombstones(self):
+        self.heap = [entry for entry in self.heap
+                     if self.queued.get(self.item_id(entry[2]), (None, None))[1] == entry[1]]
+        heapq.heapify(self.heap)
+
+
+class CachedHeuristic:
+    """
+    Remembers heuristic values of the states, so every state is evaluated once
+    """
+
+    def __init__(self, heuristic: Callable[[Any], float]):
+        self.heuristic = heuristic
+        self.values: Dict[Hashable, float] = {}
 
+    def __call__(self, state: Hashable) -> float:
+        value = self.values.get(state)
+        if value is None:
+            value = self.values[state] = self.heuristic(state)
+        return value
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from problems.grid_pathfinding.grid import Grid, GridCoord
+from problems.grid_pathfinding.grid_pathfinding import GridPathfinding
+from problems.grid_pathfinding.heuristics.diagonal_heuristic import GridDiagonalHeuristic
+from problems.grid_pathfinding.heuristics.landmark_heuristic import GridLandmarkHeuristic
+from solvers import AStar, Dijkstra, JPS
+
+INSTANCES = sorted((Path(__file__).parent.parent / "problems" / "grid_pathfinding" / "instances").glob("*.txt"))
+DIAGONAL_WEIGHTS = [0, 1, 2 ** 0.5, 2, 3]
+
+
+def random_problems(diagonal_weight: float, count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        walls = rng.random((15, 20)) < 0.3
+        free = np.argwhere(~walls)
+        (start_y, start_x), (goal_y, goal_x) = free[rng.choice(len(free), 2, replace=False)]
+        yield GridPathfinding(Grid(walls), GridCoord(int(start_x), int(start_y)),
+                              GridCoord(int(goal_x), int(goal_y)), diagonal_weight)
+
+
+def path_cost(problem: GridPathfinding, solution) -> float:
+    """Cost of the returned path, checking that it's made of legal moves"""
+    path = solution.path()
+    assert path[0].state == problem.initial and problem.is_goal(path[-1].state)
+    cost = 0.0
+    for parent, child in zip(path, path[1:]):
+        assert problem.is_legal_move(parent.state, child.action)
+        assert problem.take_action(parent.state, child.action) == child.state
+        cost += problem.action_cost(parent.state, child.action, child.state)
+    assert cost == pytest.approx(solution.cost)
+    return cost
+
+
+def check_against_dijkstra(problem: GridPathfinding):
+    expected = Dijkstra(problem).solve()
+    solutions = [JPS(problem, GridLandmarkHeuristic(problem)).solve(),
+                 AStar(problem, GridLandmarkHeuristic(problem)).solve()]
+    # the diagonal distance charges every diagonal step in full, so it overestimates above two straight moves
+    if problem.diagonal_weight <= 2:
+        solutions.append(JPS(problem, GridDiagonalHeuristic(problem)).solve())
+    for solution in solutions:
+        if expected is None:
+            assert solution is None
+        else:
+            assert solution is not None
+            assert path_cost(problem, solution) == pytest.approx(expected.cost)
+
+
+@pytest.mark.parametrize("diagonal_weight", DIAGONAL_WEIGHTS)
+def test_random_grids_match_dijkstra(diagonal_weight: float):
+    for problem in random_problems(diagonal_weight, 30):
+        check_against_dijkstra(problem)
+
+
+@pytest.mark.parametrize("path", INSTANCES, ids=lambda path: path.stem)
+def test_instances_match_dijkstra(path: Path):
+    check_against_dijkstra(GridPathfinding.load(path))
+
+
+@pytest.mark.parametrize("diagonal_weight", DIAGONAL_WEIGHTS)
+def test_landmark_heuristic_is_admissible(diagonal_weight: float):
+    for problem in random_problems(diagonal_weight, 10):
+        heuristic = GridLandmarkHeuristic(problem)
+        # moves are reversible, so distances from the goal are the distances to the goal
+        distances = problem.grid.distances(problem.goal, diagonal_weight)
+        for y, x in np.argwhere(np.isfinite(distances)):
+            assert heuristic(GridCoord(int(x), int(y))) <= distances[y, x] + 1e-9
@@ -0,0 +1,53 @@
+import random
+from collections import deque
+
+from problems.n_puzzle import NPuzzleProblem, NPuzzleState
+from problems.n_puzzle.heuristics.n_puzzle_pattern_database_heuristic import NPuzzlePatternDatabaseHeuristic
+
+GOAL = NPuzzleState.from_matrix([[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+
+
+def neighbours(problem: NPuzzleProblem, state: NPuzzleState):
+    return [problem.take_action(state, action) for action in problem.actions(state)]
+
+
+def exact_distances(problem: NPuzzleProblem):
+    distances = {problem.goal.tiles: 0}
+    queue = deque([problem.goal])
+    while queue:
+        state = queue.popleft()
+        for neighbour in neighbours(problem, state):
+            if neighbour.tiles not in distances:
+                distances[neighbour.tiles] = distances[state.tiles] + 1
+                queue.append(neighbour)
+    return distances
+
+
+def random_walk(problem: NPuzzleProblem, length: int):
+    state = problem.initial
+    for _ in range(length):
+        state = random.choice(neighbours(problem, state))
+        yield state
+
+
+def test_pattern_database_is_admissible():
+    problem = NPuzzleProblem(GOAL, GOAL)
+    heuristic = NPuzzlePatternDatabaseHeuristic(problem)
+    distances = exact_distances(problem)
+    assert len(distances) == 181440
+    assert heuristic.evaluate(GOAL) == 0
+
+    random.seed(0)
+    for tiles in random.sample(sorted(distances), 5000):
+        blank = next(idx for idx in range(9) if (tiles >> (GOAL.bits * idx)) & 15 == 0)
+        assert heuristic.evaluate(NPuzzleState(tiles, blank, 3, 3)) <= distances[tiles]
+
+
+def test_incremental_update_matches_evaluation():
+    random.seed(1)
+    problem = NPuzzleProblem(NPuzzleState.from_matrix([[8, 6, 7], [2, 5, 4], [3, 0, 1]]), GOAL)
+    heuristic = NPuzzlePatternDatabaseHeuristic(problem)
+    heuristic(problem.initial)
+    for state in random_walk(problem, 2000):
+        assert state.parent_heuristic_value is not None
+        assert heuristic(state) == heuristic.evaluate(state)
@@ -0,0 +1,63 @@
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from problems.rush_hour.rush_hour import RushHourProblem
+from problems.rush_hour.board import RushHourBoard
+from problems.rush_hour.rush_hour_action import Direction, VehicleShift
+from problems.rush_hour.vehicle import Orientation
+
+INSTANCES = sorted((Path(__file__).parent.parent / "problems" / "rush_hour" / "instances").glob("*.txt"))
+
+
+def naive_successors(board: RushHourBoard):
+    """
+    Reference move generator working on the character grid: a vehicle can be shifted
+    if the cell right before its back (or after its front) is on the board and empty
+    """
+    grid = board.get_board()
+    height, width = grid.shape
+    successors = dict()
+    for vehicle in board.vehicles:
+        for direction in Direction:
+            dy, dx = direction.value
+            if (dx != 0) != (vehicle.orientation == Orientation.HORIZONTAL):
+                continue
+            x, y = (vehicle.xEnd + dx, vehicle.yEnd + dy) if dx + dy > 0 else (vehicle.x + dx, vehicle.y + dy)
+            if not (0 <= x < width and 0 <= y < height) or grid[y, x] != ' ':
+                continue
+            shifted = np.full(grid.shape, ' ')
+            shifted[grid != vehicle.id] = grid[grid != vehicle.id]
+            shifted[vehicle.y + dy:vehicle.yEnd + dy + 1, vehicle.x + dx:vehicle.xEnd + dx + 1] = vehicle.id
+            successors[VehicleShift(direction, vehicle.id)] = shifted
+    return successors
+
+
+def reachable_boards(problem: RushHourProblem, limit: int):
+    visited = {problem.initial}
+    queue = deque([problem.initial])
+    while queue and len(visited) < limit:
+        board = queue.popleft()
+        yield board
+        for action in problem.actions(board):
+            child = problem.take_action(board, action)
+            if child not in visited:
+                visited.add(child)
+                queue.append(child)
+
+
+@pytest.mark.parametrize("path", INSTANCES, ids=lambda path: path.stem)
+def test_bitboard_moves_match_naive_generator(path: Path):
+    problem = RushHourProblem.deserialize(path.read_text())
+    for board in reachable_boards(problem, 2000):
+        expected = naive_successors(board)
+        actions = problem.actions(board)
+        assert len(actions) == len(set(actions))
+        assert set(actions) == set(expected)
+        for action in actions:
+            child = problem.take_action(board, action)
+            assert (child.get_board() == expected[action]).all()
+            # the incrementally updated occupancy must match the one computed from scratch
+            assert child.occupancy == RushHourBoard(child.layout, child.positions).occupancy
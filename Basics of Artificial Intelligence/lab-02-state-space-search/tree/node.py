@@ -1,12 +1,18 @@
-from typing import Union, Set
+from __future__ import annotations
+from typing import Any, List, Optional
 from base.state import State
 
 
 class Node:
-    def __init__(self, state: State, parent: State = None, action: Union[str, int] = None, cost: int = 0):
+    """
+    Search tree node. Nodes know only their parents (the tree is never traversed downwards),
+    the path from the root is reconstructed on demand.
+    """
+    __slots__ = ('state', 'parent', 'action', 'cost')
+
+    def __init__(self, state: State, parent: Optional[Node] = None, action: Any = None, cost: float = 0):
         self.state = state
         self.parent = parent
-        self.children : Set[Node] = set()
         self.action = action
         self.cost = cost
 
@@ -23,7 +29,8 @@ class Node:
         return f"<{str(self.parent)} --{self.action}--> {str(self.state)}. cost: {self.cost}>"
 
 
-    def path(self):
+    def path(self) -> List[Node]:
+        """Nodes from the root to this node"""
         node, path = self, []
         while node:
             path.append(node)
@@ -31,5 +38,6 @@ class Node:
         return path[::-1]
 
 
-    def add_child(self, child):
-        self.children.add(child)
+    def actions(self) -> List[Any]:
+        """Actions leading from the root to this node"""
+        return [node.action for node in self.path()[1:]]
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from enum import Enum, auto
-from typing import List
+from typing import Iterable, List
 from tree import Node
 
 
@@ -49,3 +49,9 @@ class Tree:
             yield child_node
 
 
+    def expand_with(self, node, children: Iterable[Node]):
+        """Generator over child nodes produced by the solver itself (e.g. macro moves skipping several states)"""
+        self._notify(node, NodeEvent.Closed)
+        for child_node in children:
+            self._notify(child_node, NodeEvent.Opened)
+            yield child_node
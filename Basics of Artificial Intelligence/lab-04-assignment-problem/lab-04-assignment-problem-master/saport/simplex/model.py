@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import List
+from typing import Dict, Iterable, List
+from numpy.typing import ArrayLike, DTypeLike
+import numpy as np
 
 import saport.simplex.expressions.objective as sseobj
 import saport.simplex.expressions.constraint as ssecon
@@ -22,6 +24,8 @@ class Model:
             list containing problem constraints
         objective : Objective
             object representing the objective function
+        _variable_names : Dict[str, Variable]
+            variables indexed by their names, used to detect name clashes
 
         Methods
         -------
@@ -29,42 +33,85 @@ class Model:
             constructs new model with a specified name
         create_variable(name: str) -> Variable
             returns a new variable with a specified named, the variable is automatically indexed and added to the variables list
+        create_variables(names: Iterable[str]) -> List[Variable]
+            creates a block of variables with the specified names
+        create_expression(coefficients: array, variables: List[Variable] | None) -> Expression
+            returns an expression with the coefficients of the given variables (all the model variables by default)
         add_constraint(constraint: Constraint)
             add a new constraint to the model
+        add_constraints(matrix: array, bounds: array, type: ConstraintType, variables: List[Variable] | None) -> List[Constraint]
+            adds a constraint for every row of the numpy (or scipy.sparse) coefficient matrix,
+            columns correspond to the given variables (all the model variables by default)
         maximize(expression: Expression)
             sets objective to maximize the specified Expression
         minimize(expression: Expression)
             sets objective to minimize the specified Expression
         simplify():
             simplifies all the expressions used in the model
-        solve() -> Solution
+        solve(revised: bool = False, dtype: DTypeLike = None) -> Solution
             solves the current model using Simplex solver and returns the result
             when called, the model should already contain at least one variable and objective
+            revised=True uses the revised simplex with a sparse constraint matrix instead of the full tableaux
+            dtype=np.float32 stores the full tableaux in single precision
     """
     name: str
     variables: List[sseexp.Variable]
     constraints: List[ssecon.Constraint]
     objective: sseobj.Objective
+    _variable_names: Dict[str, sseexp.Variable]
     
     def __init__(self, name: str):
         self.name = name
         self.variables = []
         self.constraints = []
         self.objective = None
+        self._variable_names = dict()
 
     def create_variable(self, name: str) -> sseexp.Variable:
-        for var in self.variables:
-            if (var.name == name):
-                raise Exception(f"There is already a variable named {name}")
+        if name in self._variable_names:
+            raise Exception(f"There is already a variable named {name}")
 
         new_index = len(self.variables)
         variable = sseexp.Variable(name, new_index)
         self.variables.append(variable)
+        self._variable_names[name] = variable
         return variable 
 
+    def create_variables(self, names: Iterable[str]) -> List[sseexp.Variable]:
+        return [self.create_variable(name) for name in names]
+
+    def create_expression(self, coefficients: ArrayLike, variables: List[sseexp.Variable] = None) -> sseexp.Expression:
+        variables = self.variables if variables is None else variables
+        indices = np.array([var.index for var in variables], dtype=np.int64)
+        return sseexp.VectorExpression(self.variables, indices, np.ravel(coefficients))
+
     def add_constraint(self, constraint: ssecon.Constraint):
         constraint.index = len(self.constraints)
         self.constraints.append(constraint)
+
+    def add_constraints(self, matrix: ArrayLike, bounds: ArrayLike, type: ssecon.ConstraintType = ssecon.ConstraintType.LE, variables: List[sseexp.Variable] = None) -> List[ssecon.Constraint]:
+        variables = self.variables if variables is None else variables
+        indices = np.array([var.index for var in variables], dtype=np.int64)
+        if hasattr(matrix, "tocsr"):
+            # scipy.sparse matrix, its rows are already compressed
+            matrix = matrix.tocsr()
+            indptr, columns, values = matrix.indptr, matrix.indices, matrix.data
+        else:
+            matrix = np.asarray(matrix, dtype=np.float64)
+            rows, columns = np.nonzero(matrix)
+            values = matrix[rows, columns]
+            indptr = np.searchsorted(rows, np.arange(matrix.shape[0] + 1))
+        rows_n = len(indptr) - 1
+        bounds = np.broadcast_to(np.asarray(bounds, dtype=np.float64), (rows_n,))
+
+        constraints = []
+        for r in range(rows_n):
+            start, stop = indptr[r], indptr[r + 1]
+            expression = sseexp.VectorExpression(self.variables, indices[columns[start:stop]], values[start:stop])
+            constraint = ssecon.Constraint(expression, float(bounds[r]), type)
+            self.add_constraint(constraint)
+            constraints.append(constraint)
+        return constraints
          
     def maximize(self, expression: sseexp.Expression):
         self.objective = sseobj.Objective(expression, sseobj.ObjectiveType.MAX)
@@ -79,14 +126,14 @@ class Model:
         assert self.objective != None, "objective has to be defined before simplifying the model"
         self.objective.simplify()
 
-    def solve(self) -> sssol.Solution:
+    def solve(self, revised: bool = False, dtype: DTypeLike = None) -> sssol.Solution:
         if len(self.variables) == 0:
             raise Exception("Can't solve a model without any variables")
 
         if self.objective == None:
             raise Exception("Can't solve a model without an objective")
 
-        solver = ssslv.Solver()
+        solver = ssslv.Solver(revised, dtype)
         return solver.solve(self)
 
     def __str__(self) -> str:
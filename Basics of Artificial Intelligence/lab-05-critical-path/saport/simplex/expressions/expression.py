@@ -1,9 +1,10 @@
 from __future__ import annotations
-from copy import deepcopy
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 
 from itertools import groupby
 from functools import reduce
+from numpy.typing import ArrayLike
+import numpy as np
 import saport.simplex.expressions.constraint as ssecon
 import saport.simplex.model as ssmod
 
@@ -29,6 +30,8 @@ class Expression:
             returns a new expression with sorted and atoms and reduced coefficients 
         coefficients(model: Model) -> list[float]:
             return list of coefficients corresponding to the variables in the model
+        sparse_coefficients() -> Tuple[numpy.Array, numpy.Array]:
+            returns arrays with the variable indexes and the corresponding coefficients (indexes may repeat)
         is_equivalent(other: Expression, model: Model) -> bool:
             returns true if other expression is equivalent given the specific model
         __add__(other: Expression) -> Expression:
@@ -48,7 +51,7 @@ class Expression:
     atoms: List[Atom]
 
     def __init__(self, *atoms: Atom):
-        self.atoms = atoms 
+        self.atoms = list(atoms)
 
     @classmethod
     def from_vectors(self, variables: Iterable[Variable], coefficients: Iterable[float]) -> Expression:
@@ -71,18 +74,23 @@ class Expression:
         self.atoms = [reduce_group(g) for g in grouped_atoms]
         
     def coefficients(self, model: ssmod.Model) -> List[float]:
-        simplified_expression = deepcopy(self)
-        simplified_expression.simplify()
         coefficients = [0.0 for _ in model.variables]
-        for a in simplified_expression.atoms:
+        for a in self.atoms:
             if a.var.index < len(coefficients):
-                coefficients[a.var.index] = a.coefficient
+                coefficients[a.var.index] += a.coefficient
         return coefficients
 
+    def sparse_coefficients(self) -> Tuple[ArrayLike, ArrayLike]:
+        indices = np.array([a.var.index for a in self.atoms], dtype=np.int64)
+        coefficients = np.array([a.coefficient for a in self.atoms], dtype=np.float64)
+        return indices, coefficients
+
     def is_equivalent(self, other: Expression, model: ssmod.model) -> bool:
         return self.coefficients(model) == other.coefficients(model)
 
     def __add__(self, other: Expression) -> Expression:
+        if isinstance(other, VectorExpression):
+            return VectorExpression.from_expression(self, other.variables) + other
         new_atoms = list(self.atoms)
         new_atoms += other.atoms;
         return Expression(*new_atoms)
@@ -117,6 +125,69 @@ class Expression:
             text += f'{coefficient}{atom.var.name}'
         return text
 
+class VectorExpression(Expression):
+    """
+        A class to represent a linear polynomial stored as arrays of variable indexes and coefficients.
+        It is used by the bulk model building methods, atoms are created only when they are accessed.
+
+        Attributes
+        ----------
+        variables : list[Variable]
+            variables of the model, indexes refer to this list
+        indices : numpy.Array
+            indexes of the variables in the polynomial
+        values : numpy.Array
+            coefficients corresponding to the indexes
+
+        Methods
+        -------
+        __init__(variables: List[Variable], indices: array, values: array) -> VectorExpression:
+            constructs an expression with the given indexes and coefficients
+        @staticmethod from_expression(expression: Expression, variables: List[Variable]) -> VectorExpression:
+            converts an atom based expression
+    """
+    variables: List[Variable]
+    indices: ArrayLike
+    values: ArrayLike
+
+    def __init__(self, variables: List[Variable], indices: ArrayLike, values: ArrayLike):
+        self.variables = variables
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+
+    @staticmethod
+    def from_expression(expression: Expression, variables: List[Variable]) -> VectorExpression:
+        return VectorExpression(variables, *expression.sparse_coefficients())
+
+    @property
+    def atoms(self) -> List[Atom]:
+        return [Atom(self.variables[i], c) for (i, c) in zip(self.indices.tolist(), self.values.tolist())]
+
+    def evaluate(self, assignment: List[float]) -> float:
+        return float(self.values @ np.asarray(assignment, dtype=np.float64)[self.indices])
+
+    def simplify(self):
+        self.indices, inverse = np.unique(self.indices, return_inverse=True)
+        self.values = np.bincount(inverse, weights=self.values, minlength=len(self.indices))
+
+    def coefficients(self, model: ssmod.Model) -> List[float]:
+        coefficients = np.zeros(len(model.variables))
+        inside = self.indices < len(coefficients)
+        np.add.at(coefficients, self.indices[inside], self.values[inside])
+        return coefficients.tolist()
+
+    def sparse_coefficients(self) -> Tuple[ArrayLike, ArrayLike]:
+        return self.indices, self.values
+
+    def __add__(self, other: Expression) -> VectorExpression:
+        indices, values = other.sparse_coefficients()
+        return VectorExpression(self.variables, np.concatenate([self.indices, indices]), np.concatenate([self.values, values]))
+
+    def __mul__(self, factor: float) -> VectorExpression:
+        return VectorExpression(self.variables, self.indices, self.values * factor)
+
+    __rmul__ = __mul__
+
 class Atom(Expression):
     """
         A class to represent an atom of the linear programming expression, i.e. variable and it's factor (e.g. 4x, -5.3x, etc.)
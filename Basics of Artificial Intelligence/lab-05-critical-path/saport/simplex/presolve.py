@@ -0,0 +1,229 @@
+from __future__ import annotations
+from itertools import chain
+from math import inf
+from typing import Dict, List, Tuple
+import numpy as np
+
+import saport.simplex.model as ssmod
+import saport.simplex.expressions.constraint as ssecon
+import saport.simplex.expressions.objective as sseobj
+
+eps = 0.000000001
+
+class Presolve:
+    """
+        A class to represent the presolve stage, reducing the model before the simplex is run.
+        The following reductions are repeated as long as they change anything:
+        - fixed variables are substituted into the constraints
+        - empty constraints are checked and dropped
+        - singleton equalities fix their variable, singleton inequalities implied by x >= 0 are dropped,
+          as well as upper bounds implied by another row with all coefficients of the same sign
+        - duplicated (parallel) constraints are merged into the tightest one
+        - dominated variables (increasing them can't improve the objective nor help any constraint) are fixed to 0
+
+        Attributes
+        ----------
+        model : Model
+            the original model
+        reduced_model : Model | None
+            the model left after the reductions, None if the presolve found the model infeasible
+        is_feasible : bool
+            whether the model may be feasible, False means the presolve has proven it infeasible
+        fixed : Dict[int, float]
+            values of the variables removed from the model, indexed by the original variable index
+        kept : List[int]
+            original index of every variable in the reduced model
+
+        Methods
+        -------
+        __init__(model: Model) -> Presolve:
+            runs the presolve on the given model, the model itself is left intact
+        postsolve(assignment: List[float]) -> List[float]:
+            maps an assignment of the reduced model back to the variables of the original model
+    """
+    model: ssmod.Model
+    reduced_model: ssmod.Model
+    is_feasible: bool
+    fixed: Dict[int, float]
+    kept: List[int]
+
+    def __init__(self, model: ssmod.Model):
+        self.model = model
+        self.fixed = dict()
+        self.is_feasible = True
+
+        self._rows = [[row, constraint.type, float(constraint.bound)]
+                      for row, constraint in zip(self._sparse_rows(model), model.constraints)]
+
+        # the objective is presolved as a minimization
+        sign = 1.0 if model.objective.type == sseobj.ObjectiveType.MIN else -1.0
+        self._costs = np.zeros(len(model.variables))
+        indices, coefficients = model.objective.expression.sparse_coefficients()
+        np.add.at(self._costs, indices, sign * coefficients)
+
+        changed = True
+        while changed and self.is_feasible:
+            changed = self._substitute_fixed_variables()
+            changed = self._remove_small_rows() or changed
+            changed = self._remove_duplicated_rows() or changed
+            changed = self._fix_dominated_variables() or changed
+
+        self.kept = [var.index for var in model.variables if var.index not in self.fixed]
+        self.reduced_model = self._create_reduced_model() if self.is_feasible else None
+
+    def postsolve(self, assignment: List[float]) -> List[float]:
+        result = [0.0 for _ in self.model.variables]
+        for index, value in self.fixed.items():
+            result[index] = value
+        for reduced_index, index in enumerate(self.kept):
+            result[index] = assignment[reduced_index]
+        return result
+
+    @staticmethod
+    def _sparse_rows(model: ssmod.Model) -> List[Dict[int, float]]:
+        """
+        Maps of the variable index to its coefficient for every constraint, ordered by the index.
+        Repeated variables are summed up.
+        """
+        if len(model.constraints) == 0:
+            return []
+        sparse = [constraint.expression.sparse_coefficients() for constraint in model.constraints]
+        rows = np.repeat(np.arange(len(sparse)), [len(indices) for indices, _ in sparse])
+        n_variables = len(model.variables)
+        keys, positions = np.unique(rows * n_variables + np.concatenate([indices for indices, _ in sparse]),
+                                    return_inverse=True)
+        coefficients = np.bincount(positions.ravel(), weights=np.concatenate([c for _, c in sparse])).tolist()
+        indices = (keys % n_variables).tolist()
+        ends = np.searchsorted(keys // n_variables, np.arange(len(sparse)), side='right').tolist()
+        return [dict(zip(indices[start:end], coefficients[start:end])) for start, end in zip([0] + ends, ends)]
+
+    def _flat_rows(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Row number, variable index and coefficient of every entry of the rows, in the order of the rows"""
+        lengths = [len(row) for row, _, _ in self._rows]
+        count = sum(lengths)
+        rows = np.repeat(np.arange(len(self._rows)), lengths)
+        indices = np.fromiter(chain.from_iterable(row.keys() for row, _, _ in self._rows), dtype=np.int64, count=count)
+        coefficients = np.fromiter(chain.from_iterable(row.values() for row, _, _ in self._rows),
+                                   dtype=np.float64, count=count)
+        return rows, indices, coefficients
+
+    def _rows_of_type(self, type: ssecon.ConstraintType) -> np.ndarray:
+        return np.array([row_type == type for _, row_type, _ in self._rows], dtype=bool)
+
+    def _fix(self, index: int, value: float):
+        if value < -eps or abs(self.fixed.get(index, value) - value) > eps:
+            self.is_feasible = False
+        self.fixed[index] = max(value, 0.0)
+
+    def _substitute_fixed_variables(self) -> bool:
+        changed = False
+        for entry in self._rows:
+            row = entry[0]
+            for index in [i for i, c in row.items() if i in self.fixed or abs(c) <= eps]:
+                entry[2] -= row.pop(index) * self.fixed.get(index, 0.0)
+                changed = True
+        return changed
+
+    def _implied_upper_bounds(self) -> np.ndarray:
+        """
+        Upper bounds of the variables implied by the rows with at least two variables (inf if there is none).
+        A row  sum(a_i * x_i) <= b  with all a_i > 0 (or an equality with the coefficients of the same sign)
+        implies  x_i <= b / a_i, because the other variables are nonnegative.
+        """
+        bounds = np.full(len(self.model.variables), inf)
+        rows, indices, coefficients = self._flat_rows()
+        n_rows = len(self._rows)
+        lengths = np.bincount(rows, minlength=n_rows)
+        positive = np.bincount(rows, weights=coefficients > 0, minlength=n_rows) == lengths
+        negative = np.bincount(rows, weights=coefficients < 0, minlength=n_rows) == lengths
+        implying = (lengths >= 2) & ((positive & ~self._rows_of_type(ssecon.ConstraintType.GE)) |
+                                     (negative & ~self._rows_of_type(ssecon.ConstraintType.LE)))
+        entries = implying[rows]
+        row_bounds = np.array([bound for _, _, bound in self._rows])
+        np.minimum.at(bounds, indices[entries], row_bounds[rows[entries]] / coefficients[entries])
+        return bounds
+
+    def _remove_small_rows(self) -> bool:
+        implied_bounds = self._implied_upper_bounds()
+        kept_rows = []
+        for row, type, bound in self._rows:
+            if len(row) == 0:
+                satisfied = {
+                    ssecon.ConstraintType.LE: bound >= -eps,
+                    ssecon.ConstraintType.GE: bound <= eps,
+                    ssecon.ConstraintType.EQ: abs(bound) <= eps
+                }[type]
+                self.is_feasible = self.is_feasible and satisfied
+            elif len(row) == 1:
+                (index, coefficient), = row.items()
+                # a*x <= b  is equivalent to  x <= b/a (for a > 0) or x >= b/a (for a < 0)
+                limit = bound / coefficient
+                is_upper = type == ssecon.ConstraintType.LE if coefficient > 0 else type == ssecon.ConstraintType.GE
+                if type == ssecon.ConstraintType.EQ or (is_upper and limit <= eps):
+                    self._fix(index, limit)
+                elif is_upper and limit >= implied_bounds[index] - eps:
+                    continue
+                elif is_upper or limit > eps:
+                    kept_rows.append([row, type, bound])
+            else:
+                kept_rows.append([row, type, bound])
+        changed = len(kept_rows) < len(self._rows)
+        self._rows = kept_rows
+        return changed
+
+    def _remove_duplicated_rows(self) -> bool:
+        rows, indices, coefficients = self._flat_rows()
+        # rows are scaled by a positive factor, so the constraint types stay the same
+        scales = np.zeros(len(self._rows))
+        np.maximum.at(scales, rows, np.abs(coefficients))
+        coefficients = coefficients / scales[rows]
+        indices, rounded, coefficients = indices.tolist(), np.round(coefficients, 12).tolist(), coefficients.tolist()
+        ends = np.cumsum([len(row) for row, _, _ in self._rows]).tolist()
+
+        representatives = dict()
+        kept_rows = []
+        for (_, type, bound), scale, start, end in zip(self._rows, scales.tolist(), [0] + ends, ends):
+            # rows are ordered by the variable index, so equal rows give equal keys
+            key = (type, tuple(indices[start:end]), tuple(rounded[start:end]))
+            bound = bound / scale
+            if key not in representatives:
+                representatives[key] = len(kept_rows)
+                kept_rows.append([dict(zip(indices[start:end], coefficients[start:end])), type, bound])
+                continue
+            kept = kept_rows[representatives[key]]
+            if type == ssecon.ConstraintType.LE:
+                kept[2] = min(kept[2], bound)
+            elif type == ssecon.ConstraintType.GE:
+                kept[2] = max(kept[2], bound)
+            elif abs(kept[2] - bound) > eps:
+                self.is_feasible = False
+        changed = len(kept_rows) < len(self._rows)
+        self._rows = kept_rows
+        return changed
+
+    def _fix_dominated_variables(self) -> bool:
+        rows, indices, coefficients = self._flat_rows()
+        # increasing x with a nonzero factor in an equality or with a "relaxing" factor may be needed
+        is_equality, is_upper = self._rows_of_type(ssecon.ConstraintType.EQ), self._rows_of_type(ssecon.ConstraintType.LE)
+        helps = np.zeros(len(self.model.variables), dtype=bool)
+        helps[indices[is_equality[rows] | ((coefficients < 0) == is_upper[rows])]] = True
+        free = np.ones(len(self.model.variables), dtype=bool)
+        free[list(self.fixed)] = False
+        dominated = np.flatnonzero(free & ~helps & (self._costs >= 0)).tolist()
+        for index in dominated:
+            self._fix(index, 0.0)
+        return len(dominated) > 0
+
+    def _create_reduced_model(self) -> ssmod.Model:
+        model = ssmod.Model(self.model.name)
+        variables = model.create_variables(self.model.variables[i].name for i in self.kept)
+        position = {index: k for k, index in enumerate(self.kept)}
+        for row, type, bound in self._rows:
+            expression = model.create_expression(list(row.values()), [variables[position[i]] for i in row])
+            model.add_constraint(ssecon.Constraint(expression, bound, type))
+        objective = model.create_expression(np.array([self._costs[i] for i in self.kept]))
+        if self.model.objective.type == sseobj.ObjectiveType.MIN:
+            model.minimize(objective)
+        else:
+            model.maximize(-1 * objective)
+        return model
@@ -0,0 +1,269 @@
+from __future__ import annotations
+from typing import List, Tuple
+from numpy.typing import ArrayLike
+import numpy as np
+
+import saport.simplex.model as ssmod
+
+eps = 0.000000001
+
+class SparseMatrix:
+    """
+        A class to represent a constraint matrix in the compressed sparse column (CSC) form.
+
+        Attributes
+        ----------
+        shape : Tuple[int, int]
+            number of rows and columns of the matrix
+        data : numpy.Array
+            non-zero values ordered by column (and by row inside a column)
+        indices : numpy.Array
+            row index of every value in data
+        indptr : numpy.Array
+            values of the column j are stored in data[indptr[j]:indptr[j+1]]
+        columns : numpy.Array
+            column index of every value in data, used to sum the values column-wise
+
+        Methods
+        -------
+        __init__(rows: array, cols: array, values: array, shape: Tuple[int, int]) -> SparseMatrix:
+            constructs a matrix from the (row, column, value) triplets, duplicated entries are summed up
+        column(j: int) -> numpy.Array:
+            returns a dense copy of the j-th column
+        transposed_dot(y: array, start: int, stop: int) -> numpy.Array:
+            returns y^T A[:, start:stop]
+    """
+    shape: Tuple[int, int]
+    data: ArrayLike
+    indices: ArrayLike
+    indptr: ArrayLike
+    columns: ArrayLike
+
+    def __init__(self, rows: ArrayLike, cols: ArrayLike, values: ArrayLike, shape: Tuple[int, int]):
+        rows_n, cols_n = shape
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+
+        keys = cols * rows_n + rows
+        keys, inverse = np.unique(keys, return_inverse=True)
+        summed = np.bincount(inverse, weights=values, minlength=len(keys))
+        nonzero = summed != 0.0
+        keys, summed = keys[nonzero], summed[nonzero]
+
+        self.shape = (rows_n, cols_n)
+        self.data = summed
+        self.indices = keys % rows_n
+        self.columns = keys // rows_n
+        self.indptr = np.zeros(cols_n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.columns, minlength=cols_n), out=self.indptr[1:])
+
+    def column(self, j: int) -> ArrayLike:
+        start, stop = self.indptr[j], self.indptr[j + 1]
+        result = np.zeros(self.shape[0])
+        result[self.indices[start:stop]] = self.data[start:stop]
+        return result
+
+    def transposed_dot(self, y: ArrayLike, start: int = 0, stop: int = None) -> ArrayLike:
+        stop = self.shape[1] if stop is None else stop
+        first, last = self.indptr[start], self.indptr[stop]
+        products = self.data[first:last] * y[self.indices[first:last]]
+        return np.bincount(self.columns[first:last] - start, weights=products, minlength=stop - start)
+
+class RevisedSimplex:
+    """
+        A class to represent the revised simplex method for problems in the form: min c^T x, Ax = b, x >= 0, b >= 0.
+        Instead of the full tableaux it keeps only the sparse constraint matrix and the basis inverse,
+        stored as a dense inverse of the last refactorized basis followed by product-form (eta) updates.
+
+        Attributes
+        ----------
+        matrix : SparseMatrix
+            constraint matrix, extended with the artificial columns
+        bounds : numpy.Array
+            right-hand side of the constraints
+        costs : numpy.Array
+            costs of the variables in the second phase (zero for slacks and artificials)
+        basis : numpy.Array
+            indexes of the basic variables, basis[r] is basic in the r-th row
+        values : numpy.Array
+            values of the basic variables
+        artificial : numpy.Array
+            mask of the artificial columns, they are never chosen as entering variables in the second phase
+
+        Methods
+        -------
+        __init__(matrix: SparseMatrix, bounds: array, costs: array, initial_basis: array) -> RevisedSimplex:
+            constructs a solver for the given problem, initial_basis[r] is the index of a unit column
+            with 1 in the r-th row or -1 when the row needs an artificial variable
+        from_model(model: Model, basic_variables: Dict[int, Variable]) -> RevisedSimplex:
+            constructs a solver for the augmented model (maximization, equality constraints, nonnegative bounds)
+            basic_variables maps row index to the slack variable usable as its initial basic variable
+        solve() -> bool | None:
+            runs both phases of the simplex, returns None if the problem is infeasible, False if it is unbounded
+            and True if an optimal solution was found
+        extract_assignment() -> List[float]:
+            returns values of all the non-artificial variables
+    """
+    REFACTORIZATION_PERIOD = 64
+    PRICING_BLOCK = 256
+
+    matrix: SparseMatrix
+    bounds: ArrayLike
+    costs: ArrayLike
+    basis: ArrayLike
+    values: ArrayLike
+    artificial: ArrayLike
+
+    def __init__(self, matrix: SparseMatrix, bounds: ArrayLike, costs: ArrayLike, initial_basis: ArrayLike):
+        rows_n, cols_n = matrix.shape
+        initial_basis = np.asarray(initial_basis, dtype=np.int64)
+        missing = np.flatnonzero(initial_basis < 0)
+
+        rows = np.concatenate([matrix.indices, missing])
+        cols = np.concatenate([matrix.columns, cols_n + np.arange(len(missing))])
+        values = np.concatenate([matrix.data, np.ones(len(missing))])
+        self.matrix = SparseMatrix(rows, cols, values, (rows_n, cols_n + len(missing)))
+
+        self.bounds = np.asarray(bounds, dtype=np.float64)
+        self.costs = np.concatenate([np.asarray(costs, dtype=np.float64), np.zeros(len(missing))])
+        self.artificial = np.zeros(self.matrix.shape[1], dtype=bool)
+        self.artificial[cols_n:] = True
+
+        self.basis = initial_basis.copy()
+        self.basis[missing] = cols_n + np.arange(len(missing))
+        self._is_basic = np.zeros(self.matrix.shape[1], dtype=bool)
+        self._is_basic[self.basis] = True
+        self._inverse = None
+        self._etas = []
+        self.values = self.bounds.copy()
+        self._pricing_start = 0
+
+    @staticmethod
+    def from_model(model: ssmod.Model, basic_variables) -> RevisedSimplex:
+        rows, cols, values = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)], [np.zeros(0)]
+        for constraint in model.constraints:
+            indices, coefficients = constraint.expression.sparse_coefficients()
+            rows.append(np.full(len(indices), constraint.index))
+            cols.append(indices)
+            values.append(coefficients)
+        shape = (len(model.constraints), len(model.variables))
+        matrix = SparseMatrix(np.concatenate(rows), np.concatenate(cols), np.concatenate(values), shape)
+
+        bounds = [c.bound for c in model.constraints]
+        costs = np.zeros(len(model.variables))
+        indices, coefficients = model.objective.expression.sparse_coefficients()
+        np.subtract.at(costs, indices, coefficients)
+
+        initial_basis = [-1 for _ in model.constraints]
+        for row, var in basic_variables.items():
+            initial_basis[row] = var.index
+        return RevisedSimplex(matrix, bounds, costs, initial_basis)
+
+    def solve(self):
+        if self.artificial.any():
+            phase_one_costs = self.artificial.astype(np.float64)
+            self._optimize(phase_one_costs, np.ones_like(self.artificial))
+            if phase_one_costs[self.basis] @ self.values > eps * np.abs(self.bounds).max(initial=1.0):
+                return None
+            self._drive_out_artificial_variables()
+        return self._optimize(self.costs, ~self.artificial)
+
+    def extract_assignment(self) -> List[float]:
+        assignment = np.zeros(self.matrix.shape[1])
+        assignment[self.basis] = self.values
+        return list(assignment[~self.artificial])
+
+    def _optimize(self, costs: ArrayLike, allowed: ArrayLike) -> bool:
+        degenerate_steps = 0
+        while True:
+            bland = degenerate_steps > len(self.basis)
+            prices = self._btran(costs[self.basis])
+            col = self._choose_entering_variable(costs, prices, allowed, bland)
+            if col is None:
+                return True
+            direction = self._ftran(self.matrix.column(col))
+            row = self._choose_leaving_variable(direction, bland)
+            if row is None:
+                return False
+            step = self.values[row] / direction[row]
+            degenerate_steps = degenerate_steps + 1 if step <= eps else 0
+            self._pivot(row, col, direction, step)
+
+    def _choose_entering_variable(self, costs: ArrayLike, prices: ArrayLike, allowed: ArrayLike, bland: bool):
+        """
+            _choose_entering_variable(...) -> int | None:
+                prices one block of columns at a time and returns the most negative reduced cost in the first block
+                containing one (or the first such column at all, if bland's rule is used)
+        """
+        cols_n = self.matrix.shape[1]
+        block = cols_n if bland else max(self.PRICING_BLOCK, cols_n // 8)
+        start = 0 if bland else self._pricing_start
+        for _ in range(0, cols_n, block):
+            stop = min(start + block, cols_n)
+            reduced_costs = costs[start:stop] - self.matrix.transposed_dot(prices, start, stop)
+            candidates = allowed[start:stop] & ~self._is_basic[start:stop] & (reduced_costs < -eps)
+            if candidates.any():
+                self._pricing_start = stop % cols_n
+                if bland:
+                    return start + int(np.argmax(candidates))
+                return start + int(np.argmin(np.where(candidates, reduced_costs, np.inf)))
+            start = stop % cols_n
+        return None
+
+    def _choose_leaving_variable(self, direction: ArrayLike, bland: bool):
+        positive = direction > eps
+        if not positive.any():
+            return None
+        ratios = np.where(positive, self.values / np.where(positive, direction, 1.0), np.inf)
+        ties = np.flatnonzero(ratios <= ratios.min() + eps)
+        if bland:
+            return ties[np.argmin(self.basis[ties])]
+        # among the tied rows the largest pivot is the most stable one
+        return ties[np.argmax(direction[ties])]
+
+    def _pivot(self, row: int, col: int, direction: ArrayLike, step: float):
+        self.values -= step * direction
+        self.values[row] = step
+        self._is_basic[self.basis[row]] = False
+        self._is_basic[col] = True
+        self.basis[row] = col
+        self._etas.append((row, direction))
+        if len(self._etas) >= self.REFACTORIZATION_PERIOD:
+            self._refactorize()
+
+    def _refactorize(self):
+        rows_n = len(self.basis)
+        basis_matrix = np.zeros((rows_n, rows_n))
+        for r, col in enumerate(self.basis):
+            basis_matrix[:, r] = self.matrix.column(col)
+        self._inverse = np.linalg.inv(basis_matrix)
+        self._etas = []
+        self.values = np.maximum(self._inverse @ self.bounds, 0.0)
+
+    def _ftran(self, column: ArrayLike) -> ArrayLike:
+        """ returns B^-1 column """
+        result = column if self._inverse is None else self._inverse @ column
+        for row, direction in self._etas:
+            pivot = result[row] / direction[row]
+            result = result - pivot * direction
+            result[row] = pivot
+        return result
+
+    def _btran(self, costs: ArrayLike) -> ArrayLike:
+        """ returns costs^T B^-1 """
+        result = np.array(costs, dtype=np.float64)
+        for row, direction in reversed(self._etas):
+            result[row] = (result[row] * (1.0 + direction[row]) - result @ direction) / direction[row]
+        return result if self._inverse is None else result @ self._inverse
+
+    def _drive_out_artificial_variables(self):
+        for row in np.flatnonzero(self.artificial[self.basis]):
+            unit = np.zeros(len(self.basis))
+            unit[row] = 1.0
+            pivot_row = self.matrix.transposed_dot(self._btran(unit))
+            candidates = ~self.artificial & ~self._is_basic & (np.abs(pivot_row) > eps)
+            if candidates.any():
+                col = int(np.argmax(np.abs(np.where(candidates, pivot_row, 0.0))))
+                direction = self._ftran(self.matrix.column(col))
+                self._pivot(row, col, direction, self.values[row] / direction[row])
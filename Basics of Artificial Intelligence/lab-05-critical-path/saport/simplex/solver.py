@@ -1,6 +1,7 @@
 from __future__ import annotations
 import sys
 from typing import Dict, List
+from numpy.typing import DTypeLike
 
 from copy import deepcopy
 import saport.simplex.model as ssmod
@@ -9,6 +10,8 @@ import saport.simplex.expressions.constraint as ssecon
 import saport.simplex.expressions.expression as sseexp
 import saport.simplex.solution as sssol
 import saport.simplex.tableaux as sstab
+import saport.simplex.revised as ssrev
+import saport.simplex.presolve as sspre
 import numpy as np
 
 class Solver:
@@ -17,6 +20,13 @@ class Solver:
 
         Attributes:
         ______
+        revised: bool
+            whether to use the revised simplex (sparse constraint matrix, factorized basis) instead of the full tableaux
+        dtype: DTypeLike
+            dtype of the tableaux (float64 by default, float32 only for large, well-conditioned models),
+            the revised simplex always uses float64
+        _reduction: Presolve
+            presolve of the solved model, maps the solution of the reduced model back to the original variables
         _slacks: Dict[Variable, Constraint]:
             contains mapping from slack variables to their corresponding constraints
         _surpluses: Dict[Variable, Constraint]:
@@ -26,15 +36,37 @@ class Solver:
 
         Methods
         -------
+        __init__(revised: bool = False, dtype: DTypeLike = None) -> Solver:
+            constructs a solver using the full tableaux or the revised simplex
         solve(model: Model) -> Tableaux:
             solves the given model and return the first solution
     """
+    revised: bool
+    dtype: DTypeLike
+    _reduction: sspre.Presolve
     _slacks: Dict[sseexp.Variable, ssecon.Constraint]
     _surpluses: Dict[sseexp.Variable, ssecon.Constraint]
     _artificial: Dict[sseexp.Variable, ssecon.Constraint]
 
+    def __init__(self, revised: bool = False, dtype: DTypeLike = None):
+        self.revised = revised
+        self.dtype = dtype
+
     def solve(self, model: ssmod.Model):
-        normal_model = self._augment_model(model)
+        self._reduction = sspre.Presolve(model)
+        if not self._reduction.is_feasible:
+            return sssol.Solution.infeasible(model, None, None)
+        reduced_model = self._reduction.reduced_model
+        if len(reduced_model.constraints) == 0:
+            # every variable left after the presolve improves the objective without any limit
+            if len(reduced_model.variables) > 0:
+                return sssol.Solution.unbounded(model, None, None)
+            return self._create_solution([], model, None, None)
+
+        normal_model = self._augment_model(reduced_model)
+        if self.revised:
+            return self._solve_revised(model, normal_model)
+
         if len(self._slacks) < len(normal_model.constraints):
             tableaux, success = self._presolve(normal_model)
             if not success:
@@ -59,6 +91,20 @@ class Solver:
             tableaux.pivot(pivot_row, pivot_col)
         return True
 
+    def _solve_revised(self, model: ssmod.Model, normal_model: ssmod.Model):
+        """
+            _solve_revised(model: Model, normal_model: Model) -> Solution:
+                solves the augmented model with the revised simplex, the solution has no tableaux
+        """
+        basic_variables = {constraint.index: slack for (slack, constraint) in self._slacks.items()}
+        revised = ssrev.RevisedSimplex.from_model(normal_model, basic_variables)
+        result = revised.solve()
+        if result is None:
+            return sssol.Solution.infeasible(model, None, None)
+        if result == False:
+            return sssol.Solution.unbounded(model, None, None)
+        return self._create_solution(revised.extract_assignment(), model, None, None)
+
     def _presolve(self, model: ssmod.Model):
         """
             _presolve(model: Model) -> Tableaux:
@@ -148,43 +194,80 @@ class Solver:
             objective_row = objective_row - factors_row
 
         table = np.array([objective_row] + [c.expression.coefficients(model) + [c.bound] for c in model.constraints])
-        return sstab.Tableaux(model, table)
+        return sstab.Tableaux(model, table, self.dtype, basis=self._initial_basis(model, self._artificial))
 
     def _basic_initial_tableaux(self, model: ssmod.Model):
         objective_row = np.array((-1 * model.objective.expression).coefficients(model) + [0.0])
         table = np.array([objective_row] + [c.expression.coefficients(model) + [c.bound] for c in model.constraints])
-        return sstab.Tableaux(model, table)
+        return sstab.Tableaux(model, table, self.dtype, basis=self._initial_basis(model))
+
+    def _initial_basis(self, model: ssmod.Model, artificial: Dict[sseexp.Variable, ssecon.Constraint] = {}) -> List[int]:
+        """
+            _initial_basis(model: Model, artificial: Dict[Variable, Constraint]) -> List[int]:
+                returns the starting basis: the slack or artificial variable of every constraint
+        """
+        basis = [-1 for _ in model.constraints]
+        for var, constraint in list(self._slacks.items()) + list(artificial.items()):
+            basis[constraint.index] = var.index
+        return basis
 
     def _artifical_variables_are_positive(self, tableaux: sstab.Tableaux):
         assignment = tableaux.extract_assignment()
         for artificial_var in self._artificial:
-            if assignment[artificial_var.index] > 0:
+            if assignment[artificial_var.index] > tableaux.eps:
                 return True
         return False
 
     def _restore_initial_tableaux(self, tableaux, model):
-        basis = tableaux.extract_basis()
+        tableaux = self._drive_out_artificial_variables(tableaux)
         tableaux = self._remove_artificial_variables(tableaux)
         tableaux = self._restore_original_objective_row(tableaux, model)
-        tableaux = self._fix_objective_row_to_the_basis(tableaux, basis)
+        tableaux = self._fix_objective_row_to_the_basis(tableaux, tableaux.extract_basis())
         return tableaux
 
+    def _drive_out_artificial_variables(self, tableaux: sstab.Tableaux):
+        """
+            _drive_out_artificial_variables(tableaux: Tableaux) -> Tableaux:
+                pivots the artificial variables left in the basis (at zero level) out of it,
+                a row without any other nonzero factor is redundant and gets removed
+        """
+        artificial = np.zeros(tableaux.table.shape[1] - 1, dtype=bool)
+        artificial[[var.index for var in self._artificial.keys()]] = True
+        redundant_rows = []
+        for (constr_index, col) in enumerate(tableaux.extract_basis()):
+            if col < 0 or not artificial[col]:
+                continue
+            row = constr_index + 1
+            factors = np.where(artificial, 0.0, np.abs(tableaux.table[row, :-1]))
+            entering = int(factors.argmax())
+            if factors[entering] > tableaux.eps:
+                tableaux.pivot(row, entering)
+            else:
+                redundant_rows.append(row)
+        if len(redundant_rows) == 0:
+            return tableaux
+        table = np.delete(tableaux.table, redundant_rows, 0)
+        basis = np.delete(tableaux.basis, [row - 1 for row in redundant_rows])
+        return sstab.Tableaux(tableaux.model, table, basis=basis)
+
     def _remove_artificial_variables(self, tableaux: sstab.Tableaux):
         columns_to_remove = [var.index for var in self._artificial.keys()]
         table = np.delete(tableaux.table, columns_to_remove, 1)
-        return sstab.Tableaux(tableaux.model, table)
+        shift = np.cumsum(np.isin(np.arange(tableaux.table.shape[1]), columns_to_remove))
+        basis = [col - shift[col] for col in tableaux.extract_basis()]
+        return sstab.Tableaux(tableaux.model, table, basis=basis)
 
     def _restore_original_objective_row(self, tableaux: sstab.Tableaux, model: ssmod.Model):
         objective_row = np.array((-1 * model.objective.expression).coefficients(model) + [0.0])
         new_table = np.array(tableaux.table)
         new_table[0] = objective_row
-        return sstab.Tableaux(model, new_table)
+        return sstab.Tableaux(model, new_table, basis=tableaux.basis)
 
     def _fix_objective_row_to_the_basis(self, tableaux: sstab.Tableaux, basis: List[int]):
         objective_row = tableaux.table[0].copy()
 
         for (constr_index, col) in enumerate(basis):
-            if col >= len(objective_row) - 1:
+            if col < 0:
                 continue
 
             row = constr_index + 1
@@ -195,7 +278,8 @@ class Solver:
 
         new_table = np.array(tableaux.table)
         new_table[0] = objective_row
-        return sstab.Tableaux(tableaux.model, new_table)
+        return sstab.Tableaux(tableaux.model, new_table, basis=tableaux.basis)
 
     def _create_solution(self, assignment: List[float], model: ssmod.Model, initial_tableaux: sstab.Tableaux, tableaux: sstab.Tableaux):
+        assignment = self._reduction.postsolve(assignment)
         return sssol.Solution.with_assignment(model, assignment, initial_tableaux, tableaux)
\ No newline at end of file
@@ -1,11 +1,22 @@
 from __future__ import annotations
 from typing import List
-from numpy.typing import ArrayLike
+from numpy.typing import ArrayLike, DTypeLike
 import numpy as np
 
 from . import model as ssmod
 
 eps = 0.000000001
+# number of rows updated at once by the dense pivot
+PIVOT_BLOCK = 64
+
+def table_dtype(table: ArrayLike, dtype: DTypeLike = None) -> np.dtype:
+    """
+        returns the dtype used to store the tableaux: the requested one or float32 for float32 tables,
+        float64 otherwise (float32 is only meant for large, well-conditioned models)
+    """
+    if dtype is not None:
+        return np.dtype(dtype)
+    return np.dtype(np.float32) if np.asarray(table).dtype == np.float32 else np.dtype(np.float64)
 
 class Tableaux:
     """
@@ -16,12 +27,17 @@ class Tableaux:
         model : Model
             model corresponding to the tableaux
         table : numpy.Array
-            2d-array with the tableaux
+            2d-array with the tableaux, float64 by default or float32 if requested
+        eps : float
+            tolerance used in the optimality checks, adjusted to the precision of the table
+        basis : numpy.Array
+            basis[r] is the index of the variable basic in the (r+1)-th row (-1 if unknown), updated by pivot
 
         Methods
         -------
-        __init__(model: Model, table: array) -> Tableaux:
-            constructs a new tableaux for the specified model and initial table
+        __init__(model: Model, table: array, dtype: DTypeLike = None, basis: List[int] = None) -> Tableaux:
+            constructs a new tableaux for the specified model and initial table (copied once into a contiguous buffer)
+            if the basis is not given, it is found by scanning the table for the unit columns
         cost_factors() -> numpy.Array:
             returns a vector containing factors in the cost row
         cost() -> float:
@@ -34,8 +50,9 @@ class Tableaux:
             checks whether the problem is unbounded
         choose_leaving_variable(col: int) -> int:
             finds index of the variable, that should leave the basis next
+            ties in the ratio test are broken by the smallest basic variable index (bland's rule)
         pivot(col: int, row: int):
-            updates tableaux using pivot operation with given entering and leaving variables
+            updates tableaux in place using pivot operation with given entering and leaving variables
         extract_assignment() -> List[float]:
             returns assignment corresponding to the tableaux
         extract_basis() -> List[int]
@@ -43,10 +60,13 @@ class Tableaux:
     """
     model: ssmod.Model
     table: ArrayLike
+    basis: ArrayLike
 
-    def __init__(self, model: ssmod.Model, table: ArrayLike):
+    def __init__(self, model: ssmod.Model, table: ArrayLike, dtype: DTypeLike = None, basis: List[int] = None):
         self.model = model
-        self.table = table
+        self.table = np.array(table, dtype=table_dtype(table, dtype), order='C')
+        self.eps = max(eps, 64 * np.finfo(self.table.dtype).eps)
+        self.basis = np.array(self._find_basis() if basis is None else basis, dtype=np.int64)
 
     def cost_factors(self) -> ArrayLike:
         return self.table[0,:-1] 
@@ -55,54 +75,62 @@ class Tableaux:
         return self.table[0, -1]
 
     def is_optimal(self) -> bool:
-        return self.cost_factors().min() >= -eps
+        return self.cost_factors().min() >= -self.eps
 
     def choose_entering_variable(self) -> int:
         return self.cost_factors().argmin()
 
     def is_unbounded(self, col: int) -> bool:
-        return self.table[1:, col].max() <= 0 
+        return self.table[1:, col].max() <= self.eps
 
     def choose_leaving_variable(self, col: int) -> int:
         column = np.copy(self.table[1:, col])
-        column = np.where(column > 0, column, -1)
+        column = np.where(column > self.eps, column, -1)
         indicators = self.table[1:, -1] / column
-        quotients = np.where(column > 0, indicators, np.inf)
-        index = len(quotients) - np.argmin(quotients[::-1])
+        quotients = np.where(column > self.eps, indicators, np.inf)
+        ties = np.flatnonzero(quotients <= quotients.min() + self.eps)
+        index = ties[np.argmin(self.basis[ties])] + 1
 
         return index
 
     def pivot(self, row: int, col: int):
-        rows_n, cols_n = self.table.shape
-        pivot_factor = self.table[row, col]
-
-        new_table = self.table.copy()
-        new_table[row] = self.table[row] / pivot_factor
-
-        new_table[:, col] = 0.0
-        new_table[row, col] = 1.0
-        
-        for r in range(rows_n):
-            if r == row:
-                continue
-            for c in range(cols_n):
-                if c == col:
-                    continue 
-                new_table[r,c] = (-self.table[r, col]) * new_table[row, c] + self.table[r,c]
-
-        self.table = new_table
+        pivot_row = self.table[row]
+        pivot_row /= pivot_row[col]
+
+        # rank-1 update of the other rows, in place: a sparse pivot column updates only its nonzero rows,
+        # a dense one goes in blocks of rows through a small buffer instead of a full outer product
+        column = self.table[:, col].copy()
+        column[row] = 0.0
+        rows = np.flatnonzero(column)
+        if 4 * len(rows) < len(column):
+            self.table[rows] -= column[rows, np.newaxis] * pivot_row
+        else:
+            buffer = np.empty((min(PIVOT_BLOCK, len(column)), len(pivot_row)), dtype=self.table.dtype)
+            for start in range(0, len(column), PIVOT_BLOCK):
+                stop = min(start + PIVOT_BLOCK, len(column))
+                block = buffer[:stop - start]
+                np.multiply(column[start:stop, np.newaxis], pivot_row, out=block)
+                self.table[start:stop] -= block
+
+        # the pivot column is set exactly, so that basic columns stay unit vectors
+        self.table[:, col] = 0.0
+        self.table[row, col] = 1.0
+        self.basis[row - 1] = col
 
     def extract_assignment(self) -> List[float]:
         rows_n, cols_n = self.table.shape
         assignment = [0.0 for _ in range(cols_n - 1)]
-        basis = self.extract_basis()
         for r in range(1, rows_n):
-            var_index = basis[r - 1]
-            assignment[var_index] = self.table[r, -1]
+            var_index = self.basis[r - 1]
+            if var_index >= 0:
+                assignment[var_index] = self.table[r, -1]
         
         return assignment
     
     def extract_basis(self) -> List[int]:
+        return [int(c) for c in self.basis]
+
+    def _find_basis(self) -> List[int]:
         rows_n, cols_n = self.table.shape
         basis = [-1 for _ in range(rows_n -1)]
         for c in range(cols_n - 1):
@@ -123,7 +151,7 @@ class Tableaux:
         header = ["basis", cost_name] + [var.name for var in self.model.variables] + ["b"]
         longest_col = max([len(h) for h in header])
 
-        rows = [[cost_name]] + [[self.model.variables[i].name] for i in basis]
+        rows = [[cost_name]] + [[self.model.variables[i].name if i >= 0 else "?"] for i in basis]
 
         for (i,r) in enumerate(rows):
             cost_factor = 0.0 if i > 0 else 1.0
@@ -4,18 +4,21 @@ import saport.critical_path.solvers.simplex_solver_min as ssmin
 import saport.critical_path.solvers.simplex_solver_max as ssmax
 import saport.critical_path.solvers.networkx_solver as nxs
 import saport.critical_path.solvers.cpm_solver as cpms
+import saport.simplex.model as ssmod
+import saport.simplex.expressions.constraint as ssecon
+import saport.simplex.presolve as sspre
+import numpy as np
 import glob
 
 TEST_DIR = "test_projects"
 
-def check(path: str):
-
-    def soft_assert(succ: bool, error: str) -> int:
-        if not succ:
-            print(error)
-            return 1
-        return 0
+def soft_assert(succ: bool, error: str) -> int:
+    if not succ:
+        print(error)
+        return 1
+    return 0
 
+def check(path: str):
     error_count = 0
     project = model.Project.from_file(path)
     expected = sol.FullSolution.expected_solution_from_file(path)
@@ -43,8 +46,193 @@ def check(path: str):
     error_count += soft_assert(cpm_solution.task_slacks == expected.task_slacks, f"* cpm solver found incorrect slacks for {path}: found {cpm_solution.task_slacks}, expected {expected.task_slacks}")
     return error_count
 
+def check_simplex(model: ssmod.Model, expected_value: float, description: str):
+    error_count = 0
+    for revised in [False, True]:
+        solver_name = "revised simplex" if revised else "simplex"
+        solution = model.solve(revised)
+        found = solution.objective_value() if solution.is_feasible and solution.is_bounded else None
+        error_count += soft_assert(found is not None and abs(found - expected_value) < 1e-6, f"* {solver_name} found incorrect objective value for {description}: found {found}, expected {expected_value}")
+    return error_count
+
+def is_feasible_assignment(model: ssmod.Model, assignment, tolerance: float = 1e-6) -> bool:
+    if any(value < -tolerance for value in assignment):
+        return False
+    for constraint in model.constraints:
+        value = constraint.expression.evaluate(assignment)
+        satisfied = {
+            ssecon.ConstraintType.LE: value <= constraint.bound + tolerance,
+            ssecon.ConstraintType.GE: value >= constraint.bound - tolerance,
+            ssecon.ConstraintType.EQ: abs(value - constraint.bound) <= tolerance
+        }[constraint.type]
+        if not satisfied:
+            return False
+    return True
+
+def random_model(rng: np.random.Generator, index: int) -> ssmod.Model:
+    # small integer factors make degenerate, infeasible and unbounded models common
+    model = ssmod.Model(f"random model {index}")
+    variables = model.create_variables(f"x{i}" for i in range(rng.integers(2, 8)))
+    types = [ssecon.ConstraintType.LE, ssecon.ConstraintType.GE, ssecon.ConstraintType.EQ]
+    for _ in range(rng.integers(1, 8)):
+        coefficients = rng.integers(-5, 6, len(variables)) * (rng.random(len(variables)) < 0.7)
+        type = types[rng.choice(3, p=[0.5, 0.3, 0.2])]
+        model.add_constraint(ssecon.Constraint(model.create_expression(coefficients), float(rng.integers(-5, 21)), type))
+    if rng.random() < 0.8:
+        model.add_constraint(ssecon.Constraint(model.create_expression(np.ones(len(variables))), 20.0, ssecon.ConstraintType.LE))
+    objective = model.create_expression(rng.integers(-5, 6, len(variables)))
+    model.maximize(objective) if rng.random() < 0.5 else model.minimize(objective)
+    return model
+
+def check_revised_simplex(models: int):
+    error_count = 0
+    rng = np.random.default_rng(0)
+    for index in range(models):
+        model = random_model(rng, index)
+        tableaux_solution = model.solve(revised=False)
+        revised_solution = model.solve(revised=True)
+        status = (tableaux_solution.is_feasible, tableaux_solution.is_bounded)
+        error_count += soft_assert((revised_solution.is_feasible, revised_solution.is_bounded) == status, f"* revised simplex and simplex disagree whether {model.name} is feasible and bounded")
+        if status != (True, True) or not revised_solution.is_feasible or not revised_solution.is_bounded:
+            continue
+        for solver_name, solution in [("simplex", tableaux_solution), ("revised simplex", revised_solution)]:
+            error_count += soft_assert(is_feasible_assignment(model, solution.assignment()), f"* {solver_name} found an infeasible assignment for {model.name}")
+        error_count += soft_assert(abs(revised_solution.objective_value() - tableaux_solution.objective_value()) < 1e-6, f"* revised simplex found different objective value for {model.name}: found {revised_solution.objective_value()}, expected {tableaux_solution.objective_value()}")
+    return error_count
+
+def check_presolve(model: ssmod.Model, expected_value: float, reduced_constraints: int, fixed: dict):
+    presolve = sspre.Presolve(model)
+    if not presolve.is_feasible:
+        return soft_assert(False, f"* presolve found feasible {model.name} infeasible")
+    error_count = 0
+    error_count += soft_assert(len(presolve.reduced_model.constraints) == reduced_constraints, f"* presolve left incorrect number of constraints in {model.name}: found {len(presolve.reduced_model.constraints)}, expected {reduced_constraints}")
+    error_count += soft_assert(presolve.fixed == fixed, f"* presolve fixed incorrect variables in {model.name}: found {presolve.fixed}, expected {fixed}")
+    reduced_solution = presolve.reduced_model.solve()
+    assignment = presolve.postsolve(reduced_solution.assignment())
+    error_count += soft_assert(is_feasible_assignment(model, assignment), f"* postsolved assignment is infeasible for {model.name}")
+    error_count += soft_assert(abs(model.objective.evaluate(assignment) - expected_value) < 1e-6, f"* postsolved assignment has incorrect objective value for {model.name}: found {model.objective.evaluate(assignment)}, expected {expected_value}")
+    return error_count + check_simplex(model, expected_value, model.name)
+
+def check_infeasible_presolve(model: ssmod.Model):
+    error_count = soft_assert(not sspre.Presolve(model).is_feasible, f"* presolve didn't find {model.name} infeasible")
+    for revised in [False, True]:
+        error_count += soft_assert(not model.solve(revised).is_feasible, f"* simplex didn't find {model.name} infeasible")
+    return error_count
+
+def check_presolve_round_trip(models: int):
+    error_count = 0
+    rng = np.random.default_rng(1)
+    for index in range(models):
+        model = random_model(rng, index)
+        presolve = sspre.Presolve(model)
+        solution = model.solve()
+        status = (solution.is_feasible, solution.is_bounded)
+        if not presolve.is_feasible:
+            error_count += soft_assert(not solution.is_feasible, f"* presolve found {model.name} infeasible, but the simplex didn't")
+            continue
+        # the presolve may fix all the variables
+        reduced_assignment = []
+        if len(presolve.kept) > 0:
+            reduced_solution = presolve.reduced_model.solve()
+            reduced_status = (reduced_solution.is_feasible, reduced_solution.is_bounded)
+            if reduced_status != (True, True):
+                error_count += soft_assert(reduced_status == status, f"* presolve changed whether {model.name} is feasible and bounded")
+                continue
+            reduced_assignment = reduced_solution.assignment()
+        if status != (True, True):
+            error_count += soft_assert(False, f"* presolve changed whether {model.name} is feasible and bounded")
+            continue
+        assignment = presolve.postsolve(reduced_assignment)
+        error_count += soft_assert(is_feasible_assignment(model, assignment), f"* postsolved assignment is infeasible for {model.name}")
+        error_count += soft_assert(abs(model.objective.evaluate(assignment) - solution.objective_value()) < 1e-6, f"* postsolved assignment has incorrect objective value for {model.name}: found {model.objective.evaluate(assignment)}, expected {solution.objective_value()}")
+    return error_count
+
+def fixed_and_singleton_model() -> ssmod.Model:
+    # x0 is fixed by the first row, -x2 <= 3 is implied by x2 >= 0 and gets dropped
+    model = ssmod.Model("fixed variables and singleton rows")
+    x0, x1, x2 = model.create_variable("x0"), model.create_variable("x1"), model.create_variable("x2")
+    model.add_constraint(2 * x0 == 6)
+    model.add_constraint(x0 + x1 + x2 <= 10)
+    model.add_constraint(x1 <= 4)
+    model.add_constraint(-1 * x2 <= 3)
+    model.add_constraint(x2 >= 1)
+    model.maximize(2 * x0 + 3 * x1 + x2)
+    return model
+
+def duplicated_rows_model() -> ssmod.Model:
+    # the first two rows are parallel, only the tighter one is kept
+    model = ssmod.Model("duplicated rows")
+    x, y = model.create_variable("x"), model.create_variable("y")
+    model.add_constraint(x + y <= 10)
+    model.add_constraint(2 * x + 2 * y <= 16)
+    model.add_constraint(x - y >= -2)
+    model.add_constraint(3 * x + 3 * y >= 3)
+    model.maximize(x + 2 * y)
+    return model
+
+def dominated_column_model() -> ssmod.Model:
+    # increasing z only costs more and tightens its only constraint, so it's fixed to 0
+    model = ssmod.Model("dominated column")
+    x, y, z = model.create_variable("x"), model.create_variable("y"), model.create_variable("z")
+    model.add_constraint(x + y >= 4)
+    model.add_constraint(x + z <= 8)
+    model.add_constraint(y <= 3)
+    model.minimize(x + y + 2 * z)
+    return model
+
+def implied_bounds_model() -> ssmod.Model:
+    # x <= 5 and y <= 2 are implied by x + 2y == 4 and get dropped, z <= 1 is tighter than y + z <= 3 and stays
+    model = ssmod.Model("implied upper bounds")
+    x, y, z = model.create_variable("x"), model.create_variable("y"), model.create_variable("z")
+    model.add_constraint(x + 2 * y == 4)
+    model.add_constraint(y + z <= 3)
+    model.add_constraint(x <= 5)
+    model.add_constraint(y <= 2)
+    model.add_constraint(z <= 1)
+    model.maximize(x + y + z)
+    return model
+
+def contradicting_rows_model() -> ssmod.Model:
+    # parallel equalities with different bounds
+    model = ssmod.Model("contradicting rows")
+    x, y = model.create_variable("x"), model.create_variable("y")
+    model.add_constraint(x + y == 2)
+    model.add_constraint(2 * x + 2 * y == 6)
+    model.maximize(x + y)
+    return model
+
+def zero_level_artificial_model() -> ssmod.Model:
+    # an artificial variable stays in the basis at zero level after the first phase
+    model = ssmod.Model("zero level artificial variable")
+    x0, x1 = model.create_variable("x0"), model.create_variable("x1")
+    model.add_constraint(-3 * x0 + 3.68 * x1 <= -2)
+    model.add_constraint(-6 * x0 + 7.36 * x1 >= -4)
+    model.add_constraint(0 * x0 + 0 * x1 <= 6)
+    model.add_constraint(3 * x0 + 3.7 * x1 >= 6)
+    model.minimize(4 * x0 + 2 * x1)
+    return model
+
+def redundant_equality_model() -> ssmod.Model:
+    # the third equality is the first one multiplied by 3, its artificial variable can't leave the basis
+    model = ssmod.Model("redundant equality")
+    x0, x1, x2 = model.create_variable("x0"), model.create_variable("x1"), model.create_variable("x2")
+    model.add_constraint(-4 * x0 - 3 * x1 + x2 == -4)
+    model.add_constraint(-2 * x0 - 3 * x1 + 3 * x2 == -4)
+    model.add_constraint(-12 * x0 - 9 * x1 + 3 * x2 == -12)
+    model.minimize(-4 * x0 + 7 * x2)
+    return model
+
 if __name__ == "__main__":
     assert_error_count = 0
+    assert_error_count += check_simplex(zero_level_artificial_model(), 6.410117434507679, "model with a zero level artificial variable")
+    assert_error_count += check_simplex(redundant_equality_model(), 0.0, "model with a redundant equality")
+    assert_error_count += check_revised_simplex(300)
+    assert_error_count += check_presolve(fixed_and_singleton_model(), 21.0, 3, {0: 3.0})
+    assert_error_count += check_presolve(duplicated_rows_model(), 13.0, 3, {})
+    assert_error_count += check_presolve(dominated_column_model(), 4.0, 3, {2: 0.0})
+    assert_error_count += check_presolve(implied_bounds_model(), 5.0, 3, {})
+    assert_error_count += check_infeasible_presolve(contradicting_rows_model())
+    assert_error_count += check_presolve_round_trip(300)
     for path in glob.glob(TEST_DIR + "/*.txt"):
         assert_error_count += check(path)
 
@@ -10,6 +10,8 @@ eps is used to avoid numerical errors, e.g.
 - for inequality checks, instead of >= 0 you may just write >= -eps
 """
 eps = 1e-09
+# number of rows updated at once by the dense pivot
+PIVOT_BLOCK = 64
 
 
 class Tableaux:
@@ -26,7 +28,7 @@ class Tableaux:
     Methods
     -------
     __init__(model: Model, table: array) -> Tableaux:
-        constructs a new tableaux for the specified model and initial table
+        constructs a new tableaux for the specified model and initial table (copied once into a contiguous buffer)
     objective_coefficients() -> numpy.Array:
         returns a vector containing coefficients in the objective row
     objective_value() -> float:
@@ -40,7 +42,7 @@ class Tableaux:
     choose_leaving_variable(col: int) -> int:
         finds index of the variable, that should leave the basis next
     pivot(col: int, row: int):
-        updates tableaux using pivot operation with given entering and leaving variables
+        updates tableaux in place using pivot operation with given entering and leaving variables
     extract_assignment() -> List[float]:
         returns assignment corresponding to the tableaux
     extract_basis() -> List[int]
@@ -52,7 +54,7 @@ class Tableaux:
 
     def __init__(self, model: ssmod.Model, table: ArrayLike):
         self.model = model
-        self.table = table
+        self.table = np.array(table, dtype=np.float64, order="C")
 
     def objective_coefficients(self) -> ArrayLike:
         return self.table[0, :-1]
@@ -143,27 +145,29 @@ class Tableaux:
         # can be easily multiplied), or add one row (possibly multiplied by scalar) to another
         # (again, numpy supports this out of the box). There exists a fixed set of such operations
         # leading to the correct pivot.
-        # workingCopy = self.table
-        # Generally speaking the self.table contains columns which contain rows
         row = int(row)
         col = int(col)
-        rows_n, cols_n = self.table.shape
-        print("Pivoting at row: ", row, " col: ", col, " pivot value: ", self.table[row][col])
-        print("Before pivot: \n", self.table)
-        if self.table[row][col] != 1:
-            scalar = self.table[row][col]
-            for colIndex in range(cols_n):
-                self.table[row][colIndex] = self.table[row][colIndex] / scalar
-            print("After scalar: \n", self.table)
-
-        for rowIndex in range(rows_n):
-            if rowIndex == row or self.table[rowIndex][col] == 0:
-                continue
-            scalar = self.table[rowIndex][col]
-            print("Subtracting from row: ", rowIndex, ", scalar: ", scalar)
-            for colIndex in range(cols_n):
-                self.table[rowIndex][colIndex] = self.table[rowIndex][colIndex] - self.table[row][colIndex] * scalar
-        print("After pivot: \n", self.table)
+        pivot_row = self.table[row]
+        pivot_row /= pivot_row[col]
+
+        # rank-1 update of the other rows, in place: a sparse pivot column updates only its nonzero rows,
+        # a dense one goes in blocks of rows through a small buffer instead of a full outer product
+        column = self.table[:, col].copy()
+        column[row] = 0.0
+        rows = np.flatnonzero(column)
+        if 4 * len(rows) < len(column):
+            self.table[rows] -= column[rows, np.newaxis] * pivot_row
+        else:
+            buffer = np.empty((min(PIVOT_BLOCK, len(column)), len(pivot_row)), dtype=self.table.dtype)
+            for start in range(0, len(column), PIVOT_BLOCK):
+                stop = min(start + PIVOT_BLOCK, len(column))
+                block = buffer[:stop - start]
+                np.multiply(column[start:stop, np.newaxis], pivot_row, out=block)
+                self.table[start:stop] -= block
+
+        # the pivot column is set exactly, so that basic columns stay unit vectors
+        self.table[:, col] = 0.0
+        self.table[row, col] = 1.0
 
     def extract_assignment(self) -> List[float]:
         rows_n, cols_n = self.table.shape
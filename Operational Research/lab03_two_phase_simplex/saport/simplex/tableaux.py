@@ -6,6 +6,8 @@ import numpy as np
 from . import model as ssmod
 
 eps = 0.000000001
+# number of rows updated at once by the dense pivot
+PIVOT_BLOCK = 64
 
 class Tableaux:
     """
@@ -21,7 +23,7 @@ class Tableaux:
         Methods
         -------
         __init__(model: Model, table: array) -> Tableaux:
-            constructs a new tableaux for the specified model and initial table
+            constructs a new tableaux for the specified model and initial table (copied once into a contiguous buffer)
         cost_factors() -> numpy.Array:
             returns a vector containing factors in the cost row
         cost() -> float:
@@ -35,7 +37,7 @@ class Tableaux:
         choose_leaving_variable(col: int) -> int:
             finds index of the variable, that should leave the basis next
         pivot(col: int, row: int):
-            updates tableaux using pivot operation with given entering and leaving variables
+            updates tableaux in place using pivot operation with given entering and leaving variables
         extract_assignment() -> List[float]:
             returns assignment corresponding to the tableaux
         extract_basis() -> List[int]
@@ -46,7 +48,7 @@ class Tableaux:
 
     def __init__(self, model: ssmod.Model, table: ArrayLike):
         self.model = model
-        self.table = table
+        self.table = np.array(table, dtype=np.float64, order='C')
 
     def cost_factors(self) -> ArrayLike:
         return self.table[0,:-1] 
@@ -73,24 +75,27 @@ class Tableaux:
         return index
 
     def pivot(self, row: int, col: int):
-        rows_n, cols_n = self.table.shape
-        pivot_factor = self.table[row, col]
-
-        new_table = self.table.copy()
-        new_table[row] = self.table[row] / pivot_factor
-
-        new_table[:, col] = 0.0
-        new_table[row, col] = 1.0
-        
-        for r in range(rows_n):
-            if r == row:
-                continue
-            for c in range(cols_n):
-                if c == col:
-                    continue 
-                new_table[r,c] = (-self.table[r, col]) * new_table[row, c] + self.table[r,c]
-
-        self.table = new_table
+        pivot_row = self.table[row]
+        pivot_row /= pivot_row[col]
+
+        # rank-1 update of the other rows, in place: a sparse pivot column updates only its nonzero rows,
+        # a dense one goes in blocks of rows through a small buffer instead of a full outer product
+        column = self.table[:, col].copy()
+        column[row] = 0.0
+        rows = np.flatnonzero(column)
+        if 4 * len(rows) < len(column):
+            self.table[rows] -= column[rows, np.newaxis] * pivot_row
+        else:
+            buffer = np.empty((min(PIVOT_BLOCK, len(column)), len(pivot_row)), dtype=self.table.dtype)
+            for start in range(0, len(column), PIVOT_BLOCK):
+                stop = min(start + PIVOT_BLOCK, len(column))
+                block = buffer[:stop - start]
+                np.multiply(column[start:stop, np.newaxis], pivot_row, out=block)
+                self.table[start:stop] -= block
+
+        # the pivot column is set exactly, so that basic columns stay unit vectors
+        self.table[:, col] = 0.0
+        self.table[row, col] = 1.0
 
     def extract_assignment(self) -> List[float]:
         rows_n, cols_n = self.table.shape